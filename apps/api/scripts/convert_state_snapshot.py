@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Convert an API state snapshot between JSON and binary formats.")
+    parser.add_argument("source", type=Path, help="existing state snapshot")
+    parser.add_argument("target", type=Path, help="converted snapshot to write")
+    parser.add_argument(
+        "--to",
+        choices=("binary", "json"),
+        default="binary",
+        help="target format (default: binary)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        from multyagents_api.state_binary import convert_binary_to_json, convert_json_to_binary, is_binary_snapshot
+    except ModuleNotFoundError as exc:
+        print(f"[state-convert] missing dependency: {exc.name}", file=sys.stderr)
+        return 2
+
+    if not args.source.exists():
+        print(f"[state-convert] source not found: {args.source}", file=sys.stderr)
+        return 2
+    source_is_binary = is_binary_snapshot(args.source)
+    if source_is_binary == (args.to == "binary"):
+        print(f"[state-convert] {args.source} is already {args.to}", file=sys.stderr)
+        return 2
+    try:
+        if args.to == "binary":
+            convert_json_to_binary(args.source, args.target)
+        else:
+            convert_binary_to_json(args.source, args.target)
+    except ValueError as exc:
+        print(f"[state-convert] {exc}", file=sys.stderr)
+        return 1
+    print(f"[state-convert] wrote {args.to} snapshot: {args.target}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from multyagents_api.schemas import (
+    TaskStatus,
+    WorkflowRunExecutionSummary,
+    WorkflowRunExecutionTaskSummary,
+    WorkflowRunStatus,
+    WorkflowRunTimelineEntry,
+)
+from multyagents_api.store import InMemoryStore
+
+
+def reference_execution_summary(store: InMemoryStore, run_id: int) -> WorkflowRunExecutionSummary:
+    run = store._workflow_runs[run_id]
+    status_counts: dict[str, int] = {}
+    successful_task_ids: list[int] = []
+    failed_task_ids: list[int] = []
+    active_task_ids: list[int] = []
+    pending_task_ids: list[int] = []
+    task_summaries: list[WorkflowRunExecutionTaskSummary] = []
+    failed = (TaskStatus.FAILED.value, TaskStatus.CANCELED.value, TaskStatus.SUBMIT_FAILED.value)
+    active = (
+        TaskStatus.DISPATCHED.value,
+        TaskStatus.QUEUED.value,
+        TaskStatus.RUNNING.value,
+        TaskStatus.CANCEL_REQUESTED.value,
+    )
+
+    for task_id in run.task_ids:
+        task = store._tasks.get(task_id)
+        if task is None:
+            continue
+        status_counts[task.status] = status_counts.get(task.status, 0) + 1
+        if task.status == TaskStatus.SUCCESS.value:
+            successful_task_ids.append(task_id)
+        elif task.status in failed:
+            failed_task_ids.append(task_id)
+        elif task.status in active:
+            active_task_ids.append(task_id)
+        else:
+            pending_task_ids.append(task_id)
+        audit = store._audits.get(task_id)
+        handoff = store._handoffs.get(task_id)
+        task_summaries.append(
+            WorkflowRunExecutionTaskSummary(
+                task_id=task.id,
+                title=task.title,
+                role_id=task.role_id,
+                status=task.status,
+                runner_message=task.runner_message,
+                started_at=task.started_at,
+                finished_at=task.finished_at,
+                exit_code=task.exit_code,
+                requires_approval=task.requires_approval,
+                approval_status=store._approval_status_for_task(task_id),
+                consumed_artifact_ids=list(audit.consumed_artifact_ids) if audit is not None else [],
+                produced_artifact_ids=list(audit.produced_artifact_ids) if audit is not None else [],
+                handoff_summary=handoff.summary if handoff is not None else None,
+                quality_gate_summary=store._evaluate_task_quality_gates(
+                    task,
+                    policy=store._task_quality_gate_policy(task),
+                ),
+            )
+        )
+
+    blocked_by_task_id: dict[int, list[str]] = {}
+    for item in store.plan_workflow_run_dispatch(run_id, max_tasks=max(len(run.task_ids), 1)).blocked:
+        if item.task_id is not None:
+            blocked_by_task_id.setdefault(item.task_id, []).append(item.reason)
+
+    steps = store._workflow_templates[run.workflow_template_id].steps if run.workflow_template_id is not None else []
+    step_by_task_id = {task_id: steps[index] for index, task_id in enumerate(run.task_ids) if index < len(steps)}
+    timeline: list[WorkflowRunTimelineEntry] = []
+    for task in task_summaries:
+        step = step_by_task_id.get(task.task_id)
+        step_id = step.step_id if step is not None else f"task-{task.task_id}"
+        depends_on = list(step.depends_on) if step is not None else []
+        if task.status == TaskStatus.SUCCESS.value:
+            stage_state = "done"
+        elif task.status in failed:
+            stage_state = "blocked"
+        elif task.status in active:
+            stage_state = "active"
+        else:
+            stage_state = "blocked" if blocked_by_task_id.get(task.task_id) else "active"
+        blocked_reasons = list(blocked_by_task_id.get(task.task_id, []))
+        if task.status == TaskStatus.SUBMIT_FAILED.value and "task-submit-failed" not in blocked_reasons:
+            blocked_reasons.append("task-submit-failed")
+        timeline.append(
+            WorkflowRunTimelineEntry(
+                task_id=task.task_id,
+                branch="+".join(depends_on) if depends_on else step_id,
+                owner_role_id=task.role_id,
+                stage_id=step_id,
+                stage=step.title if step is not None else task.title,
+                stage_state=stage_state,
+                progress_percent=100.0 if stage_state == "done" else 0.0,
+                blocked_reasons=blocked_reasons,
+            )
+        )
+
+    total_tasks = len(task_summaries)
+    progress_percent = (
+        round(((len(successful_task_ids) + len(failed_task_ids)) / total_tasks) * 100, 2) if total_tasks else 0.0
+    )
+    return WorkflowRunExecutionSummary(
+        run=store._build_workflow_run_read(run),
+        task_status_counts=status_counts,
+        terminal=run.status
+        in (WorkflowRunStatus.SUCCESS.value, WorkflowRunStatus.FAILED.value, WorkflowRunStatus.ABORTED.value),
+        partial_completion=bool(successful_task_ids) and len(successful_task_ids) < total_tasks,
+        progress_percent=progress_percent,
+        branch_status_cards={
+            "active": len(active_task_ids),
+            "blocked": len(failed_task_ids) + len(pending_task_ids),
+            "done": len(successful_task_ids),
+        },
+        next_dispatch=store.plan_workflow_run_dispatch(run_id, max_tasks=max(len(run.task_ids), 1)),
+        successful_task_ids=successful_task_ids,
+        failed_task_ids=failed_task_ids,
+        active_task_ids=active_task_ids,
+        pending_task_ids=pending_task_ids,
+        timeline=timeline,
+        tasks=task_summaries,
+    )
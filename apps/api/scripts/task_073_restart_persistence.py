@@ -29,6 +29,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output-json", type=Path, default=default_json, help="path to JSON evidence output")
     parser.add_argument("--output-md", type=Path, default=default_md, help="path to Markdown evidence output")
     parser.add_argument("--callback-replays", type=int, default=2, help="number of success callback replays")
+    parser.add_argument(
+        "--durability-modes",
+        default="sync,group,async",
+        help="comma-separated API_STATE_DURABILITY modes to cover with crash/restart scenarios",
+    )
+    parser.add_argument("--state-backend", default="journal", help="state backend used by durability scenarios")
+    parser.add_argument("--callback-storm-size", type=int, default=20, help="runner callbacks per storm")
+    parser.add_argument("--group-commit-ms", type=int, default=50, help="group commit flush interval in ms")
     return parser.parse_args()
 
 
@@ -53,7 +61,10 @@ def _render_markdown(report: dict[str, Any], json_path: Path) -> str:
         lines.append("")
         lines.append(f"- Objective: {scenario['objective']}")
         lines.append(f"- Status: `{scenario['status']}`")
-        lines.append(f"- Callback replays: `{scenario['callback_replays']}`")
+        if "callback_replays" in scenario:
+            lines.append(f"- Callback replays: `{scenario['callback_replays']}`")
+        if "durability" in scenario:
+            lines.append(f"- Durability: `{scenario['durability']}` (backend `{scenario['state_backend']}`)")
         lines.append("")
         lines.append("### Invariants")
         lines.append("")
@@ -98,7 +109,13 @@ def main() -> int:
         return 2
 
     report = run_restart_persistence_invariant_suite(
-        RestartPersistenceConfig(callback_replays=args.callback_replays)
+        RestartPersistenceConfig(
+            callback_replays=args.callback_replays,
+            durability_modes=tuple(mode.strip() for mode in args.durability_modes.split(",") if mode.strip()),
+            state_backend=args.state_backend,
+            callback_storm_size=args.callback_storm_size,
+            group_commit_interval_ms=args.group_commit_ms,
+        )
     )
     report["python"] = platform.python_version()
 
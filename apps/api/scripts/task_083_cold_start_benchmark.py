@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _default_evidence_paths() -> tuple[Path, Path]:
+    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    base_dir = _repo_root() / "docs" / "evidence" / "task-083"
+    return (
+        base_dir / f"task-083-cold-start-{timestamp}.json",
+        base_dir / f"task-083-cold-start-{timestamp}.md",
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    default_json, default_md = _default_evidence_paths()
+    parser = argparse.ArgumentParser(description="Run TASK-083 journal cold-start benchmark and write evidence.")
+    parser.add_argument("--output-json", type=Path, default=default_json, help="path to JSON evidence output")
+    parser.add_argument("--output-md", type=Path, default=default_md, help="path to Markdown evidence output")
+    parser.add_argument(
+        "--event-counts",
+        default="10000,100000,1000000",
+        help="comma-separated event counts to benchmark",
+    )
+    parser.add_argument("--tail-entries", type=int, default=1000, help="journal entries left after the checkpoint")
+    parser.add_argument(
+        "--journal-checkpoint-entries",
+        type=int,
+        default=10000,
+        help="journal entry threshold that triggers a checkpoint",
+    )
+    return parser.parse_args()
+
+
+def _render_markdown(report: dict[str, Any], json_path: Path) -> str:
+    lines: list[str] = []
+    summary = report["summary"]
+    lines.append("# TASK-083 Journal Cold-Start Benchmark Evidence")
+    lines.append("")
+    lines.append(f"- Generated at (UTC): `{report['generated_at_utc']}`")
+    lines.append(f"- Python: `{report['python']}`")
+    lines.append(f"- JSON evidence: `{json_path}`")
+    lines.append("")
+    lines.append("## Summary")
+    lines.append("")
+    lines.append(f"- Overall status: `{summary['overall_status']}`")
+    lines.append(f"- Scenarios: `{summary['scenario_count']}`")
+    lines.append(f"- Checks passed: `{summary['checks_passed']}/{summary['checks_total']}`")
+    lines.append("")
+    lines.append("| Events | Journal replay ms | Replayed entries | Checkpoint+tail ms | Replayed entries | Speedup |")
+    lines.append("| ---: | ---: | ---: | ---: | ---: | ---: |")
+    for scenario in report["scenarios"]:
+        replay = scenario["journal_replay"]
+        checkpoint = scenario["checkpoint_tail"]
+        lines.append(
+            f"| {scenario['event_count']} | {replay['cold_start_ms']} | {replay['replayed_entries']} | "
+            f"{checkpoint['cold_start_ms']} | {checkpoint['replayed_entries']} | {scenario['checkpoint_speedup']} |"
+        )
+    lines.append("")
+    for scenario in report["scenarios"]:
+        lines.append(f"## Scenario: {scenario['name']}")
+        lines.append("")
+        lines.append(f"- Status: `{scenario['status']}`")
+        for check in scenario["checks"]:
+            marker = "PASS" if check["passed"] else "FAIL"
+            lines.append(f"- `{marker}` {check['id']}: expected `{check['expected']}`, actual `{check['actual']}`")
+        lines.append("")
+
+    lines.append("## Config")
+    lines.append("")
+    for key, value in report["config"].items():
+        lines.append(f"- `{key}`: `{value}`")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        event_counts = tuple(int(value) for value in args.event_counts.split(",") if value.strip())
+    except ValueError:
+        print("[task-083] event-counts must be comma-separated integers", file=sys.stderr)
+        return 2
+
+    try:
+        from multyagents_api.cold_start_benchmark import (
+            ColdStartBenchmarkConfig,
+            run_cold_start_benchmark,
+        )
+    except ModuleNotFoundError as exc:
+        print(f"[task-083] missing dependency: {exc.name}", file=sys.stderr)
+        print("[task-083] install API dependencies before running the benchmark:", file=sys.stderr)
+        print("  cd apps/api && python3 -m venv .venv && .venv/bin/pip install -e .[dev]", file=sys.stderr)
+        return 2
+
+    try:
+        report = run_cold_start_benchmark(
+            ColdStartBenchmarkConfig(
+                event_counts=event_counts,
+                tail_entries=args.tail_entries,
+                journal_checkpoint_entries=args.journal_checkpoint_entries,
+            )
+        )
+    except ValueError as exc:
+        print(f"[task-083] {exc}", file=sys.stderr)
+        return 2
+    report["python"] = platform.python_version()
+
+    args.output_json.parent.mkdir(parents=True, exist_ok=True)
+    args.output_md.parent.mkdir(parents=True, exist_ok=True)
+
+    args.output_json.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    args.output_md.write_text(_render_markdown(report, args.output_json) + "\n", encoding="utf-8")
+
+    print(f"[task-083] evidence json: {args.output_json}")
+    print(f"[task-083] evidence md:   {args.output_md}")
+    print(f"[task-083] summary:       {report['summary']}")
+    return 0 if report["summary"]["overall_status"] == "pass" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _default_evidence_paths() -> tuple[Path, Path]:
+    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    base_dir = _repo_root() / "docs" / "evidence" / "task-084"
+    return (
+        base_dir / f"task-084-trusted-load-{timestamp}.json",
+        base_dir / f"task-084-trusted-load-{timestamp}.md",
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    default_json, default_md = _default_evidence_paths()
+    parser = argparse.ArgumentParser(description="Run TASK-084 trusted state load benchmark and write evidence.")
+    parser.add_argument("--output-json", type=Path, default=default_json, help="path to JSON evidence output")
+    parser.add_argument("--output-md", type=Path, default=default_md, help="path to Markdown evidence output")
+    parser.add_argument(
+        "--event-counts",
+        default="10000,100000,1000000",
+        help="comma-separated event counts to benchmark",
+    )
+    parser.add_argument(
+        "--artifacts-per-event",
+        type=float,
+        default=0.1,
+        help="artifacts written per synthetic event",
+    )
+    return parser.parse_args()
+
+
+def _render_markdown(report: dict[str, Any], json_path: Path) -> str:
+    lines: list[str] = []
+    summary = report["summary"]
+    lines.append("# TASK-084 Trusted State Load Benchmark Evidence")
+    lines.append("")
+    lines.append(f"- Generated at (UTC): `{report['generated_at_utc']}`")
+    lines.append(f"- Python: `{report['python']}`")
+    lines.append(f"- JSON evidence: `{json_path}`")
+    lines.append("")
+    lines.append("## Summary")
+    lines.append("")
+    lines.append(f"- Overall status: `{summary['overall_status']}`")
+    lines.append(f"- Scenarios: `{summary['scenario_count']}`")
+    lines.append(f"- Checks passed: `{summary['checks_passed']}/{summary['checks_total']}`")
+    lines.append("")
+    lines.append("| Events | Artifacts | Validated load ms | Trusted load ms | Checksum fallback ms | Speedup |")
+    lines.append("| ---: | ---: | ---: | ---: | ---: | ---: |")
+    for scenario in report["scenarios"]:
+        lines.append(
+            f"| {scenario['event_count']} | {scenario['artifact_count']} | {scenario['validated_load']['load_ms']} | "
+            f"{scenario['trusted_load']['load_ms']} | {scenario['checksum_fallback']['load_ms']} | "
+            f"{scenario['trusted_speedup']} |"
+        )
+    lines.append("")
+    for scenario in report["scenarios"]:
+        lines.append(f"## Scenario: {scenario['name']}")
+        lines.append("")
+        lines.append(f"- Status: `{scenario['status']}`")
+        for check in scenario["checks"]:
+            marker = "PASS" if check["passed"] else "FAIL"
+            lines.append(f"- `{marker}` {check['id']}: expected `{check['expected']}`, actual `{check['actual']}`")
+        lines.append("")
+
+    lines.append("## Config")
+    lines.append("")
+    for key, value in report["config"].items():
+        lines.append(f"- `{key}`: `{value}`")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        event_counts = tuple(int(value) for value in args.event_counts.split(",") if value.strip())
+    except ValueError:
+        print("[task-084] event-counts must be comma-separated integers", file=sys.stderr)
+        return 2
+
+    try:
+        from multyagents_api.trusted_load_benchmark import (
+            TrustedLoadBenchmarkConfig,
+            run_trusted_load_benchmark,
+        )
+    except ModuleNotFoundError as exc:
+        print(f"[task-084] missing dependency: {exc.name}", file=sys.stderr)
+        print("[task-084] install API dependencies before running the benchmark:", file=sys.stderr)
+        print("  cd apps/api && python3 -m venv .venv && .venv/bin/pip install -e .[dev]", file=sys.stderr)
+        return 2
+
+    try:
+        report = run_trusted_load_benchmark(
+            TrustedLoadBenchmarkConfig(
+                event_counts=event_counts,
+                artifacts_per_event=args.artifacts_per_event,
+            )
+        )
+    except ValueError as exc:
+        print(f"[task-084] {exc}", file=sys.stderr)
+        return 2
+    report["python"] = platform.python_version()
+
+    args.output_json.parent.mkdir(parents=True, exist_ok=True)
+    args.output_md.parent.mkdir(parents=True, exist_ok=True)
+
+    args.output_json.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    args.output_md.write_text(_render_markdown(report, args.output_json) + "\n", encoding="utf-8")
+
+    print(f"[task-084] evidence json: {args.output_json}")
+    print(f"[task-084] evidence md:   {args.output_md}")
+    print(f"[task-084] summary:       {report['summary']}")
+    return 0 if report["summary"]["overall_status"] == "pass" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
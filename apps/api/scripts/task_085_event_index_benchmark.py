@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _default_evidence_paths() -> tuple[Path, Path]:
+    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    base_dir = _repo_root() / "docs" / "evidence" / "task-085"
+    return (
+        base_dir / f"task-085-event-index-{timestamp}.json",
+        base_dir / f"task-085-event-index-{timestamp}.md",
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    default_json, default_md = _default_evidence_paths()
+    parser = argparse.ArgumentParser(description="Run TASK-085 event index query latency benchmark and write evidence.")
+    parser.add_argument("--output-json", type=Path, default=default_json, help="path to JSON evidence output")
+    parser.add_argument("--output-md", type=Path, default=default_md, help="path to Markdown evidence output")
+    parser.add_argument(
+        "--event-counts",
+        default="1000,10000,100000,1000000",
+        help="comma-separated event counts to benchmark",
+    )
+    parser.add_argument("--page-size", type=int, default=50, help="events requested per query")
+    parser.add_argument(
+        "--max-latency-ratio",
+        type=float,
+        default=5.0,
+        help="allowed median latency growth from the smallest to the largest event count",
+    )
+    return parser.parse_args()
+
+
+def _render_markdown(report: dict[str, Any], json_path: Path) -> str:
+    lines: list[str] = []
+    summary = report["summary"]
+    lines.append("# TASK-085 Event Index Query Benchmark Evidence")
+    lines.append("")
+    lines.append(f"- Generated at (UTC): `{report['generated_at_utc']}`")
+    lines.append(f"- Python: `{report['python']}`")
+    lines.append(f"- JSON evidence: `{json_path}`")
+    lines.append("")
+    lines.append("## Summary")
+    lines.append("")
+    lines.append(f"- Overall status: `{summary['overall_status']}`")
+    lines.append(f"- Scenarios: `{summary['scenario_count']}`")
+    lines.append(f"- Checks passed: `{summary['checks_passed']}/{summary['checks_total']}`")
+    lines.append("")
+    query_names = list(report["scenarios"][0]["latency_us"]) if report["scenarios"] else []
+    lines.append("| Events | " + " | ".join(f"{name} us" for name in query_names) + " | Full scan us |")
+    lines.append("| ---: | " + " | ".join("---:" for _ in query_names) + " | ---: |")
+    for scenario in report["scenarios"]:
+        latencies = " | ".join(str(scenario["latency_us"][name]) for name in query_names)
+        lines.append(f"| {scenario['event_count']} | {latencies} | {scenario['full_scan_run_timeline_us']} |")
+    lines.append("")
+    lines.append("## Latency growth")
+    lines.append("")
+    for check in report["latency_checks"]:
+        marker = "PASS" if check["passed"] else "FAIL"
+        lines.append(f"- `{marker}` {check['id']}: expected `{check['expected']}`, actual `{check['actual']}x`")
+    lines.append("")
+    for scenario in report["scenarios"]:
+        lines.append(f"## Scenario: {scenario['name']}")
+        lines.append("")
+        lines.append(f"- Status: `{scenario['status']}`")
+        for check in scenario["checks"]:
+            marker = "PASS" if check["passed"] else "FAIL"
+            lines.append(f"- `{marker}` {check['id']}: expected `{check['expected']}`, actual `{check['actual']}`")
+        lines.append("")
+
+    lines.append("## Config")
+    lines.append("")
+    for key, value in report["config"].items():
+        lines.append(f"- `{key}`: `{value}`")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        event_counts = tuple(int(value) for value in args.event_counts.split(",") if value.strip())
+    except ValueError:
+        print("[task-085] event-counts must be comma-separated integers", file=sys.stderr)
+        return 2
+
+    try:
+        from multyagents_api.event_index_benchmark import (
+            EventIndexBenchmarkConfig,
+            run_event_index_benchmark,
+        )
+    except ModuleNotFoundError as exc:
+        print(f"[task-085] missing dependency: {exc.name}", file=sys.stderr)
+        print("[task-085] install API dependencies before running the benchmark:", file=sys.stderr)
+        print("  cd apps/api && python3 -m venv .venv && .venv/bin/pip install -e .[dev]", file=sys.stderr)
+        return 2
+
+    try:
+        report = run_event_index_benchmark(
+            EventIndexBenchmarkConfig(
+                event_counts=event_counts,
+                page_size=args.page_size,
+                max_latency_ratio=args.max_latency_ratio,
+            )
+        )
+    except ValueError as exc:
+        print(f"[task-085] {exc}", file=sys.stderr)
+        return 2
+    report["python"] = platform.python_version()
+
+    args.output_json.parent.mkdir(parents=True, exist_ok=True)
+    args.output_md.parent.mkdir(parents=True, exist_ok=True)
+
+    args.output_json.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    args.output_md.write_text(_render_markdown(report, args.output_json) + "\n", encoding="utf-8")
+
+    print(f"[task-085] evidence json: {args.output_json}")
+    print(f"[task-085] evidence md:   {args.output_md}")
+    print(f"[task-085] summary:       {report['summary']}")
+    return 0 if report["summary"]["overall_status"] == "pass" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[3]
+
+
+def _default_evidence_paths() -> tuple[Path, Path]:
+    timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    base_dir = _repo_root() / "docs" / "evidence" / "task-086"
+    return (
+        base_dir / f"task-086-execution-summary-{timestamp}.json",
+        base_dir / f"task-086-execution-summary-{timestamp}.md",
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    default_json, default_md = _default_evidence_paths()
+    parser = argparse.ArgumentParser(description="Run TASK-086 run execution summary benchmark and write evidence.")
+    parser.add_argument("--output-json", type=Path, default=default_json, help="path to JSON evidence output")
+    parser.add_argument("--output-md", type=Path, default=default_md, help="path to Markdown evidence output")
+    parser.add_argument("--task-counts", default="500", help="comma-separated tasks-per-run counts to benchmark")
+    parser.add_argument("--branch-count", type=int, default=25, help="independent dependency chains per run")
+    parser.add_argument("--completed-rounds", type=int, default=8, help="dependency layers completed before measuring")
+    parser.add_argument("--samples", type=int, default=20, help="summary requests per measurement")
+    parser.add_argument("--min-cold-speedup", type=float, default=1.15, help="required speedup with empty read caches")
+    parser.add_argument("--min-warm-speedup", type=float, default=2.5, help="required speedup with warm read caches")
+    return parser.parse_args()
+
+
+def _render_markdown(report: dict[str, Any], json_path: Path) -> str:
+    lines: list[str] = []
+    summary = report["summary"]
+    lines.append("# TASK-086 Run Execution Summary Benchmark Evidence")
+    lines.append("")
+    lines.append(f"- Generated at (UTC): `{report['generated_at_utc']}`")
+    lines.append(f"- Python: `{report['python']}`")
+    lines.append(f"- JSON evidence: `{json_path}`")
+    lines.append("")
+    lines.append("## Summary")
+    lines.append("")
+    lines.append(f"- Overall status: `{summary['overall_status']}`")
+    lines.append(f"- Scenarios: `{summary['scenario_count']}`")
+    lines.append(f"- Checks passed: `{summary['checks_passed']}/{summary['checks_total']}`")
+    lines.append("")
+    lines.append("| Tasks | Reference us | Single pass cold us | Single pass warm us | Cold speedup | Warm speedup |")
+    lines.append("| ---: | ---: | ---: | ---: | ---: | ---: |")
+    for scenario in report["scenarios"]:
+        latency = scenario["latency_us"]
+        lines.append(
+            f"| {scenario['task_count']} | {latency['reference']} | {latency['single_pass_cold']} | "
+            f"{latency['single_pass_warm']} | {scenario['speedup']['cold']}x | {scenario['speedup']['warm']}x |"
+        )
+    lines.append("")
+    for scenario in report["scenarios"]:
+        lines.append(f"## Scenario: {scenario['name']}")
+        lines.append("")
+        lines.append(f"- Status: `{scenario['status']}`")
+        lines.append(f"- Task status counts: `{scenario['task_status_counts']}`")
+        for check in scenario["checks"]:
+            marker = "PASS" if check["passed"] else "FAIL"
+            lines.append(f"- `{marker}` {check['id']}: expected `{check['expected']}`, actual `{check['actual']}`")
+        lines.append("")
+
+    lines.append("## Config")
+    lines.append("")
+    for key, value in report["config"].items():
+        lines.append(f"- `{key}`: `{value}`")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        task_counts = tuple(int(value) for value in args.task_counts.split(",") if value.strip())
+    except ValueError:
+        print("[task-086] task-counts must be comma-separated integers", file=sys.stderr)
+        return 2
+
+    try:
+        from multyagents_api.execution_summary_benchmark import (
+            ExecutionSummaryBenchmarkConfig,
+            run_execution_summary_benchmark,
+        )
+        from execution_summary_reference import reference_execution_summary
+    except ModuleNotFoundError as exc:
+        print(f"[task-086] missing dependency: {exc.name}", file=sys.stderr)
+        print("[task-086] install API dependencies before running the benchmark:", file=sys.stderr)
+        print("  cd apps/api && python3 -m venv .venv && .venv/bin/pip install -e .[dev]", file=sys.stderr)
+        return 2
+
+    try:
+        report = run_execution_summary_benchmark(
+            reference_execution_summary,
+            ExecutionSummaryBenchmarkConfig(
+                task_counts=task_counts,
+                branch_count=args.branch_count,
+                completed_rounds=args.completed_rounds,
+                samples=args.samples,
+                min_cold_speedup=args.min_cold_speedup,
+                min_warm_speedup=args.min_warm_speedup,
+            )
+        )
+    except ValueError as exc:
+        print(f"[task-086] {exc}", file=sys.stderr)
+        return 2
+    report["python"] = platform.python_version()
+
+    args.output_json.parent.mkdir(parents=True, exist_ok=True)
+    args.output_md.parent.mkdir(parents=True, exist_ok=True)
+
+    args.output_json.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    args.output_md.write_text(_render_markdown(report, args.output_json) + "\n", encoding="utf-8")
+
+    print(f"[task-086] evidence json: {args.output_json}")
+    print(f"[task-086] evidence md:   {args.output_md}")
+    print(f"[task-086] summary:       {report['summary']}")
+    return 0 if report["summary"]["overall_status"] == "pass" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
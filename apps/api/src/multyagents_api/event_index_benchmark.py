@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from multyagents_api.schemas import EventRead, RoleCreate, TaskCreate, WorkflowRunCreate
+from multyagents_api.store import InMemoryStore
+
+_EVENT_TYPES = ("agent.note", "task.progress", "task.heartbeat", "task.log")
+
+
+@dataclass(frozen=True)
+class EventIndexBenchmarkConfig:
+    event_counts: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000)
+    run_count: int = 4
+    page_size: int = 50
+    samples: int = 200
+    scan_samples: int = 3
+    max_latency_ratio: float = 5.0
+
+
+def run_event_index_benchmark(config: EventIndexBenchmarkConfig | None = None) -> dict[str, Any]:
+    cfg = config or EventIndexBenchmarkConfig()
+    _validate_config(cfg)
+
+    store = InMemoryStore()
+    role = store.create_role(RoleCreate(name="task-085-event-index-role"))
+    targets: list[tuple[int, int]] = []
+    for index in range(cfg.run_count):
+        task = store.create_task(
+            TaskCreate(role_id=role.id, title=f"task-085 event index {index}", execution_mode="no-workspace")
+        )
+        run = store.create_workflow_run(WorkflowRunCreate(task_ids=[task.id], initiated_by="task-085-event-index"))
+        targets.append((run.id, task.id))
+
+    scenarios: list[dict[str, Any]] = []
+    for event_count in sorted(cfg.event_counts):
+        _grow_events(store, targets, event_count)
+        scenarios.append(_measure_queries(store, targets, event_count, cfg))
+    store.close()
+
+    latency_checks = _latency_checks(scenarios, cfg)
+    checks = [check for scenario in scenarios for check in scenario["checks"]] + latency_checks
+    checks_passed = sum(1 for check in checks if check["passed"])
+    return {
+        "task": "TASK-085",
+        "generated_at_utc": datetime.now(tz=timezone.utc).isoformat(),
+        "config": {
+            "event_counts": sorted(cfg.event_counts),
+            "run_count": cfg.run_count,
+            "page_size": cfg.page_size,
+            "samples": cfg.samples,
+            "scan_samples": cfg.scan_samples,
+            "max_latency_ratio": cfg.max_latency_ratio,
+        },
+        "summary": {
+            "scenario_count": len(scenarios),
+            "checks_total": len(checks),
+            "checks_passed": checks_passed,
+            "overall_status": "pass" if checks_passed == len(checks) else "fail",
+        },
+        "scenarios": scenarios,
+        "latency_checks": latency_checks,
+    }
+
+
+def _validate_config(cfg: EventIndexBenchmarkConfig) -> None:
+    if not cfg.event_counts or any(count < 1 for count in cfg.event_counts):
+        raise ValueError("event_counts must contain positive values")
+    if cfg.run_count < 1:
+        raise ValueError("run_count must be >= 1")
+    if cfg.page_size < 1:
+        raise ValueError("page_size must be >= 1")
+    if cfg.samples < 1 or cfg.scan_samples < 1:
+        raise ValueError("samples and scan_samples must be >= 1")
+    if min(cfg.event_counts) < cfg.run_count * len(_EVENT_TYPES) * cfg.page_size:
+        raise ValueError("event_counts must fill at least one page per run and event type")
+    if cfg.max_latency_ratio <= 1:
+        raise ValueError("max_latency_ratio must be > 1")
+
+
+def _grow_events(store: InMemoryStore, targets: list[tuple[int, int]], event_count: int) -> None:
+    for index in range(len(store._events), event_count):
+        run_id, task_id = targets[index % len(targets)]
+        store._append_event(
+            event_type=_EVENT_TYPES[(index // len(targets)) % len(_EVENT_TYPES)],
+            run_id=run_id,
+            task_id=task_id,
+            payload={"index": index},
+        )
+
+
+def _measure_queries(
+    store: InMemoryStore,
+    targets: list[tuple[int, int]],
+    event_count: int,
+    cfg: EventIndexBenchmarkConfig,
+) -> dict[str, Any]:
+    run_id, task_id = targets[len(targets) // 2]
+    middle_id = store._events[len(store._events) // 2].id
+    queries: dict[str, Callable[[], list[EventRead]]] = {
+        "global-tail": lambda: store.list_events(limit=cfg.page_size),
+        "run-timeline": lambda: store.list_events(run_id=run_id, limit=cfg.page_size),
+        "task-timeline": lambda: store.list_events(task_id=task_id, limit=cfg.page_size),
+        "run-event-type": lambda: store.list_events(run_id=run_id, event_type="task.heartbeat", limit=cfg.page_size),
+        "after-cursor": lambda: store.list_events(run_id=run_id, after_id=middle_id, limit=cfg.page_size),
+        "before-cursor": lambda: store.list_events(run_id=run_id, before_id=middle_id, limit=cfg.page_size),
+    }
+    latencies = {name: _median_us(query, cfg.samples) for name, query in queries.items()}
+    pages = {name: query() for name, query in queries.items()}
+    scan_us = _median_us(
+        lambda: [event for event in store._events if event.run_id == run_id][-cfg.page_size :],
+        cfg.scan_samples,
+    )
+    checks = [
+        {
+            "id": f"{name}-returns-full-page",
+            "expected": cfg.page_size,
+            "actual": len(page),
+            "passed": len(page) == cfg.page_size,
+        }
+        for name, page in pages.items()
+    ]
+    checks.append(
+        {
+            "id": "cursor-pages-respect-bounds",
+            "expected": middle_id,
+            "actual": [pages["before-cursor"][-1].id, pages["after-cursor"][0].id],
+            "passed": pages["before-cursor"][-1].id < middle_id < pages["after-cursor"][0].id,
+        }
+    )
+    return {
+        "name": f"event-index-{event_count}-events",
+        "event_count": event_count,
+        "status": "pass" if all(check["passed"] for check in checks) else "fail",
+        "latency_us": latencies,
+        "full_scan_run_timeline_us": scan_us,
+        "checks": checks,
+    }
+
+
+def _latency_checks(scenarios: list[dict[str, Any]], cfg: EventIndexBenchmarkConfig) -> list[dict[str, Any]]:
+    smallest, largest = scenarios[0], scenarios[-1]
+    checks: list[dict[str, Any]] = []
+    for name, baseline in smallest["latency_us"].items():
+        ratio = round(largest["latency_us"][name] / baseline, 3) if baseline else 0.0
+        checks.append(
+            {
+                "id": f"latency-flat-{name}",
+                "expected": f"<= {cfg.max_latency_ratio}x from {smallest['event_count']} to {largest['event_count']} events",
+                "actual": ratio,
+                "passed": ratio <= cfg.max_latency_ratio,
+            }
+        )
+    return checks
+
+
+def _median_us(query: Callable[[], Any], samples: int) -> float:
+    durations: list[float] = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        query()
+        durations.append((time.perf_counter() - started) * 1_000_000)
+    return round(statistics.median(durations), 3)
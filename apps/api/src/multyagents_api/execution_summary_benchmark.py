@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import statistics
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from multyagents_api.schemas import (
+    ArtifactCreate,
+    RoleCreate,
+    RunnerLifecycleStatus,
+    TaskHandoffPayload,
+    WorkflowRunCreate,
+    WorkflowRunExecutionSummary,
+    WorkflowStep,
+    WorkflowTemplateCreate,
+)
+from multyagents_api.store import InMemoryStore
+
+
+@dataclass(frozen=True)
+class ExecutionSummaryBenchmarkConfig:
+    task_counts: tuple[int, ...] = (500,)
+    branch_count: int = 25
+    completed_rounds: int = 8
+    samples: int = 20
+    min_cold_speedup: float = 1.15
+    min_warm_speedup: float = 2.5
+
+
+ReferenceSummary = Callable[[InMemoryStore, int], WorkflowRunExecutionSummary]
+
+
+def run_execution_summary_benchmark(
+    reference: ReferenceSummary,
+    config: ExecutionSummaryBenchmarkConfig | None = None,
+) -> dict[str, Any]:
+    cfg = config or ExecutionSummaryBenchmarkConfig()
+    _validate_config(cfg)
+
+    scenarios = [_run_task_count_scenario(task_count, cfg, reference) for task_count in cfg.task_counts]
+    checks_total = sum(len(scenario["checks"]) for scenario in scenarios)
+    checks_passed = sum(1 for scenario in scenarios for check in scenario["checks"] if check["passed"])
+    return {
+        "task": "TASK-086",
+        "generated_at_utc": datetime.now(tz=timezone.utc).isoformat(),
+        "config": {
+            "task_counts": list(cfg.task_counts),
+            "branch_count": cfg.branch_count,
+            "completed_rounds": cfg.completed_rounds,
+            "samples": cfg.samples,
+            "min_cold_speedup": cfg.min_cold_speedup,
+            "min_warm_speedup": cfg.min_warm_speedup,
+        },
+        "summary": {
+            "scenario_count": len(scenarios),
+            "checks_total": checks_total,
+            "checks_passed": checks_passed,
+            "overall_status": "pass" if checks_total == checks_passed else "fail",
+        },
+        "scenarios": scenarios,
+    }
+
+
+def _validate_config(cfg: ExecutionSummaryBenchmarkConfig) -> None:
+    if not cfg.task_counts or any(count < 1 for count in cfg.task_counts):
+        raise ValueError("task_counts must contain positive values")
+    if cfg.branch_count < 1 or any(count % cfg.branch_count for count in cfg.task_counts):
+        raise ValueError("task_counts must be positive multiples of branch_count")
+    if cfg.completed_rounds < 0 or any(cfg.completed_rounds >= count // cfg.branch_count for count in cfg.task_counts):
+        raise ValueError("completed_rounds must leave at least one pending step per branch")
+    if cfg.samples < 1:
+        raise ValueError("samples must be >= 1")
+    if cfg.min_cold_speedup <= 0 or cfg.min_warm_speedup <= 0:
+        raise ValueError("speedup thresholds must be > 0")
+
+
+def _run_task_count_scenario(
+    task_count: int,
+    cfg: ExecutionSummaryBenchmarkConfig,
+    reference_summary: ReferenceSummary,
+) -> dict[str, Any]:
+    store, run_id = _build_run(task_count, cfg)
+
+    def cold() -> WorkflowRunExecutionSummary:
+        store._read_models.touch_all()
+        return store.get_workflow_run_execution_summary(run_id)
+
+    def reference() -> WorkflowRunExecutionSummary:
+        store._read_models.touch_all()
+        return reference_summary(store, run_id)
+
+    reference_us = _median_us(reference, cfg.samples)
+    cold_us = _median_us(cold, cfg.samples)
+    warm_us = _median_us(lambda: store.get_workflow_run_execution_summary(run_id), cfg.samples)
+    summary = store.get_workflow_run_execution_summary(run_id)
+    expected = reference_summary(store, run_id)
+    store.close()
+
+    cold_speedup = round(reference_us / cold_us, 3) if cold_us else 0.0
+    warm_speedup = round(reference_us / warm_us, 3) if warm_us else 0.0
+    checks = [
+        {
+            "id": "summary-covers-all-tasks",
+            "expected": task_count,
+            "actual": len(summary.tasks),
+            "passed": len(summary.tasks) == task_count,
+        },
+        {
+            "id": "summary-matches-reference",
+            "expected": "identical summary payload",
+            "actual": "identical" if summary.model_dump() == expected.model_dump() else "different",
+            "passed": summary.model_dump() == expected.model_dump(),
+        },
+        {
+            "id": "next-dispatch-has-ready-tasks",
+            "expected": f">= 1 and <= {cfg.branch_count}",
+            "actual": len(summary.next_dispatch.ready),
+            "passed": 1 <= len(summary.next_dispatch.ready) <= cfg.branch_count,
+        },
+        {
+            "id": "cold-summary-speedup",
+            "expected": f">= {cfg.min_cold_speedup}x",
+            "actual": cold_speedup,
+            "passed": cold_speedup >= cfg.min_cold_speedup,
+        },
+        {
+            "id": "warm-summary-speedup",
+            "expected": f">= {cfg.min_warm_speedup}x",
+            "actual": warm_speedup,
+            "passed": warm_speedup >= cfg.min_warm_speedup,
+        },
+    ]
+    return {
+        "name": f"execution-summary-{task_count}-tasks",
+        "task_count": task_count,
+        "status": "pass" if all(check["passed"] for check in checks) else "fail",
+        "latency_us": {"reference": reference_us, "single_pass_cold": cold_us, "single_pass_warm": warm_us},
+        "speedup": {"cold": cold_speedup, "warm": warm_speedup},
+        "task_status_counts": summary.task_status_counts,
+        "checks": checks,
+    }
+
+
+def _build_run(task_count: int, cfg: ExecutionSummaryBenchmarkConfig) -> tuple[InMemoryStore, int]:
+    store = InMemoryStore()
+    role = store.create_role(RoleCreate(name="task-086-execution-summary-role"))
+    depth = task_count // cfg.branch_count
+    steps: list[WorkflowStep] = []
+    for branch in range(cfg.branch_count):
+        for level in range(depth):
+            previous = f"b{branch}-s{level - 1}" if level else None
+            steps.append(
+                WorkflowStep(
+                    step_id=f"b{branch}-s{level}",
+                    role_id=role.id,
+                    title=f"branch {branch} step {level}",
+                    depends_on=[previous] if previous is not None else [],
+                    required_artifacts=(
+                        [{"from_step_id": previous, "artifact_type": "text"}] if previous is not None else []
+                    ),
+                )
+            )
+    template = store.create_workflow_template(WorkflowTemplateCreate(name="task-086-execution-summary", steps=steps))
+    run = store.create_workflow_run(
+        WorkflowRunCreate(workflow_template_id=template.id, initiated_by="task-086-execution-summary")
+    )
+
+    for _round in range(cfg.completed_rounds):
+        for item in store.plan_workflow_run_dispatch(run.id, max_tasks=task_count).ready:
+            store.dispatch_task(item.task_id, consumed_artifact_ids=item.consumed_artifact_ids)
+            artifact = store.create_artifact(
+                ArtifactCreate(
+                    artifact_type="text",
+                    location=f"/tmp/task-086/summary/{item.task_id}.md",
+                    summary=f"output of task {item.task_id}",
+                    producer_task_id=item.task_id,
+                    run_id=run.id,
+                )
+            )
+            store.update_task_runner_status(
+                item.task_id,
+                status=RunnerLifecycleStatus.SUCCESS,
+                handoff=TaskHandoffPayload(
+                    summary=f"handoff of task {item.task_id}",
+                    artifacts=[{"artifact_id": artifact.id, "is_required": True}],
+                ),
+            )
+    for index, item in enumerate(store.plan_workflow_run_dispatch(run.id, max_tasks=task_count).ready):
+        if index % 2 == 0:
+            store.dispatch_task(item.task_id, consumed_artifact_ids=item.consumed_artifact_ids)
+    return store, run.id
+
+
+def _median_us(query: Callable[[], Any], samples: int) -> float:
+    durations: list[float] = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        query()
+        durations.append((time.perf_counter() - started) * 1_000_000)
+    return round(statistics.median(durations), 3)
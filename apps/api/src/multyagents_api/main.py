@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import FastAPI, Header, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from multyagents_api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from multyagents_api.runner_client import cancel_in_runner, submit_to_runner
 from multyagents_api.schemas import (
     AssistantIntentPlanRequest,
@@ -15,8 +19,11 @@ from multyagents_api.schemas import (
     AssistantIntentStartResponse,
     AssistantIntentStatusRequest,
     AssistantIntentStatusResponse,
+    ApprovalBulkDecisionRequest,
+    ApprovalBulkDecisionResponse,
     ApprovalDecisionRequest,
     ApprovalRead,
+    ApprovalStatus,
     ArtifactCreate,
     ArtifactRead,
     ArtifactType,
@@ -27,6 +34,7 @@ from multyagents_api.schemas import (
     ProjectCreate,
     ProjectRead,
     ProjectUpdate,
+    ReadView,
     SkillPackCreate,
     SkillPackRead,
     SkillPackUpdate,
@@ -37,8 +45,12 @@ from multyagents_api.schemas import (
     TaskAudit,
     TaskCreate,
     TaskHandoffRead,
+    TaskCompactRead,
     TaskLocksReleaseResponse,
     TaskRead,
+    TaskStatus,
+    TaskViewRead,
+    WorkflowRunCompactRead,
     WorkflowRunControlLoopRequest,
     WorkflowRunControlLoopResponse,
     WorkflowRunCreate,
@@ -49,16 +61,16 @@ from multyagents_api.schemas import (
     WorkflowRunPartialRerunResponse,
     WorkflowRunRead,
     WorkflowRunSpawnResult,
+    WorkflowRunStatus,
+    WorkflowRunViewRead,
     WorkflowTemplateCreate,
     WorkflowTemplateRecommendationRequest,
     WorkflowTemplateRecommendationResponse,
     WorkflowTemplateRead,
     WorkflowTemplateUpdate,
 )
-from multyagents_api.store import ConflictError, InMemoryStore, NotFoundError, ValidationError
+from multyagents_api.store import ConflictError, NotFoundError, ValidationError, create_store
 
-app = FastAPI(title="multyagents api", version="0.1.0")
-store = InMemoryStore(state_file=os.getenv("API_STATE_FILE"))
 CONTRACT_VERSION = "v1"
 CONTRACT_SCHEMA_FILE = "packages/contracts/v1/context7.schema.json"
 
@@ -76,6 +88,42 @@ def _parse_csv_env(name: str, default: str = "") -> list[str]:
     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def _optional_float_env(name: str) -> float | None:
+    value = _env_or_default(name, "")
+    return float(value) if value else None
+
+
+def _optional_int_env(name: str) -> int | None:
+    value = _env_or_default(name, "")
+    return int(value) if value else None
+
+
+store = create_store(
+    state_file=os.getenv("API_STATE_FILE"),
+    state_backend=_env_or_default("API_STATE_BACKEND", "snapshot"),
+    durability=_env_or_default("API_STATE_DURABILITY", "sync"),
+    group_commit_interval_ms=int(_env_or_default("API_STATE_GROUP_COMMIT_MS", "5")),
+    group_commit_max_batch=int(_env_or_default("API_STATE_GROUP_COMMIT_MAX_BATCH", "256")),
+    journal_checkpoint_entries=int(_env_or_default("API_STATE_JOURNAL_CHECKPOINT_ENTRIES", "10000")),
+    journal_checkpoint_bytes=int(_env_or_default("API_STATE_JOURNAL_CHECKPOINT_BYTES", str(64 * 1024 * 1024))),
+    retention_max_age_s=_optional_float_env("API_STATE_RETENTION_MAX_AGE_S"),
+    retention_hot_runs=_optional_int_env("API_STATE_RETENTION_HOT_RUNS"),
+    retention_check_interval_s=float(_env_or_default("API_STATE_RETENTION_CHECK_INTERVAL_S", "60")),
+    trusted_load=_env_or_default("API_STATE_TRUSTED_LOAD", "1") not in ("0", "false", "no"),
+    state_format=_env_or_default("API_STATE_FORMAT", "json"),
+    lazy_history=_env_or_default("API_STATE_LAZY_HISTORY", "0") in ("1", "true", "yes"),
+    history_cache_size=int(_env_or_default("API_STATE_HISTORY_CACHE_SIZE", "1024")),
+)
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    store.close()
+
+
+app = FastAPI(title="multyagents api", version="0.1.0", lifespan=_lifespan)
+
 cors_allow_origins = _parse_csv_env("API_CORS_ALLOW_ORIGINS", default="null")
 cors_allow_origin_regex = _env_or_default(
     "API_CORS_ALLOW_ORIGIN_REGEX",
@@ -89,9 +137,47 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
+def _cursor_key(scope: str, cursor: str | None, *key_types: type) -> list[Any] | None:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(scope, cursor, key_types=key_types)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _cursor_after_id(scope: str, cursor: str | None) -> int | None:
+    key = _cursor_key(scope, cursor, int)
+    return key[0] if key is not None else None
+
+
+def _set_next_cursor(response: Response, scope: str, key: list[Any] | None) -> None:
+    if key is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(scope, key)
+
+
+def _next_page_key(items: list[Any], limit: int | None) -> list[Any] | None:
+    return [items[-1].id] if limit is not None and items and len(items) == limit else None
+
+
+def _etag(scope: str, version: str) -> str:
+    return f'"{scope}-{version}"'
+
+
+def _not_modified(response: Response, etag: str, if_none_match: str | None) -> Response | None:
+    response.headers["ETag"] = etag
+    if if_none_match is None:
+        return None
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
@@ -108,8 +194,10 @@ def create_project(payload: ProjectCreate) -> ProjectRead:
 
 
 @app.get("/projects", response_model=list[ProjectRead])
-def list_projects() -> list[ProjectRead]:
-    return store.list_projects()
+def list_projects(response: Response, cursor: str | None = None, limit: int | None = None) -> list[ProjectRead]:
+    projects = store.list_projects(after_id=_cursor_after_id("projects", cursor), limit=limit)
+    _set_next_cursor(response, "projects", _next_page_key(projects, limit))
+    return projects
 
 
 @app.get("/projects/{project_id}", response_model=ProjectRead)
@@ -147,8 +235,10 @@ def create_role(payload: RoleCreate) -> RoleRead:
 
 
 @app.get("/roles", response_model=list[RoleRead])
-def list_roles() -> list[RoleRead]:
-    return store.list_roles()
+def list_roles(response: Response, cursor: str | None = None, limit: int | None = None) -> list[RoleRead]:
+    roles = store.list_roles(after_id=_cursor_after_id("roles", cursor), limit=limit)
+    _set_next_cursor(response, "roles", _next_page_key(roles, limit))
+    return roles
 
 
 @app.get("/roles/{role_id}", response_model=RoleRead)
@@ -241,8 +331,14 @@ def create_workflow_template(payload: WorkflowTemplateCreate) -> WorkflowTemplat
 
 
 @app.get("/workflow-templates", response_model=list[WorkflowTemplateRead])
-def list_workflow_templates() -> list[WorkflowTemplateRead]:
-    return store.list_workflow_templates()
+def list_workflow_templates(
+    response: Response,
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> list[WorkflowTemplateRead]:
+    templates = store.list_workflow_templates(after_id=_cursor_after_id("workflow-templates", cursor), limit=limit)
+    _set_next_cursor(response, "workflow-templates", _next_page_key(templates, limit))
+    return templates
 
 
 @app.post("/workflow-templates/recommend", response_model=WorkflowTemplateRecommendationResponse)
@@ -289,14 +385,45 @@ def create_workflow_run(payload: WorkflowRunCreate) -> WorkflowRunRead:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
-@app.get("/workflow-runs", response_model=list[WorkflowRunRead])
-def list_workflow_runs() -> list[WorkflowRunRead]:
-    return store.list_workflow_runs()
+@app.get("/workflow-runs", response_model=list[WorkflowRunViewRead])
+def list_workflow_runs(
+    response: Response,
+    workflow_template_id: int | None = None,
+    status: list[WorkflowRunStatus] | None = Query(default=None),
+    since: str | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    view: ReadView = ReadView.FULL,
+) -> list[WorkflowRunRead] | list[WorkflowRunCompactRead]:
+    list_runs = store.list_compact_workflow_runs if view is ReadView.COMPACT else store.list_workflow_runs
+    try:
+        runs = list_runs(
+            workflow_template_id=workflow_template_id,
+            statuses=status,
+            since=since,
+            after_id=_cursor_after_id("workflow-runs", cursor),
+            limit=limit,
+        )
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    _set_next_cursor(response, "workflow-runs", _next_page_key(runs, limit))
+    return runs
 
 
-@app.get("/workflow-runs/{run_id}", response_model=WorkflowRunRead)
-def get_workflow_run(run_id: int) -> WorkflowRunRead:
-    try:
+@app.get("/workflow-runs/{run_id}", response_model=WorkflowRunViewRead)
+def get_workflow_run(
+    run_id: int,
+    response: Response,
+    view: ReadView = ReadView.FULL,
+    if_none_match: str | None = Header(default=None),
+) -> WorkflowRunRead | WorkflowRunCompactRead | Response:
+    try:
+        etag = _etag(f"run-{view.value}", store.workflow_run_version(run_id))
+        not_modified = _not_modified(response, etag, if_none_match)
+        if not_modified is not None:
+            return not_modified
+        if view is ReadView.COMPACT:
+            return store.get_compact_workflow_run(run_id)
         return store.get_workflow_run(run_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -548,8 +675,16 @@ def report_assistant_intent(payload: AssistantIntentReportRequest) -> AssistantI
 
 
 @app.get("/workflow-runs/{run_id}/execution-summary", response_model=WorkflowRunExecutionSummary)
-def get_workflow_run_execution_summary(run_id: int) -> WorkflowRunExecutionSummary:
-    try:
+def get_workflow_run_execution_summary(
+    run_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+) -> WorkflowRunExecutionSummary | Response:
+    try:
+        etag = _etag("run-summary", store.workflow_run_summary_version(run_id))
+        not_modified = _not_modified(response, etag, if_none_match)
+        if not_modified is not None:
+            return not_modified
         return store.get_workflow_run_execution_summary(run_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -557,12 +692,50 @@ def get_workflow_run_execution_summary(run_id: int) -> WorkflowRunExecutionSumma
 
 @app.get("/events", response_model=list[EventRead])
 def list_events(
+    response: Response,
     run_id: int | None = None,
     task_id: int | None = None,
     event_type: str | None = None,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    run_ids: list[int] | None = Query(default=None),
+    since: str | None = None,
+    cursor: str | None = None,
     limit: int = 200,
-) -> list[EventRead]:
-    return store.list_events(run_id=run_id, task_id=task_id, event_type=event_type, limit=limit)
+    if_none_match: str | None = Header(default=None),
+) -> list[EventRead] | Response:
+    if cursor is not None and (after_id is not None or before_id is not None):
+        raise HTTPException(status_code=422, detail="cursor cannot be combined with after_id or before_id")
+    if cursor is not None:
+        after_id = _cursor_after_id("events", cursor)
+    try:
+        version = store.events_version(
+            run_id=run_id,
+            task_id=task_id,
+            event_type=event_type,
+            after_id=after_id,
+            before_id=before_id,
+            run_ids=run_ids,
+            since=since,
+            limit=limit,
+        )
+        not_modified = _not_modified(response, _etag("events", version), if_none_match)
+        if not_modified is not None:
+            return not_modified
+        events = store.list_events(
+            run_id=run_id,
+            task_id=task_id,
+            event_type=event_type,
+            after_id=after_id,
+            before_id=before_id,
+            run_ids=run_ids,
+            since=since,
+            limit=limit,
+        )
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    _set_next_cursor(response, "events", [events[-1].id] if events else [after_id] if cursor is not None else None)
+    return events
 
 
 @app.post("/events", response_model=EventRead)
@@ -575,12 +748,27 @@ def create_event(payload: EventCreate) -> EventRead:
 
 @app.get("/artifacts", response_model=list[ArtifactRead])
 def list_artifacts(
+    response: Response,
     run_id: int | None = None,
     task_id: int | None = None,
     artifact_type: ArtifactType | None = None,
+    cursor: str | None = None,
     limit: int = 200,
 ) -> list[ArtifactRead]:
-    return store.list_artifacts(run_id=run_id, task_id=task_id, artifact_type=artifact_type, limit=limit)
+    after_id = _cursor_after_id("artifacts", cursor)
+    artifacts = store.list_artifacts(
+        run_id=run_id,
+        task_id=task_id,
+        artifact_type=artifact_type,
+        after_id=after_id,
+        limit=limit,
+    )
+    _set_next_cursor(
+        response,
+        "artifacts",
+        [artifacts[-1].id] if artifacts else [after_id] if after_id is not None else None,
+    )
+    return artifacts
 
 
 @app.post("/artifacts", response_model=ArtifactRead)
@@ -601,17 +789,34 @@ def create_task(payload: TaskCreate) -> TaskRead:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
-@app.get("/tasks", response_model=list[TaskRead])
-def list_tasks(run_id: int | None = None) -> list[TaskRead]:
-    try:
-        return store.list_tasks(run_id=run_id)
+@app.get("/tasks", response_model=list[TaskViewRead])
+def list_tasks(
+    response: Response,
+    run_id: int | None = None,
+    status: list[TaskStatus] | None = Query(default=None),
+    cursor: str | None = None,
+    limit: int | None = None,
+    view: ReadView = ReadView.FULL,
+) -> list[TaskRead] | list[TaskCompactRead]:
+    list_tasks = store.list_compact_tasks if view is ReadView.COMPACT else store.list_tasks
+    try:
+        tasks = list_tasks(
+            run_id=run_id,
+            statuses=status,
+            after_id=_cursor_after_id("tasks", cursor),
+            limit=limit,
+        )
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    _set_next_cursor(response, "tasks", _next_page_key(tasks, limit))
+    return tasks
 
 
-@app.get("/tasks/{task_id}", response_model=TaskRead)
-def get_task(task_id: int) -> TaskRead:
+@app.get("/tasks/{task_id}", response_model=TaskViewRead)
+def get_task(task_id: int, view: ReadView = ReadView.FULL) -> TaskRead | TaskCompactRead:
     try:
+        if view is ReadView.COMPACT:
+            return store.get_compact_task(task_id)
         return store.get_task(task_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -692,6 +897,34 @@ def get_task_approval(task_id: int) -> ApprovalRead:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@app.get("/approvals", response_model=list[ApprovalRead])
+def list_approvals(
+    status: ApprovalStatus | None = None,
+    run_id: int | None = None,
+    project_id: int | None = None,
+    role_id: int | None = None,
+    limit: int = 200,
+) -> list[ApprovalRead]:
+    try:
+        return store.list_approvals(
+            status=status,
+            run_id=run_id,
+            project_id=project_id,
+            role_id=role_id,
+            limit=limit,
+        )
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+@app.post("/approvals/bulk", response_model=ApprovalBulkDecisionResponse)
+def decide_approvals(payload: ApprovalBulkDecisionRequest) -> ApprovalBulkDecisionResponse:
+    try:
+        return ApprovalBulkDecisionResponse(approvals=store.decide_approvals(payload))
+    except NotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
 @app.get("/approvals/{approval_id}", response_model=ApprovalRead)
 def get_approval(approval_id: int) -> ApprovalRead:
     try:
@@ -730,11 +963,32 @@ def get_task_audit(task_id: int) -> TaskAudit:
 
 @app.get("/handoffs", response_model=list[TaskHandoffRead])
 def list_handoffs(
+    response: Response,
     run_id: int | None = None,
     task_id: int | None = None,
+    updated_after: str | None = None,
+    after_task_id: int | None = None,
+    cursor: str | None = None,
     limit: int = 200,
 ) -> list[TaskHandoffRead]:
-    return store.list_handoffs(run_id=run_id, task_id=task_id, limit=limit)
+    if cursor is not None and (updated_after is not None or after_task_id is not None):
+        raise HTTPException(status_code=422, detail="cursor cannot be combined with updated_after or after_task_id")
+    key = _cursor_key("handoffs", cursor, str, int)
+    if key is not None:
+        updated_after, after_task_id = key
+    handoffs = store.list_handoffs(
+        run_id=run_id,
+        task_id=task_id,
+        updated_after=updated_after,
+        after_task_id=after_task_id,
+        limit=limit,
+    )
+    _set_next_cursor(
+        response,
+        "handoffs",
+        [handoffs[-1].updated_at, handoffs[-1].task_id] if handoffs else key,
+    )
+    return handoffs
 
 
 @app.get("/tasks/{task_id}/handoff", response_model=TaskHandoffRead)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(scope: str, key: list[Any]) -> str:
+    raw = json.dumps([scope, *key], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(scope: str, cursor: str, *, key_types: tuple[type, ...]) -> list[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"invalid cursor '{cursor}'") from exc
+    if not isinstance(payload, list) or not payload or payload[0] != scope:
+        raise ValueError(f"cursor '{cursor}' does not belong to {scope}")
+    key = payload[1:]
+    if len(key) != len(key_types) or not all(
+        isinstance(value, value_type) and not isinstance(value, bool) for value, value_type in zip(key, key_types)
+    ):
+        raise ValueError(f"invalid cursor '{cursor}'")
+    return key
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Discriminator, Field, Tag, model_validator
 from multyagents_api.workflow_validation import validate_workflow_dag
 
 
@@ -42,6 +42,11 @@ class ArtifactType(str, Enum):
     CUSTOM = "custom"
 
 
+class ReadView(str, Enum):
+    FULL = "full"
+    COMPACT = "compact"
+
+
 class RunnerLifecycleStatus(str, Enum):
     RUNNING = "running"
     SUCCESS = "success"
@@ -289,6 +294,28 @@ class TaskRead(BaseModel):
     quality_gate_summary: QualityGateSummary = Field(default_factory=QualityGateSummary)
 
 
+class TaskCompactRead(BaseModel):
+    id: int
+    role_id: int
+    title: str
+    status: TaskStatus
+    project_id: int | None = None
+    started_at: str | None = None
+    finished_at: str | None = None
+    exit_code: int | None = None
+
+
+def _read_view_tag(value: Any) -> str:
+    fields = value.keys() if isinstance(value, dict) else type(value).model_fields
+    return ReadView.FULL.value if "quality_gate_summary" in fields else ReadView.COMPACT.value
+
+
+TaskViewRead = Annotated[
+    Annotated[TaskRead, Tag(ReadView.FULL.value)] | Annotated[TaskCompactRead, Tag(ReadView.COMPACT.value)],
+    Discriminator(_read_view_tag),
+]
+
+
 class RunnerContext(BaseModel):
     provider: str = "context7"
     enabled: bool
@@ -410,6 +437,35 @@ class ApprovalDecisionRequest(BaseModel):
     comment: str | None = None
 
 
+class ApprovalBulkDecision(BaseModel):
+    approval_id: int = Field(ge=1)
+    status: ApprovalStatus
+    comment: str | None = None
+
+    @model_validator(mode="after")
+    def validate_status(self) -> "ApprovalBulkDecision":
+        if self.status == ApprovalStatus.PENDING:
+            raise ValueError("bulk decision status must be approved or rejected")
+        return self
+
+
+class ApprovalBulkDecisionRequest(BaseModel):
+    decisions: list[ApprovalBulkDecision] = Field(min_length=1, max_length=500)
+    actor: str | None = None
+    comment: str | None = None
+
+    @model_validator(mode="after")
+    def validate_unique_approvals(self) -> "ApprovalBulkDecisionRequest":
+        approval_ids = [decision.approval_id for decision in self.decisions]
+        if len(set(approval_ids)) != len(approval_ids):
+            raise ValueError("bulk decisions must not repeat an approval_id")
+        return self
+
+
+class ApprovalBulkDecisionResponse(BaseModel):
+    approvals: list[ApprovalRead]
+
+
 class RunnerStatusUpdate(BaseModel):
     status: RunnerLifecycleStatus
     message: str | None = None
@@ -548,6 +604,22 @@ class WorkflowRunRead(BaseModel):
     quality_gate_summary: QualityGateRunSummary = Field(default_factory=QualityGateRunSummary)
 
 
+class WorkflowRunCompactRead(BaseModel):
+    id: int
+    workflow_template_id: int | None = None
+    status: WorkflowRunStatus
+    initiated_by: str | None = None
+    created_at: str
+    updated_at: str
+
+
+WorkflowRunViewRead = Annotated[
+    Annotated[WorkflowRunRead, Tag(ReadView.FULL.value)]
+    | Annotated[WorkflowRunCompactRead, Tag(ReadView.COMPACT.value)],
+    Discriminator(_read_view_tag),
+]
+
+
 class WorkflowRunDispatchReadyResponse(BaseModel):
     run_id: int
     dispatched: bool
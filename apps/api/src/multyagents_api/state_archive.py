@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_INDEX_FILE = "index.json"
+_SEGMENT_SUFFIX = ".jsonl.gz"
+_SEGMENT_CACHE_SIZE = 8
+
+
+@dataclass
+class ArchiveSegment:
+    name: str
+    run_ids: list[int] = field(default_factory=list)
+    event_count: int = 0
+    artifact_ids: list[int] = field(default_factory=list)
+
+
+def archive_path_for(state_file: Path) -> Path:
+    return state_file.with_name(f"{state_file.name}.archive")
+
+
+class RunArchive:
+    def __init__(self, archive_dir: Path) -> None:
+        self.archive_dir = archive_dir
+        self._lock = threading.RLock()
+        self._segments: dict[str, ArchiveSegment] = {}
+        self._segments_by_run: dict[int, list[str]] = {}
+        self._segments_by_artifact: dict[int, str] = {}
+        self._cache: dict[str, list[dict[str, Any]]] = {}
+        self._load_index()
+
+    @property
+    def run_ids(self) -> set[int]:
+        with self._lock:
+            return set(self._segments_by_run)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "archive_segments": len(self._segments),
+                "archived_runs": len(self._segments_by_run),
+                "archived_events": sum(segment.event_count for segment in self._segments.values()),
+                "archived_artifacts": len(self._segments_by_artifact),
+            }
+
+    def write_segment(
+        self,
+        *,
+        events: list[dict[str, Any]],
+        artifacts: list[dict[str, Any]],
+        fsync: bool = True,
+    ) -> ArchiveSegment:
+        records = [{"kind": "event", "record": event} for event in events]
+        records.extend({"kind": "artifact", "record": artifact} for artifact in artifacts)
+        with self._lock:
+            number = max((int(name.split(".", 1)[0]) for name in self._segments), default=0) + 1
+            segment = _describe_segment(f"{number:06d}{_SEGMENT_SUFFIX}", records)
+            payload = "".join(json.dumps(item, ensure_ascii=True, separators=(",", ":")) + "\n" for item in records)
+            _write_atomic(self.archive_dir / segment.name, gzip.compress(payload.encode("utf-8")), fsync=fsync)
+            self._add_segment(segment)
+            self._write_index(fsync=fsync)
+            return segment
+
+    def read_run(self, run_id: int) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        with self._lock:
+            names = list(self._segments_by_run.get(run_id, []))
+        events: list[dict[str, Any]] = []
+        artifacts: list[dict[str, Any]] = []
+        for name in names:
+            for item in self._read_segment(name):
+                record = item["record"]
+                if record.get("run_id") != run_id:
+                    continue
+                (events if item["kind"] == "event" else artifacts).append(record)
+        return events, artifacts
+
+    def read_artifacts(self, artifact_ids: set[int]) -> list[dict[str, Any]]:
+        with self._lock:
+            names = sorted({self._segments_by_artifact[item] for item in artifact_ids if item in self._segments_by_artifact})
+        return [
+            item["record"]
+            for name in names
+            for item in self._read_segment(name)
+            if item["kind"] == "artifact" and item["record"]["id"] in artifact_ids
+        ]
+
+    def _read_segment(self, name: str) -> list[dict[str, Any]]:
+        with self._lock:
+            cached = self._cache.get(name)
+            if cached is not None:
+                return cached
+        payload = gzip.decompress((self.archive_dir / name).read_bytes()).decode("utf-8")
+        records = [json.loads(line) for line in payload.splitlines() if line.strip()]
+        with self._lock:
+            if len(self._cache) >= _SEGMENT_CACHE_SIZE:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[name] = records
+        return records
+
+    def _load_index(self) -> None:
+        index_file = self.archive_dir / _INDEX_FILE
+        if index_file.exists():
+            for raw in json.loads(index_file.read_text(encoding="utf-8")).get("segments", []):
+                self._add_segment(ArchiveSegment(**raw))
+        if not self.archive_dir.exists():
+            return
+        # A crash between writing a segment and replacing the index leaves an unindexed segment behind.
+        missing = sorted(
+            path.name
+            for path in self.archive_dir.glob(f"*{_SEGMENT_SUFFIX}")
+            if path.name not in self._segments
+        )
+        for name in missing:
+            self._add_segment(_describe_segment(name, self._read_segment(name)))
+        if missing:
+            self._write_index(fsync=True)
+
+    def _add_segment(self, segment: ArchiveSegment) -> None:
+        self._segments[segment.name] = segment
+        for run_id in segment.run_ids:
+            self._segments_by_run.setdefault(run_id, []).append(segment.name)
+        for artifact_id in segment.artifact_ids:
+            self._segments_by_artifact[artifact_id] = segment.name
+
+    def _write_index(self, *, fsync: bool) -> None:
+        payload = json.dumps(
+            {"segments": [segment.__dict__ for segment in self._segments.values()]},
+            ensure_ascii=True,
+            sort_keys=True,
+        )
+        _write_atomic(self.archive_dir / _INDEX_FILE, payload.encode("utf-8"), fsync=fsync)
+
+
+def _describe_segment(name: str, records: list[dict[str, Any]]) -> ArchiveSegment:
+    run_ids = sorted({int(item["record"]["run_id"]) for item in records if item["record"].get("run_id") is not None})
+    return ArchiveSegment(
+        name=name,
+        run_ids=run_ids,
+        event_count=sum(1 for item in records if item["kind"] == "event"),
+        artifact_ids=[int(item["record"]["id"]) for item in records if item["kind"] == "artifact"],
+    )
+
+
+def _write_atomic(target: Path, payload: bytes, *, fsync: bool) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f"{target.name}.tmp")
+    with tmp_file.open("wb") as handle:
+        handle.write(payload)
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+    tmp_file.replace(target)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from multyagents_api.state_checksum import write_checksummed
+
+MAGIC = b"MYASNAP\x00"
+FORMAT_VERSION = 1
+SECTION_KINDS: tuple[str, ...] = ("map", "list", "value")
+
+_VERSION = struct.Struct(">H")
+_FRAME = struct.Struct(">BBHI")
+_FRAME_SECTION = 0
+_FRAME_ENTRY = 1
+_FRAME_END = 2
+_DECODER = json.JSONDecoder()
+
+Section = tuple[str, str, Iterable[tuple[str, Any]]]
+
+
+def is_binary_snapshot(path: Path) -> bool:
+    with path.open("rb") as handle:
+        return handle.read(len(MAGIC)) == MAGIC
+
+
+def encode_binary_snapshot(sections: Iterable[Section]) -> Iterator[bytes]:
+    yield MAGIC + _VERSION.pack(FORMAT_VERSION)
+    for section_id, (name, kind, entries) in enumerate(sections):
+        if kind not in SECTION_KINDS:
+            raise ValueError(f"unknown section kind '{kind}'")
+        if section_id > 255:
+            raise ValueError("too many sections")
+        yield _frame(_FRAME_SECTION, section_id, name.encode("utf-8"), kind.encode("ascii"))
+        for key, value in entries:
+            yield _frame(
+                _FRAME_ENTRY,
+                section_id,
+                key.encode("utf-8"),
+                json.dumps(value, ensure_ascii=True, separators=(",", ":")).encode("ascii"),
+            )
+    yield _frame(_FRAME_END, 0, b"", b"")
+
+
+def decode_binary_snapshot(handle: BinaryIO) -> Iterator[tuple[str, str, str | None, Any]]:
+    if handle.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a binary state snapshot")
+    (version,) = _VERSION.unpack(_read_exact(handle, _VERSION.size))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported binary snapshot version {version}")
+    sections: dict[int, tuple[str, str]] = {}
+    while True:
+        frame_type, section_id, key_length, value_length = _FRAME.unpack(_read_exact(handle, _FRAME.size))
+        body = _read_exact(handle, key_length + value_length)
+        key, value = body[:key_length], body[key_length:]
+        if frame_type == _FRAME_END:
+            return
+        if frame_type == _FRAME_SECTION:
+            sections[section_id] = (key.decode("utf-8"), value.decode("ascii"))
+            yield *sections[section_id], None, None
+            continue
+        if frame_type != _FRAME_ENTRY or section_id not in sections:
+            raise ValueError(f"corrupted binary snapshot frame (type {frame_type}, section {section_id})")
+        name, kind = sections[section_id]
+        yield name, kind, key.decode("utf-8"), _DECODER.decode(value.decode("ascii"))
+
+
+def read_binary_snapshot(path: Path) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    with path.open("rb") as handle:
+        for name, kind, key, value in decode_binary_snapshot(handle):
+            if key is None:
+                if kind != "value":
+                    data[name] = {} if kind == "map" else []
+            elif kind == "map":
+                data.setdefault(name, {})[key] = value
+            elif kind == "list":
+                data.setdefault(name, []).append(value)
+            else:
+                data[name] = value
+    return data
+
+
+def snapshot_sections(data: dict[str, Any]) -> Iterator[Section]:
+    for name, value in data.items():
+        if isinstance(value, dict):
+            yield name, "map", value.items()
+        elif isinstance(value, list):
+            yield name, "list", (("", item) for item in value)
+        else:
+            yield name, "value", [("", value)]
+
+
+def convert_json_to_binary(source: Path, target: Path) -> None:
+    data = json.loads(source.read_text(encoding="utf-8"))
+    write_checksummed(target, encode_binary_snapshot(snapshot_sections(data)), fsync=True)
+
+
+def convert_binary_to_json(source: Path, target: Path) -> None:
+    payload = json.dumps(read_binary_snapshot(source), ensure_ascii=True, sort_keys=True)
+    write_checksummed(target, [payload.encode("utf-8")], fsync=True)
+
+
+def _frame(frame_type: int, section_id: int, key: bytes, value: bytes) -> bytes:
+    return _FRAME.pack(frame_type, section_id, len(key), len(value)) + key + value
+
+
+def _read_exact(handle: BinaryIO, size: int) -> bytes:
+    chunk = handle.read(size)
+    if len(chunk) != size:
+        raise ValueError("truncated binary snapshot")
+    return chunk
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable
+
+_ALGORITHM = "sha256"
+_READ_CHUNK = 1024 * 1024
+
+
+def checksum_path_for(state_file: Path) -> Path:
+    return state_file.with_name(f"{state_file.name}.{_ALGORITHM}")
+
+
+def payload_checksum(payload: bytes) -> str:
+    return f"{_ALGORITHM}:{hashlib.sha256(payload).hexdigest()}"
+
+
+def write_checksum(state_file: Path, payload: bytes, *, fsync: bool = False) -> None:
+    _store_checksum(state_file, payload_checksum(payload), fsync=fsync)
+
+
+def write_checksummed(state_file: Path, chunks: Iterable[bytes], *, fsync: bool = False) -> None:
+    hasher = hashlib.sha256()
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = state_file.with_name(f"{state_file.name}.tmp")
+    with tmp_file.open("wb") as handle:
+        for chunk in chunks:
+            hasher.update(chunk)
+            handle.write(chunk)
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+    tmp_file.replace(state_file)
+    _store_checksum(state_file, f"{_ALGORITHM}:{hasher.hexdigest()}", fsync=fsync)
+
+
+def verify_checksum(state_file: Path, payload: bytes) -> bool:
+    expected = _read_checksum(state_file)
+    return expected is not None and expected == payload_checksum(payload)
+
+
+def verify_checksum_file(state_file: Path) -> bool:
+    expected = _read_checksum(state_file)
+    if expected is None:
+        return False
+    hasher = hashlib.sha256()
+    with state_file.open("rb") as handle:
+        while chunk := handle.read(_READ_CHUNK):
+            hasher.update(chunk)
+    return expected == f"{_ALGORITHM}:{hasher.hexdigest()}"
+
+
+def _read_checksum(state_file: Path) -> str | None:
+    target = checksum_path_for(state_file)
+    if not target.exists():
+        return None
+    return target.read_text(encoding="utf-8").strip()
+
+
+def _store_checksum(state_file: Path, checksum: str, *, fsync: bool) -> None:
+    target = checksum_path_for(state_file)
+    tmp_file = target.with_name(f"{target.name}.tmp")
+    with tmp_file.open("w", encoding="utf-8") as handle:
+        handle.write(checksum)
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+    tmp_file.replace(target)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from multyagents_api.state_journal import read_jsonl_records
+
+SEGMENT_SIZE = 10_000
+_SEGMENTED_COLLECTIONS = ("events", "artifacts")
+
+
+@dataclass
+class DirectoryChange:
+    collections: dict[str, str] = field(default_factory=dict)
+    events: list[tuple[int, str]] = field(default_factory=list)
+    artifacts: list[tuple[int, str]] = field(default_factory=list)
+    sequences: str | None = None
+    pruned_events: set[int] = field(default_factory=set)
+    pruned_artifacts: set[int] = field(default_factory=set)
+
+
+def directory_path_for(state_file: Path) -> Path:
+    return state_file.with_name(f"{state_file.name}.d")
+
+
+def has_directory_state(state_dir: Path) -> bool:
+    return (state_dir / "sequences.json").exists()
+
+
+def write_directory_changes(
+    state_dir: Path,
+    changes: list[DirectoryChange],
+    *,
+    fsync: bool = False,
+    segment_size: int = SEGMENT_SIZE,
+) -> None:
+    collections: dict[str, str] = {}
+    appended: dict[str, list[tuple[int, str]]] = {name: [] for name in _SEGMENTED_COLLECTIONS}
+    pruned: dict[str, set[int]] = {name: set() for name in _SEGMENTED_COLLECTIONS}
+    sequences: str | None = None
+    for change in changes:
+        collections.update(change.collections)
+        appended["events"].extend(change.events)
+        appended["artifacts"].extend(change.artifacts)
+        pruned["events"].update(change.pruned_events)
+        pruned["artifacts"].update(change.pruned_artifacts)
+        if change.sequences is not None:
+            sequences = change.sequences
+
+    for name, records in appended.items():
+        by_segment: dict[int, list[str]] = {}
+        for record_id, line in records:
+            by_segment.setdefault((record_id - 1) // segment_size + 1, []).append(line)
+        for segment, lines in sorted(by_segment.items()):
+            segment_file = state_dir / name / f"{segment:06d}.jsonl"
+            segment_file.parent.mkdir(parents=True, exist_ok=True)
+            with segment_file.open("a", encoding="utf-8") as handle:
+                handle.write("".join(lines))
+                handle.flush()
+                if fsync:
+                    os.fsync(handle.fileno())
+    for name, record_ids in pruned.items():
+        for segment in sorted({(record_id - 1) // segment_size + 1 for record_id in record_ids}):
+            segment_file = state_dir / name / f"{segment:06d}.jsonl"
+            if not segment_file.exists():
+                continue
+            kept = [
+                encode_record(record) + "\n"
+                for record in _read_segment(segment_file)
+                if int(record["id"]) not in record_ids
+            ]
+            _write_atomic(segment_file, "".join(kept), fsync=fsync)
+    for name, payload in collections.items():
+        _write_atomic(state_dir / "collections" / f"{name}.json", payload, fsync=fsync)
+    if sequences is not None:
+        _write_atomic(state_dir / "sequences.json", sequences, fsync=fsync)
+
+
+def read_directory_state(state_dir: Path) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    collections_dir = state_dir / "collections"
+    if collections_dir.exists():
+        for collection_file in sorted(collections_dir.glob("*.json")):
+            data[collection_file.stem] = json.loads(collection_file.read_text(encoding="utf-8"))
+    for name in _SEGMENTED_COLLECTIONS:
+        records: list[dict[str, Any]] = []
+        for segment_file in sorted((state_dir / name).glob("*.jsonl")):
+            records.extend(_read_segment(segment_file))
+        data[name] = records
+
+    sequences_file = state_dir / "sequences.json"
+    sequences = json.loads(sequences_file.read_text(encoding="utf-8")) if sequences_file.exists() else {}
+    # Segments are appended before sequences.json is replaced, so a crash can leave records past the saved counter.
+    for name, key in (("events", "event_seq"), ("artifacts", "artifact_seq")):
+        if data[name]:
+            sequences[key] = max(int(sequences.get(key, 1)), int(data[name][-1]["id"]) + 1)
+    data["sequences"] = sequences
+    return data
+
+
+def encode_record(value: Any, *, sort_keys: bool = False) -> str:
+    return json.dumps(value, ensure_ascii=True, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def _read_segment(segment_file: Path) -> list[dict[str, Any]]:
+    return read_jsonl_records(segment_file)
+
+
+def _write_atomic(target: Path, payload: str, *, fsync: bool) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(f"{target.name}.tmp")
+    with tmp_file.open("w", encoding="utf-8") as handle:
+        handle.write(payload)
+        if fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+    tmp_file.replace(target)
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from itertools import compress
+from typing import Any, Iterable, Iterator, Sequence, overload
+
+from multyagents_api.schemas import EventRead
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NO_ID = 0
+_NO_TIMESTAMP = -1
+_DEFAULT_CONTRACT_VERSION = "v1"
+
+
+def timestamp_us(value: str) -> int | None:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    delta = parsed - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _format_timestamp(value: int) -> str:
+    return (_EPOCH + timedelta(microseconds=value)).isoformat()
+
+
+class ColumnarEventLog(Sequence[EventRead]):
+    def __init__(self, events: Iterable[EventRead] = ()) -> None:
+        self.ids = array("q")
+        self.run_ids = array("q")
+        self.task_ids = array("q")
+        self.type_codes = array("i")
+        self.role_codes = array("i")
+        self.created_us = array("q")
+        self.payload_ends = array("q")
+        self.payloads = bytearray()
+        self._names: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._created_at_overrides: dict[int, str] = {}
+        self._contract_versions: dict[int, str] = {}
+        self._payload_overrides: dict[int, dict[str, Any]] = {}
+        self._time_ordered = True
+        for event in events:
+            self.append(event)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> EventRead: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[EventRead]: ...
+
+    def __getitem__(self, index: int | slice) -> EventRead | list[EventRead]:
+        if isinstance(index, slice):
+            return self.materialize(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event position out of range")
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[EventRead]:
+        for position in range(len(self)):
+            yield self._materialize(position)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+
+    def append(self, event: EventRead) -> None:
+        self.append_record(
+            event_id=event.id,
+            contract_version=event.contract_version,
+            event_type=event.event_type,
+            run_id=event.run_id,
+            task_id=event.task_id,
+            producer_role=event.producer_role,
+            payload=event.payload,
+            created_at=event.created_at,
+        )
+
+    def append_record(
+        self,
+        *,
+        event_id: int,
+        contract_version: str,
+        event_type: str,
+        run_id: int | None,
+        task_id: int | None,
+        producer_role: str,
+        payload: dict[str, Any],
+        created_at: str,
+    ) -> None:
+        position = len(self.ids)
+        created_us = timestamp_us(created_at)
+        if created_us is None or _format_timestamp(created_us) != created_at:
+            self._created_at_overrides[position] = created_at
+        if contract_version != _DEFAULT_CONTRACT_VERSION:
+            self._contract_versions[position] = contract_version
+        created_us = _NO_TIMESTAMP if created_us is None else created_us
+        if self.created_us and created_us < self.created_us[-1]:
+            self._time_ordered = False
+        if payload:
+            try:
+                self.payloads += json.dumps(payload, ensure_ascii=True, separators=(",", ":")).encode("ascii")
+            except TypeError:
+                self._payload_overrides[position] = payload
+        self.ids.append(event_id)
+        self.run_ids.append(_NO_ID if run_id is None else run_id)
+        self.task_ids.append(_NO_ID if task_id is None else task_id)
+        self.type_codes.append(self.code(event_type))
+        self.role_codes.append(self.code(producer_role))
+        self.created_us.append(created_us)
+        self.payload_ends.append(len(self.payloads))
+
+    def truncate(self, size: int) -> None:
+        if size >= len(self):
+            return
+        del self.payloads[self.payload_ends[size - 1] if size else 0 :]
+        for column in (
+            self.ids,
+            self.run_ids,
+            self.task_ids,
+            self.type_codes,
+            self.role_codes,
+            self.created_us,
+            self.payload_ends,
+        ):
+            del column[size:]
+        for overrides in (self._created_at_overrides, self._contract_versions, self._payload_overrides):
+            for position in [position for position in overrides if position >= size]:
+                del overrides[position]
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+    def event_type_at(self, position: int) -> str:
+        return self._names[self.type_codes[position]]
+
+    def id_at(self, position: int) -> int:
+        return self.ids[position]
+
+    def keys_at(self, position: int) -> tuple[str, int | None, int | None]:
+        run_id = self.run_ids[position]
+        task_id = self.task_ids[position]
+        return (
+            self._names[self.type_codes[position]],
+            None if run_id == _NO_ID else run_id,
+            None if task_id == _NO_ID else task_id,
+        )
+
+    def matches(
+        self,
+        position: int,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        event_type: str | None = None,
+    ) -> bool:
+        return (
+            (run_id is None or self.run_ids[position] == run_id)
+            and (task_id is None or self.task_ids[position] == task_id)
+            and (event_type is None or self._names[self.type_codes[position]] == event_type)
+        )
+
+    def select_positions(
+        self,
+        *,
+        positions: Sequence[int] | None = None,
+        run_ids: Iterable[int] | None = None,
+        task_id: int | None = None,
+        event_types: Iterable[str] | None = None,
+        since: str | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
+    ) -> list[int]:
+        candidates: Sequence[int] = range(len(self)) if positions is None else positions
+        id_at = self.ids.__getitem__
+        start = 0 if after_id is None else bisect_right(candidates, after_id, key=id_at)
+        stop = len(candidates) if before_id is None else bisect_left(candidates, before_id, key=id_at)
+        since_us = timestamp_us(since) if since is not None else None
+        if since is not None and since_us is None:
+            raise ValueError(f"invalid since timestamp '{since}'")
+        if since_us is not None and self._time_ordered:
+            start = max(start, bisect_left(candidates, since_us, key=self.created_us.__getitem__))
+            since_us = None
+        filters: list[tuple[array[int], Any]] = []
+        if event_types is not None:
+            codes = {self._codes[name] for name in event_types if name in self._codes}
+            filters.append((self.type_codes, codes.__contains__))
+        if run_ids is not None:
+            filters.append((self.run_ids, set(run_ids).__contains__))
+        if task_id is not None:
+            filters.append((self.task_ids, task_id.__eq__))
+        if since_us is not None:
+            filters.append((self.created_us, since_us.__le__))
+        selected = candidates[start : max(start, stop)]
+        for column, predicate in filters:
+            if isinstance(selected, range):
+                values: Iterable[int] = column[selected.start : selected.stop]
+            else:
+                values = map(column.__getitem__, selected)
+            selected = list(compress(selected, map(predicate, values)))
+        return list(selected)
+
+    def materialize(self, positions: Iterable[int]) -> list[EventRead]:
+        return [self._materialize(position) for position in positions]
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        for position in range(len(self)):
+            yield self._record(position)
+
+    def _materialize(self, position: int) -> EventRead:
+        return EventRead.model_construct(**self._record(position))
+
+    def _record(self, position: int) -> dict[str, Any]:
+        run_id = self.run_ids[position]
+        task_id = self.task_ids[position]
+        payload_start = self.payload_ends[position - 1] if position else 0
+        payload_end = self.payload_ends[position]
+        created_at = self._created_at_overrides.get(position)
+        payload = self._payload_overrides.get(position)
+        if payload is None:
+            payload = json.loads(self.payloads[payload_start:payload_end]) if payload_end > payload_start else {}
+        return {
+            "id": self.ids[position],
+            "contract_version": self._contract_versions.get(position, _DEFAULT_CONTRACT_VERSION),
+            "event_type": self._names[self.type_codes[position]],
+            "run_id": None if run_id == _NO_ID else run_id,
+            "task_id": None if task_id == _NO_ID else task_id,
+            "producer_role": self._names[self.role_codes[position]],
+            "payload": payload,
+            "created_at": created_at if created_at is not None else _format_timestamp(self.created_us[position]),
+        }
@@ -0,0 +1,922 @@
+from __future__ import annotations
+
+import heapq
+import secrets
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from pathlib import PurePath
+from typing import Any, Callable, Hashable, Iterable, Mapping, Sequence
+
+from multyagents_api.schemas import ArtifactRead, EventRead, TaskStatus
+from multyagents_api.state_events import ColumnarEventLog
+
+_SUCCESS_STATUS = TaskStatus.SUCCESS.value
+_PENDING_STATUSES = (TaskStatus.CREATED.value, TaskStatus.SUBMIT_FAILED.value)
+_ACTIVE_STATUSES = (
+    TaskStatus.DISPATCHED.value,
+    TaskStatus.QUEUED.value,
+    TaskStatus.RUNNING.value,
+    TaskStatus.CANCEL_REQUESTED.value,
+)
+_IndexKey = tuple[dict[Any, list[int]], Hashable]
+
+
+def _add_position(keys: Iterable[_IndexKey], position: int) -> None:
+    for mapping, key in keys:
+        mapping.setdefault(key, []).append(position)
+
+
+def _pop_position(keys: Iterable[_IndexKey]) -> None:
+    for mapping, key in keys:
+        positions = mapping[key]
+        positions.pop()
+        if not positions:
+            del mapping[key]
+
+
+class EventIndex:
+    def __init__(self) -> None:
+        self.by_run: dict[int, list[int]] = {}
+        self.by_task: dict[int, list[int]] = {}
+        self.by_type: dict[str, list[int]] = {}
+        self.by_run_type: dict[tuple[int, str], list[int]] = {}
+
+    def rebuild(self, events: ColumnarEventLog) -> None:
+        for mapping in (self.by_run, self.by_task, self.by_type, self.by_run_type):
+            mapping.clear()
+        for position in range(len(events)):
+            _add_position(self._event_keys(*events.keys_at(position)), position)
+
+    def add(self, position: int, event: EventRead) -> None:
+        _add_position(self._event_keys(event.event_type, event.run_id, event.task_id), position)
+
+    def truncate(self, events: ColumnarEventLog, size: int) -> None:
+        for position in range(len(events) - 1, size - 1, -1):
+            _pop_position(self._event_keys(*events.keys_at(position)))
+
+    def select(
+        self,
+        events: ColumnarEventLog,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        event_type: str | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[EventRead]:
+        candidates: list[list[int]] = []
+        if run_id is not None and event_type is not None:
+            candidates.append(self.by_run_type.get((run_id, event_type), []))
+        elif run_id is not None:
+            candidates.append(self.by_run.get(run_id, []))
+        elif event_type is not None:
+            candidates.append(self.by_type.get(event_type, []))
+        if task_id is not None:
+            candidates.append(self.by_task.get(task_id, []))
+        positions = _page(
+            min(candidates, key=len) if candidates else range(len(events)),
+            events.id_at,
+            lambda position: events.matches(position, run_id=run_id, task_id=task_id, event_type=event_type),
+            after_id=after_id,
+            before_id=before_id,
+            limit=limit,
+        )
+        return events.materialize(positions)
+
+    def run_ids(self) -> set[int]:
+        return set(self.by_run)
+
+    def run_positions(self, run_ids: Iterable[int], event_type: str | None = None) -> list[int]:
+        if event_type is None:
+            lists = [self.by_run.get(run_id, []) for run_id in set(run_ids)]
+        else:
+            lists = [self.by_run_type.get((run_id, event_type), []) for run_id in set(run_ids)]
+        return sorted(chain.from_iterable(lists))
+
+    def _event_keys(self, event_type: str, run_id: int | None, task_id: int | None) -> list[_IndexKey]:
+        keys: list[_IndexKey] = [(self.by_type, event_type)]
+        if run_id is not None:
+            keys.append((self.by_run, run_id))
+            keys.append((self.by_run_type, (run_id, event_type)))
+        if task_id is not None:
+            keys.append((self.by_task, task_id))
+        return keys
+
+
+class ArtifactIndex:
+    def __init__(self) -> None:
+        self.by_id: dict[int, list[int]] = {}
+        self.by_run: dict[int, list[int]] = {}
+        self.by_task: dict[int, list[int]] = {}
+        self.by_type: dict[str, list[int]] = {}
+        self.by_producer: dict[tuple[int | None, int], list[int]] = {}
+        self.by_producer_type: dict[tuple[int | None, int, str], list[int]] = {}
+        self.by_producer_label: dict[tuple[int | None, int, str], list[int]] = {}
+
+    def rebuild(self, artifacts: Sequence[ArtifactRead]) -> None:
+        for mapping in (
+            self.by_id,
+            self.by_run,
+            self.by_task,
+            self.by_type,
+            self.by_producer,
+            self.by_producer_type,
+            self.by_producer_label,
+        ):
+            mapping.clear()
+        for position, artifact in enumerate(artifacts):
+            self.add(position, artifact)
+
+    def add(self, position: int, artifact: ArtifactRead) -> None:
+        _add_position(self._keys(artifact), position)
+
+    def truncate(self, artifacts: Sequence[ArtifactRead], size: int) -> None:
+        for position in range(len(artifacts) - 1, size - 1, -1):
+            _pop_position(self._keys(artifacts[position]))
+
+    def get(self, artifacts: Sequence[ArtifactRead], artifact_ids: list[int]) -> dict[int, ArtifactRead]:
+        found: dict[int, ArtifactRead] = {}
+        for artifact_id in artifact_ids:
+            positions = self.by_id.get(artifact_id)
+            if positions:
+                found[artifact_id] = artifacts[positions[-1]]
+        return found
+
+    def select(
+        self,
+        artifacts: Sequence[ArtifactRead],
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        artifact_type: str | None = None,
+        producer_task_ids: set[int] | None = None,
+        label: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[ArtifactRead]:
+        candidates: list[Sequence[int]] = []
+        if producer_task_ids is not None:
+            candidates.append(self._producer_positions(run_id, producer_task_ids, artifact_type, label))
+        else:
+            if run_id is not None:
+                candidates.append(self.by_run.get(run_id, []))
+            if artifact_type is not None:
+                candidates.append(self.by_type.get(artifact_type, []))
+        if task_id is not None:
+            candidates.append(self.by_task.get(task_id, []))
+        positions = _page(
+            min(candidates, key=len) if candidates else range(len(artifacts)),
+            lambda position: artifacts[position].id,
+            lambda position: _artifact_matches(
+                artifacts[position],
+                run_id=run_id,
+                task_id=task_id,
+                artifact_type=artifact_type,
+                producer_task_ids=producer_task_ids,
+                label=label,
+            ),
+            after_id=after_id,
+            limit=limit,
+        )
+        return [artifacts[position] for position in positions]
+
+    def run_ids(self) -> set[int]:
+        return set(self.by_run)
+
+    def _producer_positions(
+        self,
+        run_id: int | None,
+        producer_task_ids: set[int],
+        artifact_type: str | None,
+        label: str | None,
+    ) -> list[int]:
+        positions: list[int] = []
+        for producer_task_id in producer_task_ids:
+            options = [self.by_producer.get((run_id, producer_task_id), [])]
+            if artifact_type is not None:
+                options.append(self.by_producer_type.get((run_id, producer_task_id, artifact_type), []))
+            if label is not None:
+                options.append(self.by_producer_label.get((run_id, producer_task_id, label), []))
+            positions.extend(min(options, key=len))
+        positions.sort()
+        return positions
+
+    def _keys(self, artifact: ArtifactRead) -> list[_IndexKey]:
+        producer = (artifact.run_id, artifact.producer_task_id)
+        keys: list[_IndexKey] = [
+            (self.by_id, artifact.id),
+            (self.by_type, artifact.artifact_type.value),
+            (self.by_producer, producer),
+            (self.by_producer_type, (*producer, artifact.artifact_type.value)),
+        ]
+        keys.extend((self.by_producer_label, (*producer, label)) for label in sorted(artifact_labels(artifact)))
+        if artifact.run_id is not None:
+            keys.append((self.by_run, artifact.run_id))
+        if artifact.task_id is not None:
+            keys.append((self.by_task, artifact.task_id))
+        return keys
+
+
+class TaskIndex:
+    def __init__(self) -> None:
+        self.ordered: list[int] = []
+        self.by_status: dict[str, list[int]] = {}
+        self._statuses: dict[int, str] = {}
+
+    def rebuild(self, entries: Iterable[tuple[int, str]]) -> None:
+        self.ordered.clear()
+        self.by_status.clear()
+        self._statuses.clear()
+        for task_id, status in sorted(entries):
+            self.put(task_id, status)
+
+    def put(self, task_id: int, status: str) -> None:
+        previous = self._statuses.get(task_id)
+        if previous == status:
+            return
+        if previous is None:
+            _insert_id(self.ordered, task_id)
+        else:
+            self._discard_status(task_id, previous)
+        self._statuses[task_id] = status
+        _insert_id(self.by_status.setdefault(status, []), task_id)
+
+    def discard(self, task_id: int) -> None:
+        status = self._statuses.pop(task_id, None)
+        if status is None:
+            return
+        _remove_sorted(self.ordered, task_id)
+        self._discard_status(task_id, status)
+
+    def status(self, task_id: int) -> str | None:
+        return self._statuses.get(task_id)
+
+    def select(
+        self,
+        *,
+        statuses: Iterable[str] | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[int]:
+        if statuses is None:
+            return id_page([self.ordered], after_id=after_id, limit=limit)
+        return id_page(
+            [self.by_status[status] for status in set(statuses) if status in self.by_status],
+            after_id=after_id,
+            limit=limit,
+        )
+
+    def _discard_status(self, task_id: int, status: str) -> None:
+        task_ids = self.by_status[status]
+        _remove_sorted(task_ids, task_id)
+        if not task_ids:
+            del self.by_status[status]
+
+
+class WorkflowRunIndex:
+    def __init__(self) -> None:
+        self.ordered: list[int] = []
+        self.by_status: dict[str, list[int]] = {}
+        self.by_template: dict[int, dict[int, None]] = {}
+        self.template_status_counts: dict[int, dict[str, int]] = {}
+        self._entries: dict[int, tuple[int | None, str]] = {}
+        self._created_at: dict[int, str] = {}
+        self._updated_at: dict[int, str] = {}
+        self._time_ordered = True
+
+    def rebuild(self, entries: Iterable[tuple[int, int | None, str, str, str]]) -> None:
+        self.ordered.clear()
+        self.by_status.clear()
+        self.by_template.clear()
+        self.template_status_counts.clear()
+        self._entries.clear()
+        self._created_at.clear()
+        self._updated_at.clear()
+        self._time_ordered = True
+        for run_id, template_id, status, created_at, updated_at in sorted(entries):
+            self.put(run_id, template_id, status, created_at, updated_at)
+
+    def put(self, run_id: int, template_id: int | None, status: str, created_at: str, updated_at: str) -> None:
+        if self._entries.get(run_id) == (template_id, status):
+            self._updated_at[run_id] = updated_at
+            return
+        self.discard(run_id)
+        self._entries[run_id] = (template_id, status)
+        self._created_at[run_id] = created_at
+        self._updated_at[run_id] = updated_at
+        if self.ordered and run_id > self.ordered[-1] and created_at < self._created_at[self.ordered[-1]]:
+            self._time_ordered = False
+        _insert_id(self.ordered, run_id)
+        _insert_id(self.by_status.setdefault(status, []), run_id)
+        if template_id is None:
+            return
+        self.by_template.setdefault(template_id, {})[run_id] = None
+        counts = self.template_status_counts.setdefault(template_id, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def discard(self, run_id: int) -> None:
+        entry = self._entries.pop(run_id, None)
+        if entry is None:
+            return
+        template_id, status = entry
+        del self._created_at[run_id]
+        del self._updated_at[run_id]
+        _remove_sorted(self.ordered, run_id)
+        status_run_ids = self.by_status[status]
+        _remove_sorted(status_run_ids, run_id)
+        if not status_run_ids:
+            del self.by_status[status]
+        if template_id is None:
+            return
+        run_ids = self.by_template[template_id]
+        del run_ids[run_id]
+        counts = self.template_status_counts[template_id]
+        counts[status] -= 1
+        if not counts[status]:
+            del counts[status]
+        if not run_ids:
+            del self.by_template[template_id]
+            del self.template_status_counts[template_id]
+
+    def updated_at(self, run_id: int) -> str:
+        return self._updated_at[run_id]
+
+    def template_run_ids(self, template_id: int) -> list[int]:
+        return sorted(self.by_template.get(template_id, {}))
+
+    def template_counts(self, template_id: int) -> dict[str, int]:
+        return dict(self.template_status_counts.get(template_id, {}))
+
+    def select(
+        self,
+        *,
+        template_id: int | None = None,
+        statuses: Iterable[str] | None = None,
+        since: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[int]:
+        if since is not None and self._time_ordered:
+            start = bisect_left(self.ordered, since, key=self._created_at.__getitem__)
+            if start:
+                after_id = max(after_id or 0, self.ordered[start - 1])
+            since = None
+        if statuses is not None:
+            candidates = [self.by_status[status] for status in set(statuses) if status in self.by_status]
+        elif template_id is not None:
+            candidates = [self.template_run_ids(template_id)]
+        else:
+            candidates = [self.ordered]
+        return id_page(
+            candidates,
+            after_id=after_id,
+            limit=limit,
+            matches=lambda run_id: (
+                (template_id is None or self._entries[run_id][0] == template_id)
+                and (since is None or self._created_at[run_id] >= since)
+            ),
+        )
+
+
+class HandoffIndex:
+    def __init__(self) -> None:
+        self.ordered: list[tuple[str, int]] = []
+        self.by_run: dict[int, list[tuple[str, int]]] = {}
+        self.required_artifact_ids: dict[int, tuple[int, ...]] = {}
+        self._entries: dict[int, tuple[int | None, str]] = {}
+
+    def rebuild(self, entries: Iterable[tuple[int, int | None, str, Iterable[int]]]) -> None:
+        self.ordered.clear()
+        self.by_run.clear()
+        self.required_artifact_ids.clear()
+        self._entries.clear()
+        for task_id, run_id, updated_at, required_artifact_ids in entries:
+            self.put(task_id, run_id, updated_at, required_artifact_ids)
+
+    def put(self, task_id: int, run_id: int | None, updated_at: str, required_artifact_ids: Iterable[int]) -> None:
+        self.discard(task_id)
+        key = (updated_at, task_id)
+        self._entries[task_id] = (run_id, updated_at)
+        self.required_artifact_ids[task_id] = tuple(required_artifact_ids)
+        insort(self.ordered, key)
+        if run_id is not None:
+            insort(self.by_run.setdefault(run_id, []), key)
+
+    def discard(self, task_id: int) -> None:
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return
+        run_id, updated_at = entry
+        del self.required_artifact_ids[task_id]
+        _remove_sorted(self.ordered, (updated_at, task_id))
+        if run_id is not None:
+            run_keys = self.by_run[run_id]
+            _remove_sorted(run_keys, (updated_at, task_id))
+            if not run_keys:
+                del self.by_run[run_id]
+
+    def run_id(self, task_id: int) -> int | None:
+        entry = self._entries.get(task_id)
+        return entry[0] if entry is not None else None
+
+    def select(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        updated_after: str | None = None,
+        after_task_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[int]:
+        if task_id is not None:
+            entry = self._entries.get(task_id)
+            keys = [(entry[1], task_id)] if entry is not None and run_id in (None, entry[0]) else []
+        elif run_id is not None:
+            keys = self.by_run.get(run_id, [])
+        else:
+            keys = self.ordered
+        if updated_after is None:
+            start = 0 if limit is None else max(len(keys) - limit, 0)
+            stop = len(keys)
+        else:
+            start = bisect_right(keys, (updated_after, after_task_id if after_task_id is not None else float("inf")))
+            stop = len(keys) if limit is None else start + limit
+        return [selected_task_id for _, selected_task_id in keys[start:stop]]
+
+
+class PendingApprovalIndex:
+    def __init__(self) -> None:
+        self.by_run: dict[int, dict[int, None]] = {}
+        self.by_project: dict[int, dict[int, None]] = {}
+        self.by_role: dict[int, dict[int, None]] = {}
+        self._entries: dict[int, tuple[int | None, int | None, int | None]] = {}
+
+    def rebuild(self, entries: Iterable[tuple[int, int | None, int | None, int | None]]) -> None:
+        self.by_run.clear()
+        self.by_project.clear()
+        self.by_role.clear()
+        self._entries.clear()
+        for approval_id, run_id, project_id, role_id in sorted(entries):
+            self.put(approval_id, run_id, project_id, role_id)
+
+    def put(self, approval_id: int, run_id: int | None, project_id: int | None, role_id: int | None) -> None:
+        entry = (run_id, project_id, role_id)
+        if self._entries.get(approval_id) == entry:
+            return
+        self.discard(approval_id)
+        self._entries[approval_id] = entry
+        for mapping, key in zip(self._mappings(), entry):
+            if key is not None:
+                mapping.setdefault(key, {})[approval_id] = None
+
+    def discard(self, approval_id: int) -> None:
+        entry = self._entries.pop(approval_id, None)
+        if entry is None:
+            return
+        for mapping, key in zip(self._mappings(), entry):
+            if key is None:
+                continue
+            approval_ids = mapping[key]
+            del approval_ids[approval_id]
+            if not approval_ids:
+                del mapping[key]
+
+    def select(
+        self,
+        *,
+        run_id: int | None = None,
+        project_id: int | None = None,
+        role_id: int | None = None,
+    ) -> list[int]:
+        wanted = (run_id, project_id, role_id)
+        candidates = [
+            mapping.get(key, {})
+            for mapping, key in zip(self._mappings(), wanted)
+            if key is not None
+        ]
+        approval_ids = min(candidates, key=len) if candidates else self._entries
+        return sorted(
+            approval_id
+            for approval_id in approval_ids
+            if all(key is None or key == actual for key, actual in zip(wanted, self._entries[approval_id]))
+        )
+
+    def __contains__(self, approval_id: int) -> bool:
+        return approval_id in self._entries
+
+    def _mappings(self) -> tuple[dict[int, dict[int, None]], ...]:
+        return self.by_run, self.by_project, self.by_role
+
+
+class RunReadiness:
+    def __init__(
+        self,
+        task_ids: list[int],
+        dependencies: dict[int, list[int]],
+        statuses: Mapping[int, str | None],
+    ) -> None:
+        self.task_ids = task_ids
+        self.dependencies = dependencies
+        self.pending: set[int] = set()
+        self.ready: set[int] = set()
+        self.status_counts: dict[str, int] = {}
+        self._order: dict[int, int] = {}
+        self._occurrences: dict[int, int] = {}
+        for position, task_id in enumerate(task_ids):
+            self._order.setdefault(task_id, position)
+            self._occurrences[task_id] = self._occurrences.get(task_id, 0) + 1
+        self._dependents: dict[int, list[int]] = {}
+        for task_id in self._order:
+            for dependency_task_id in dependencies.get(task_id, []):
+                self._dependents.setdefault(dependency_task_id, []).append(task_id)
+        self._statuses = {task_id: statuses.get(task_id) for task_id in self.watched_task_ids()}
+        for task_id, occurrences in self._occurrences.items():
+            self._count(self._statuses[task_id], occurrences)
+        self._unmet = {
+            task_id: sum(
+                1
+                for dependency_task_id in dependencies.get(task_id, [])
+                if self._statuses[dependency_task_id] != _SUCCESS_STATUS
+            )
+            for task_id in self._order
+        }
+        for task_id in self._order:
+            self._refresh(task_id)
+
+    @staticmethod
+    def watch_ids(task_ids: list[int], dependencies: dict[int, list[int]]) -> set[int]:
+        watched = set(task_ids)
+        for task_id in task_ids:
+            watched.update(dependencies.get(task_id, []))
+        return watched
+
+    def watched_task_ids(self) -> set[int]:
+        return self.watch_ids(self.task_ids, self.dependencies)
+
+    def update(self, task_id: int, status: str | None) -> None:
+        previous = self._statuses.get(task_id)
+        if previous == status:
+            return
+        self._statuses[task_id] = status
+        occurrences = self._occurrences.get(task_id, 0)
+        if occurrences:
+            self._count(previous, -occurrences)
+            self._count(status, occurrences)
+        if (previous == _SUCCESS_STATUS) != (status == _SUCCESS_STATUS):
+            delta = -1 if status == _SUCCESS_STATUS else 1
+            for dependent_task_id in self._dependents.get(task_id, []):
+                self._unmet[dependent_task_id] += delta
+                self._refresh(dependent_task_id)
+        if task_id in self._order:
+            self._refresh(task_id)
+
+    def ready_task_ids(self) -> list[int]:
+        return sorted(self.ready, key=self._order.__getitem__)
+
+    def pending_task_ids(self) -> list[int]:
+        return sorted(self.pending, key=self._order.__getitem__)
+
+    def has_blocked_pending(self) -> bool:
+        return len(self.pending) > len(self.ready)
+
+    def has_active_tasks(self) -> bool:
+        return any(status in self.status_counts for status in _ACTIVE_STATUSES)
+
+    def _count(self, status: str | None, delta: int) -> None:
+        if status is None:
+            return
+        count = self.status_counts.get(status, 0) + delta
+        if count:
+            self.status_counts[status] = count
+        else:
+            del self.status_counts[status]
+
+    def _refresh(self, task_id: int) -> None:
+        if self._statuses.get(task_id) not in _PENDING_STATUSES:
+            self.pending.discard(task_id)
+            self.ready.discard(task_id)
+            return
+        self.pending.add(task_id)
+        if self._unmet[task_id]:
+            self.ready.discard(task_id)
+        else:
+            self.ready.add(task_id)
+
+
+class DispatchCounters:
+    dispatched = "task.dispatched"
+    retry_scheduled = "task.retry_scheduled"
+    event_types = (dispatched, retry_scheduled)
+
+    def __init__(self, role_of: Callable[[int], int | None]) -> None:
+        self._role_of = role_of
+        self._attempts: dict[int, dict[int, int]] = {}
+        self._retries: dict[int, int] = {}
+        self._role_retries: dict[int, dict[int, int]] = {}
+        self._scheduled: dict[int, dict[int, int]] = {}
+
+    def loaded(self, run_id: int) -> bool:
+        return run_id in self._attempts
+
+    def load(self, run_id: int, events: Iterable[EventRead]) -> None:
+        self._attempts[run_id] = {}
+        self._retries[run_id] = 0
+        self._role_retries[run_id] = {}
+        self._scheduled[run_id] = {}
+        for event in events:
+            self.add(event)
+
+    def add(self, event: EventRead) -> None:
+        if event.task_id is None or event.run_id is None or event.run_id not in self._attempts:
+            return
+        if event.event_type == self.retry_scheduled:
+            scheduled = self._scheduled[event.run_id]
+            scheduled[event.task_id] = scheduled.get(event.task_id, 0) + 1
+            return
+        if event.event_type != self.dispatched:
+            return
+        attempts = self._attempts[event.run_id]
+        previous = attempts.get(event.task_id, 0)
+        attempts[event.task_id] = previous + 1
+        if not previous:
+            return
+        self._retries[event.run_id] += 1
+        role_id = self._role_of(event.task_id)
+        if role_id is not None:
+            role_retries = self._role_retries[event.run_id]
+            role_retries[role_id] = role_retries.get(role_id, 0) + 1
+
+    def attempts(self, run_id: int) -> dict[int, int]:
+        return self._attempts.get(run_id, {})
+
+    def retries_total(self, run_id: int) -> int:
+        return self._retries.get(run_id, 0)
+
+    def role_retries(self, run_id: int) -> dict[int, int]:
+        return self._role_retries.get(run_id, {})
+
+    def scheduled_retries(self, run_id: int) -> dict[int, int]:
+        return self._scheduled.get(run_id, {})
+
+    def discard(self, run_id: int) -> None:
+        for counters in (self._attempts, self._retries, self._role_retries, self._scheduled):
+            counters.pop(run_id, None)
+
+    def clear(self) -> None:
+        for counters in (self._attempts, self._retries, self._role_retries, self._scheduled):
+            counters.clear()
+
+
+class ReadModelCache:
+    def __init__(self) -> None:
+        self.epoch = secrets.token_hex(6)
+        self.hits = 0
+        self.misses = 0
+        self._clock = 0
+        self._floor = 0
+        self._events_version = 0
+        self._task_versions: dict[int, int] = {}
+        self._run_versions: dict[int, int] = {}
+        self._run_activity: dict[int, int] = {}
+        self._task_runs: dict[int, set[int]] = {}
+        self._tasks: dict[int, tuple[int, Any]] = {}
+        self._runs: dict[int, tuple[int, Any]] = {}
+
+    def task_version(self, task_id: int) -> int:
+        return max(self._task_versions.get(task_id, 0), self._floor)
+
+    def run_version(self, run_id: int) -> int:
+        return max(self._run_versions.get(run_id, 0), self._floor)
+
+    def run_activity_version(self, run_id: int) -> int:
+        return max(self.run_version(run_id), self._run_activity.get(run_id, 0))
+
+    def events_version(self) -> int:
+        return max(self._events_version, self._floor)
+
+    def touch_task(self, task_id: int) -> None:
+        self._clock += 1
+        self._task_versions[task_id] = self._clock
+        for run_id in self._task_runs.get(task_id, ()):
+            self._run_versions[run_id] = self._clock
+
+    def touch_run(self, run_id: int, task_ids: Iterable[int] = ()) -> None:
+        self._clock += 1
+        self._run_versions[run_id] = self._clock
+        self.link_run(run_id, task_ids)
+
+    def link_run(self, run_id: int, task_ids: Iterable[int]) -> None:
+        for task_id in task_ids:
+            self._task_runs.setdefault(task_id, set()).add(run_id)
+
+    def touch_activity(self, *, run_ids: Iterable[int] = (), task_ids: Iterable[int] = ()) -> None:
+        self._clock += 1
+        for run_id in chain(run_ids, *(self._task_runs.get(task_id, ()) for task_id in task_ids)):
+            self._run_activity[run_id] = self._clock
+
+    def touch_events(self) -> None:
+        self._clock += 1
+        self._events_version = self._clock
+
+    def touch_all(self) -> None:
+        self._clock += 1
+        self._floor = self._clock
+        self._tasks.clear()
+        self._runs.clear()
+
+    def task(self, task_id: int, version: int) -> Any | None:
+        return self._lookup(self._tasks, task_id, version)
+
+    def run(self, run_id: int, version: int) -> Any | None:
+        return self._lookup(self._runs, run_id, version)
+
+    def put_task(self, task_id: int, version: int, read_model: Any) -> None:
+        self._tasks[task_id] = (version, read_model)
+
+    def put_run(self, run_id: int, version: int, read_model: Any) -> None:
+        self._runs[run_id] = (version, read_model)
+
+    def clear(self) -> None:
+        self.touch_all()
+        self._task_versions.clear()
+        self._run_versions.clear()
+        self._run_activity.clear()
+        self._task_runs.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_tasks": len(self._tasks),
+            "cached_runs": len(self._runs),
+        }
+
+    def _lookup(self, entries: dict[int, tuple[int, Any]], entity_id: int, version: int) -> Any | None:
+        entry = entries.get(entity_id)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+
+class _PathLockNode:
+    __slots__ = ("children", "owner", "path", "lock_count")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PathLockNode] = {}
+        self.owner: int | None = None
+        self.path: str | None = None
+        self.lock_count = 0
+
+
+class PathLockTrie:
+    def __init__(self) -> None:
+        self._root = _PathLockNode()
+
+    def rebuild(self, locks: Iterable[tuple[str, int]]) -> None:
+        self._root = _PathLockNode()
+        for path, owner in locks:
+            self.put(path, owner)
+
+    def put(self, path: str, owner: int) -> None:
+        nodes = self._walk(path, create=True)
+        node = nodes[-1]
+        if node.owner is None:
+            for ancestor in nodes:
+                ancestor.lock_count += 1
+        node.owner = owner
+        node.path = path
+
+    def discard(self, path: str, owner: int | None = None) -> bool:
+        nodes = self._walk(path, create=False)
+        if len(nodes) != len(PurePath(path).parts) + 1:
+            return False
+        node = nodes[-1]
+        if node.owner is None or (owner is not None and node.owner != owner):
+            return False
+        node.owner = None
+        node.path = None
+        for ancestor in nodes:
+            ancestor.lock_count -= 1
+        for parent, part in zip(reversed(nodes[:-1]), reversed(PurePath(path).parts)):
+            if parent.children[part].lock_count:
+                break
+            del parent.children[part]
+        return True
+
+    def release(self, paths: Iterable[str], owner: int) -> list[str]:
+        return [path for path in paths if self.discard(path, owner)]
+
+    def conflicts(self, path: str) -> list[tuple[str, int]]:
+        nodes = self._walk(path, create=False)
+        found = [(node.path, node.owner) for node in nodes if node.owner is not None and node.path is not None]
+        if len(nodes) == len(PurePath(path).parts) + 1:
+            stack = list(nodes[-1].children.values())
+            descendants: list[tuple[str, int]] = []
+            while stack:
+                node = stack.pop()
+                if node.owner is not None and node.path is not None:
+                    descendants.append((node.path, node.owner))
+                stack.extend(node.children.values())
+            found.extend(sorted(descendants))
+        return found
+
+    def _walk(self, path: str, *, create: bool) -> list[_PathLockNode]:
+        node = self._root
+        nodes = [node]
+        for part in PurePath(path).parts:
+            child = node.children.get(part)
+            if child is None:
+                if not create:
+                    break
+                child = node.children[part] = _PathLockNode()
+            node = child
+            nodes.append(node)
+        return nodes
+
+
+def _remove_sorted(keys: list[Any], key: Any) -> None:
+    position = bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
+
+
+def _insert_id(ids: list[int], entity_id: int) -> None:
+    if not ids or entity_id > ids[-1]:
+        ids.append(entity_id)
+    else:
+        insort(ids, entity_id)
+
+
+def id_page(
+    id_lists: Sequence[Sequence[int]],
+    *,
+    after_id: int | None = None,
+    limit: int | None = None,
+    matches: Callable[[int], bool] | None = None,
+) -> list[int]:
+    if limit is not None and limit <= 0:
+        return []
+    streams = [
+        map(ids.__getitem__, range(0 if after_id is None else bisect_right(ids, after_id), len(ids)))
+        for ids in id_lists
+    ]
+    selected: Iterable[int] = streams[0] if len(streams) == 1 else heapq.merge(*streams)
+    if matches is not None:
+        selected = filter(matches, selected)
+    return list(islice(selected, limit))
+
+
+def artifact_labels(artifact: ArtifactRead) -> set[str]:
+    labels: set[str] = set()
+    label_value = artifact.metadata.get("label")
+    if isinstance(label_value, str):
+        labels.add(label_value)
+    labels_value = artifact.metadata.get("labels")
+    if isinstance(labels_value, list):
+        labels.update(item for item in labels_value if isinstance(item, str))
+    return labels
+
+
+def _artifact_matches(
+    artifact: ArtifactRead,
+    *,
+    run_id: int | None,
+    task_id: int | None,
+    artifact_type: str | None,
+    producer_task_ids: set[int] | None,
+    label: str | None,
+) -> bool:
+    return (
+        (run_id is None or artifact.run_id == run_id)
+        and (task_id is None or artifact.task_id == task_id)
+        and (artifact_type is None or artifact.artifact_type.value == artifact_type)
+        and (producer_task_ids is None or artifact.producer_task_id in producer_task_ids)
+        and (label is None or label in artifact_labels(artifact))
+    )
+
+
+def _page(
+    positions: Sequence[int],
+    id_at: Callable[[int], int],
+    matches: Callable[[int], bool],
+    *,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    limit: int | None = None,
+) -> list[int]:
+    start = 0 if after_id is None else bisect_right(positions, after_id, key=id_at)
+    stop = len(positions) if before_id is None else bisect_left(positions, before_id, key=id_at)
+    steps = range(start, stop) if after_id is not None else range(stop - 1, start - 1, -1)
+    selected: list[int] = []
+    for step in steps:
+        if limit is not None and len(selected) >= limit:
+            break
+        position = positions[step]
+        if matches(position):
+            selected.append(position)
+    if after_id is None:
+        selected.reverse()
+    return selected
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def journal_path_for(state_file: Path) -> Path:
+    return state_file.with_name(f"{state_file.name}.journal")
+
+
+def encode_journal_entry(entry: dict[str, Any]) -> str:
+    return json.dumps(entry, ensure_ascii=True, separators=(",", ":")) + "\n"
+
+
+def append_journal_lines(journal_file: Path, lines: list[str], *, fsync: bool = False) -> int:
+    payload = "".join(lines)
+    journal_file.parent.mkdir(parents=True, exist_ok=True)
+    with journal_file.open("a", encoding="utf-8") as handle:
+        handle.write(payload)
+        handle.flush()
+        if fsync:
+            os.fsync(handle.fileno())
+    return len(payload)
+
+
+def truncate_journal(journal_file: Path, *, fsync: bool = False) -> None:
+    journal_file.parent.mkdir(parents=True, exist_ok=True)
+    with journal_file.open("w", encoding="utf-8") as handle:
+        if fsync:
+            os.fsync(handle.fileno())
+
+
+def read_journal_entries(journal_file: Path) -> list[dict[str, Any]]:
+    return read_jsonl_records(journal_file, label="journal entry")
+
+
+def read_jsonl_records(path: Path, *, label: str = "record") -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+
+    records: list[dict[str, Any]] = []
+    lines = path.read_bytes().splitlines(keepends=True)
+    complete_bytes = 0
+    for index, line in enumerate(lines):
+        torn = not line.endswith(b"\n")
+        if line.strip() and not torn:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                torn = True
+        if torn:
+            # A torn trailing line means the process died mid-append; everything before it is intact.
+            if index != len(lines) - 1:
+                raise ValueError(f"corrupted {label} at line {index + 1} in {path}")
+            _truncate_torn_tail(path, complete_bytes)
+            break
+        complete_bytes += len(line)
+    return records
+
+
+def _truncate_torn_tail(journal_file: Path, size: int) -> None:
+    with journal_file.open("r+b") as handle:
+        handle.truncate(size)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def apply_journal_entry(data: dict[str, Any], entry: dict[str, Any]) -> None:
+    for collection, items in entry.get("upserts", {}).items():
+        data.setdefault(collection, {}).update(items)
+    for collection, keys in entry.get("deletes", {}).items():
+        target = data.setdefault(collection, {})
+        for key in keys:
+            target.pop(key, None)
+    for collection in ("events", "artifacts"):
+        appended = entry.get(collection)
+        if appended:
+            data.setdefault(collection, []).extend(appended)
+    sequences = entry.get("sequences")
+    if sequences:
+        data["sequences"] = dict(sequences)
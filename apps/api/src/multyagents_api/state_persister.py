@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+DURABILITY_MODES: tuple[str, ...] = ("sync", "group", "async")
+
+
+class StatePersister:
+    def __init__(
+        self,
+        write_batch: Callable[[list[Any], bool], None],
+        *,
+        durability: str = "sync",
+        interval_ms: int = 5,
+        max_batch: int = 256,
+        retry_ms: int = 100,
+    ) -> None:
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"unknown durability '{durability}', expected one of: {', '.join(DURABILITY_MODES)}")
+        if interval_ms < 0:
+            raise ValueError("interval_ms must be >= 0")
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        if retry_ms < 0:
+            raise ValueError("retry_ms must be >= 0")
+        self.durability = durability
+        self.interval_ms = interval_ms
+        self.max_batch = max_batch
+        self.retry_ms = retry_ms
+        self.submitted_count = 0
+        self.batch_count = 0
+        self.failure_count = 0
+        self.last_error: Exception | None = None
+        self._write_batch = write_batch
+        self._fsync = durability == "group"
+        self._pending: list[Any] = []
+        self._unreported_error: Exception | None = None
+        self._retrying = False
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+    def submit(self, item: Any) -> None:
+        if self.durability == "sync":
+            self.submitted_count += 1
+            self.batch_count += 1
+            self._write_batch([item], self._fsync)
+            return
+
+        with self._condition:
+            self.submitted_count += 1
+            if self._closed:
+                self._pending.append(item)
+                if not self._writing:
+                    self._write_pending()
+                return
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="state-persister", daemon=True)
+                self._worker.start()
+            self._pending.append(item)
+            if len(self._pending) == 1 or len(self._pending) >= self.max_batch:
+                self._condition.notify_all()
+            self._raise_unreported_error()
+
+    def flush(self) -> None:
+        with self._condition:
+            if self._closed:
+                self._write_pending()
+                return
+            if self._worker is None:
+                return
+            failures = self.failure_count
+            self._flush_requested = True
+            self._condition.notify_all()
+            while (self._pending or self._writing) and self.failure_count == failures:
+                self._condition.wait()
+            self._flush_requested = False
+            self._raise_unreported_error()
+
+    def close(self, *, flush: bool = True) -> None:
+        with self._condition:
+            if not flush:
+                self._pending.clear()
+                self._unreported_error = None
+            self._closed = True
+            self._condition.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+        with self._condition:
+            self._raise_unreported_error()
+
+    def is_idle(self) -> bool:
+        with self._condition:
+            return not self._pending and not self._writing
+
+    def _write_pending(self) -> None:
+        while self._writing:
+            self._condition.wait()
+        self._raise_unreported_error()
+        if not self._pending:
+            return
+        batch = self._pending
+        self._pending = []
+        try:
+            self._write_batch(batch, self._fsync)
+        except Exception as exc:
+            self._pending = batch + self._pending
+            self.failure_count += 1
+            self.last_error = exc
+            raise
+        self.batch_count += 1
+
+    def _raise_unreported_error(self) -> None:
+        error = self._unreported_error
+        if error is not None:
+            self._unreported_error = None
+            raise error
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                delay_ms = self.retry_ms if self._retrying else self.interval_ms
+                deadline = time.monotonic() + delay_ms / 1000
+                while (
+                    (self._retrying or len(self._pending) < self.max_batch)
+                    and not self._closed
+                    and not self._flush_requested
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._pending
+                self._pending = []
+                self._writing = True
+                give_up = False
+            try:
+                self._write_batch(batch, self._fsync)
+            except Exception as exc:  # noqa: BLE001
+                with self._condition:
+                    self._pending = batch + self._pending
+                    self._retrying = True
+                    self.failure_count += 1
+                    self.last_error = exc
+                    self._unreported_error = exc
+                    give_up = self._closed
+            else:
+                with self._condition:
+                    self._retrying = False
+                    self.batch_count += 1
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+            if give_up:
+                return
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    collection TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (collection, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, id);
+CREATE TABLE IF NOT EXISTS workflow_runs (
+    id INTEGER PRIMARY KEY,
+    workflow_template_id INTEGER,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_workflow_runs_template ON workflow_runs (workflow_template_id, id);
+CREATE INDEX IF NOT EXISTS idx_workflow_runs_status ON workflow_runs (status, id);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER,
+    task_id INTEGER,
+    event_type TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_run ON events (run_id, id);
+CREATE INDEX IF NOT EXISTS idx_events_task ON events (task_id, id);
+CREATE INDEX IF NOT EXISTS idx_events_type ON events (event_type, id);
+CREATE INDEX IF NOT EXISTS idx_events_run_type ON events (run_id, event_type, id);
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER,
+    task_id INTEGER,
+    producer_task_id INTEGER NOT NULL,
+    artifact_type TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_run ON artifacts (run_id, producer_task_id, id);
+CREATE INDEX IF NOT EXISTS idx_artifacts_task ON artifacts (task_id, id);
+CREATE INDEX IF NOT EXISTS idx_artifacts_type ON artifacts (artifact_type, id);
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_ROW_TABLES = ("tasks", "workflow_runs")
+_IN_CHUNK = 500
+_SYNCHRONOUS_BY_DURABILITY = {"sync": "FULL", "group": "NORMAL", "async": "OFF"}
+
+
+def sqlite_path_for(state_file: Path) -> Path:
+    return state_file.with_name(f"{state_file.name}.sqlite3")
+
+
+def connect_state_database(database_file: Path | None, *, durability: str = "sync") -> sqlite3.Connection:
+    synchronous = _SYNCHRONOUS_BY_DURABILITY.get(durability)
+    if synchronous is None:
+        raise ValueError(f"unknown durability '{durability}'")
+    if database_file is None:
+        target = ":memory:"
+    else:
+        database_file.parent.mkdir(parents=True, exist_ok=True)
+        target = str(database_file)
+    connection = sqlite3.connect(target, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(f"PRAGMA synchronous={synchronous}")
+    connection.executescript(_SCHEMA)
+    connection.commit()
+    return connection
+
+
+def has_state(connection: sqlite3.Connection) -> bool:
+    return connection.execute("SELECT 1 FROM sequences LIMIT 1").fetchone() is not None
+
+
+def load_state_rows(connection: sqlite3.Connection, *, skip: tuple[str, ...] = ()) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for collection, key, raw in connection.execute("SELECT collection, key, data FROM records"):
+        if collection in skip:
+            continue
+        data.setdefault(collection, {})[key] = json.loads(raw)
+    for table in _ROW_TABLES:
+        if table in skip:
+            continue
+        data[table] = {str(row_id): json.loads(raw) for row_id, raw in connection.execute(f"SELECT id, data FROM {table}")}
+    data["sequences"] = dict(connection.execute("SELECT name, value FROM sequences").fetchall())
+    return data
+
+
+def row_statuses(connection: sqlite3.Connection, table: str) -> dict[int, str]:
+    return {int(row_id): status for row_id, status in connection.execute(f"SELECT id, status FROM {table} ORDER BY id")}
+
+
+def workflow_run_index_rows(connection: sqlite3.Connection) -> list[tuple[int, int | None, str, str, str]]:
+    return [
+        (int(run_id), template_id, status, created_at, updated_at)
+        for run_id, template_id, status, created_at, updated_at in connection.execute(
+            "SELECT id, workflow_template_id, status, json_extract(data, '$.created_at'), "
+            "json_extract(data, '$.updated_at') FROM workflow_runs"
+        )
+    ]
+
+
+def handoff_index_rows(connection: sqlite3.Connection) -> list[tuple[int, int | None, str, list[int]]]:
+    required: dict[int, list[int]] = {}
+    for key, artifact_id in connection.execute(
+        "SELECT records.key, json_extract(artifact.value, '$.artifact_id') "
+        "FROM records, json_each(records.data, '$.artifacts') AS artifact "
+        "WHERE records.collection = 'handoffs' AND json_extract(artifact.value, '$.is_required') "
+        "ORDER BY records.key, artifact.key"
+    ):
+        required.setdefault(int(key), []).append(int(artifact_id))
+    return [
+        (int(key), run_id, updated_at, required.get(int(key), []))
+        for key, run_id, updated_at in connection.execute(
+            "SELECT key, json_extract(data, '$.run_id'), json_extract(data, '$.updated_at') "
+            "FROM records WHERE collection = 'handoffs'"
+        )
+    ]
+
+
+def record_keys(connection: sqlite3.Connection, collection: str) -> list[str]:
+    return [key for (key,) in connection.execute("SELECT key FROM records WHERE collection = ?", (collection,))]
+
+
+def load_rows_by_id(connection: sqlite3.Connection, table: str, row_ids: list[int]) -> dict[int, Any]:
+    rows: dict[int, Any] = {}
+    for chunk in _chunks(sorted(row_ids)):
+        query = f"SELECT id, data FROM {table} WHERE id IN ({', '.join('?' for _ in chunk)}) ORDER BY id"
+        rows.update((int(row_id), json.loads(raw)) for row_id, raw in connection.execute(query, chunk))
+    return rows
+
+
+def load_records_by_key(connection: sqlite3.Connection, collection: str, keys: list[str]) -> dict[str, Any]:
+    records: dict[str, Any] = {}
+    for chunk in _chunks(keys):
+        query = f"SELECT key, data FROM records WHERE collection = ? AND key IN ({', '.join('?' for _ in chunk)})"
+        records.update((key, json.loads(raw)) for key, raw in connection.execute(query, [collection, *chunk]))
+    return records
+
+
+def write_state_changes(
+    connection: sqlite3.Connection,
+    *,
+    upserts: dict[str, dict[str, Any]],
+    deletes: dict[str, list[str]],
+    sequences: dict[str, int],
+) -> None:
+    for collection, items in upserts.items():
+        if collection == "tasks":
+            connection.executemany(
+                "INSERT OR REPLACE INTO tasks (id, status, data) VALUES (?, ?, ?)",
+                [(int(key), _text(value["status"]), _dumps(value)) for key, value in items.items()],
+            )
+        elif collection == "workflow_runs":
+            connection.executemany(
+                "INSERT OR REPLACE INTO workflow_runs (id, workflow_template_id, status, data) VALUES (?, ?, ?, ?)",
+                [
+                    (int(key), value.get("workflow_template_id"), _text(value["status"]), _dumps(value))
+                    for key, value in items.items()
+                ],
+            )
+        else:
+            connection.executemany(
+                "INSERT OR REPLACE INTO records (collection, key, data) VALUES (?, ?, ?)",
+                [(collection, key, _dumps(value)) for key, value in items.items()],
+            )
+    for collection, keys in deletes.items():
+        if collection in _ROW_TABLES:
+            connection.executemany(f"DELETE FROM {collection} WHERE id = ?", [(int(key),) for key in keys])
+        else:
+            connection.executemany(
+                "DELETE FROM records WHERE collection = ? AND key = ?",
+                [(collection, key) for key in keys],
+            )
+    connection.executemany(
+        "INSERT OR REPLACE INTO sequences (name, value) VALUES (?, ?)",
+        list(sequences.items()),
+    )
+
+
+def insert_event(connection: sqlite3.Connection, event: dict[str, Any]) -> None:
+    connection.execute(
+        "INSERT INTO events (id, run_id, task_id, event_type, data) VALUES (?, ?, ?, ?, ?)",
+        (event["id"], event["run_id"], event["task_id"], event["event_type"], _dumps(event)),
+    )
+
+
+def insert_artifact(connection: sqlite3.Connection, artifact: dict[str, Any]) -> None:
+    connection.execute(
+        "INSERT INTO artifacts (id, run_id, task_id, producer_task_id, artifact_type, data) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            artifact["id"],
+            artifact["run_id"],
+            artifact["task_id"],
+            artifact["producer_task_id"],
+            _text(artifact["artifact_type"]),
+            _dumps(artifact),
+        ),
+    )
+
+
+def history_run_ids(connection: sqlite3.Connection) -> set[int]:
+    rows = connection.execute(
+        "SELECT run_id FROM events WHERE run_id IS NOT NULL UNION SELECT run_id FROM artifacts WHERE run_id IS NOT NULL"
+    )
+    return {int(run_id) for (run_id,) in rows}
+
+
+def delete_run_history(connection: sqlite3.Connection, run_ids: set[int]) -> None:
+    params = [(run_id,) for run_id in sorted(run_ids)]
+    connection.executemany("DELETE FROM events WHERE run_id = ?", params)
+    connection.executemany("DELETE FROM artifacts WHERE run_id = ?", params)
+
+
+def select_rows(
+    connection: sqlite3.Connection,
+    table: str,
+    *,
+    filters: dict[str, Any],
+    in_filters: dict[str, list[Any]] | None = None,
+    created_since: str | None = None,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    for column, value in filters.items():
+        if value is None:
+            continue
+        clauses.append(f"{column} = ?")
+        params.append(value)
+    for column, values in (in_filters or {}).items():
+        clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+        params.extend(values)
+    if created_since is not None:
+        clauses.append("json_extract(data, '$.created_at') >= ?")
+        params.append(created_since)
+    if after_id is not None:
+        clauses.append("id > ?")
+        params.append(after_id)
+    if before_id is not None:
+        clauses.append("id < ?")
+        params.append(before_id)
+    query = f"SELECT data FROM {table}"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    # A forward cursor pages from the oldest match; otherwise the newest page is returned.
+    query += " ORDER BY id ASC" if after_id is not None else " ORDER BY id DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+    rows = [json.loads(raw) for (raw,) in connection.execute(query, params)]
+    if after_id is None:
+        rows.reverse()
+    return rows
+
+
+def _chunks(values: list[Any]) -> list[list[Any]]:
+    return [values[index : index + _IN_CHUNK] for index in range(0, len(values), _IN_CHUNK)]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=True, separators=(",", ":"))
+
+
+def _text(value: Any) -> str:
+    return value.value if isinstance(value, Enum) else str(value)
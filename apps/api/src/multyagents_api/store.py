@@ -1,15 +1,76 @@
 from __future__ import annotations
 
+import copy
+import functools
+import gc
+import hashlib
+import heapq
 import json
 import re
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator, Mapping
 
 from multyagents_api.context_policy import resolve_context7_enabled
 from multyagents_api.security import redact_sensitive_text
+from multyagents_api.state_archive import RunArchive, archive_path_for
+from multyagents_api.state_binary import Section, encode_binary_snapshot, is_binary_snapshot, read_binary_snapshot
+from multyagents_api.state_checksum import verify_checksum, verify_checksum_file, write_checksummed
+from multyagents_api.state_directory import (
+    DirectoryChange,
+    directory_path_for,
+    encode_record,
+    has_directory_state,
+    read_directory_state,
+    write_directory_changes,
+)
+from multyagents_api.state_events import ColumnarEventLog
+from multyagents_api.state_journal import (
+    append_journal_lines,
+    apply_journal_entry,
+    encode_journal_entry,
+    journal_path_for,
+    read_journal_entries,
+    truncate_journal,
+)
+from multyagents_api.state_index import (
+    ArtifactIndex,
+    DispatchCounters,
+    EventIndex,
+    HandoffIndex,
+    PathLockTrie,
+    PendingApprovalIndex,
+    ReadModelCache,
+    RunReadiness,
+    TaskIndex,
+    WorkflowRunIndex,
+    artifact_labels,
+    id_page,
+)
+from multyagents_api.state_persister import StatePersister
+from multyagents_api.state_sqlite import (
+    connect_state_database,
+    delete_run_history,
+    handoff_index_rows,
+    has_state,
+    history_run_ids,
+    insert_artifact,
+    insert_event,
+    load_records_by_key,
+    load_rows_by_id,
+    load_state_rows,
+    record_keys,
+    row_statuses,
+    select_rows,
+    workflow_run_index_rows,
+    sqlite_path_for,
+    write_state_changes,
+)
 from multyagents_api.schemas import (
     AssistantIntentPlanRequest,
     AssistantIntentPlanResponse,
@@ -21,6 +82,7 @@ from multyagents_api.schemas import (
     AssistantIntentStatusResponse,
     AssistantMachineSummary,
     AssistantPlanStepRead,
+    ApprovalBulkDecisionRequest,
     ApprovalRead,
     ApprovalStatus,
     ArtifactCreate,
@@ -54,10 +116,12 @@ from multyagents_api.schemas import (
     RunnerWorkspaceContext,
     RunnerSubmitPayload,
     TaskAudit,
+    TaskHandoffArtifactRef,
     TaskHandoffPayload,
     TaskHandoffRead,
     TaskCreate,
     TaskRead,
+    TaskCompactRead,
     TaskStatus,
     WorkflowRunCreate,
     WorkflowRunDispatchBlockedItem,
@@ -69,6 +133,7 @@ from multyagents_api.schemas import (
     WorkflowRunRead,
     WorkflowRunRoleMetric,
     WorkflowRunStepTaskOverride,
+    WorkflowRunCompactRead,
     WorkflowRunStatus,
     WorkflowStep,
     WorkflowTemplateCreate,
@@ -179,6 +244,396 @@ class _IsolatedSessionRecord:
     git_branch: str
 
 
+_MISSING = object()
+
+
+class _TrackedDict(dict):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.dirty_keys: set[Any] = set()
+        self.deleted_keys: set[Any] = set()
+        self.undo: dict[Any, Any] | None = None
+
+    def __getitem__(self, key: Any) -> Any:
+        if self.undo is not None:
+            self._remember(key)
+        return super().__getitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if self.undo is not None:
+            self._remember(key)
+        return super().get(key, default)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if self.undo is not None:
+            self._remember(key)
+        super().__setitem__(key, value)
+        self.dirty_keys.add(key)
+        self.deleted_keys.discard(key)
+
+    def __delitem__(self, key: Any) -> None:
+        if self.undo is not None:
+            self._remember(key)
+        super().__delitem__(key)
+        self.dirty_keys.discard(key)
+        self.deleted_keys.add(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key in self:
+            if self.undo is not None:
+                self._remember(key)
+            self.dirty_keys.discard(key)
+            self.deleted_keys.add(key)
+        return super().pop(key, *default)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        if self.undo is not None:
+            for key in list(self.keys()):
+                self._remember(key)
+        self.deleted_keys.update(self.keys())
+        self.dirty_keys.clear()
+        super().clear()
+
+    def many(self, keys: Iterable[Any]) -> list[Any]:
+        return [dict.__getitem__(self, key) for key in keys]
+
+    def reset_tracking(self) -> None:
+        self.dirty_keys.clear()
+        self.deleted_keys.clear()
+
+    def rollback_undo(self) -> None:
+        if not self.undo:
+            return
+        for key, value in self.undo.items():
+            if value is _MISSING:
+                dict.pop(self, key, None)
+            else:
+                dict.__setitem__(self, key, value)
+
+    def _remember(self, key: Any) -> None:
+        if key in self.undo:
+            return
+        value = dict.get(self, key, _MISSING)
+        self.undo[key] = value if value is _MISSING else copy.deepcopy(value)
+
+
+class _LazyRecordDict(_TrackedDict):
+    def __init__(
+        self,
+        *args: Any,
+        loader: Callable[[list[Any]], dict[Any, Any]],
+        cold_keys: Iterable[Any] = (),
+        capacity: int = 1024,
+    ) -> None:
+        super().__init__(*args)
+        self.loader = loader
+        self.cold_keys: set[Any] = set(cold_keys)
+        self.capacity = capacity
+        self.hydrations = 0
+        self._hydrated: dict[Any, None] = {}
+        self._hydrate_lock = threading.RLock()
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self.cold_keys
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self.cold_keys)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.keys())
+
+    def __getitem__(self, key: Any) -> Any:
+        self._hydrate(key)
+        return super().__getitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._hydrate(key)
+        return super().get(key, default)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._hydrate(key)
+        self._hydrated.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._hydrate(key)
+        self._hydrated.pop(key, None)
+        super().__delitem__(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        self._hydrate(key)
+        self._hydrated.pop(key, None)
+        return super().pop(key, *default)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def clear(self) -> None:
+        for key in list(self.cold_keys):
+            self._hydrate(key)
+        self._hydrated.clear()
+        super().clear()
+
+    def keys(self) -> list[Any]:  # type: ignore[override]
+        if not self.cold_keys:
+            return list(dict.keys(self))
+        return sorted([*dict.keys(self), *self.cold_keys])
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [value for _, value in self.items()]
+
+    def items(self) -> list[tuple[Any, Any]]:  # type: ignore[override]
+        if not self.cold_keys:
+            return list(dict.items(self))
+        # Cold records are loaded transiently so full scans do not flood the LRU.
+        cold = self.loader(sorted(self.cold_keys))
+        return [(key, dict.get(self, key, cold.get(key))) for key in self.keys() if dict.__contains__(self, key) or key in cold]
+
+    def many(self, keys: Iterable[Any]) -> list[Any]:
+        keys = list(keys)
+        cold_keys = [key for key in keys if key in self.cold_keys and not dict.__contains__(self, key)]
+        cold = self.loader(cold_keys) if cold_keys else {}
+        return [dict.get(self, key, cold.get(key)) for key in keys if dict.__contains__(self, key) or key in cold]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "resident": dict.__len__(self),
+            "cold": len(self.cold_keys),
+            "cached": len(self._hydrated),
+            "capacity": self.capacity,
+            "hydrations": self.hydrations,
+        }
+
+    def _hydrate(self, key: Any) -> None:
+        with self._hydrate_lock:
+            if key in self._hydrated:
+                self._hydrated[key] = self._hydrated.pop(key)
+                return
+            if key not in self.cold_keys:
+                return
+            value = self.loader([key]).get(key, _MISSING)
+            self.cold_keys.discard(key)
+            if value is _MISSING:
+                return
+            dict.__setitem__(self, key, value)
+            self._hydrated[key] = None
+            self.hydrations += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.undo is not None:
+            return
+        while len(self._hydrated) > self.capacity:
+            key = next(iter(self._hydrated))
+            del self._hydrated[key]
+            if key in self.dirty_keys:
+                continue
+            dict.pop(self, key, None)
+            self.cold_keys.add(key)
+
+
+def _restore_workflow_run(value: dict[str, Any]) -> _WorkflowRunRecord:
+    return _WorkflowRunRecord(
+        id=int(value["id"]),
+        workflow_template_id=value.get("workflow_template_id"),
+        task_ids=[int(task_id) for task_id in value.get("task_ids", [])],
+        status=value["status"],
+        initiated_by=value.get("initiated_by"),
+        created_at=value["created_at"],
+        updated_at=value["updated_at"],
+        step_dependencies={
+            int(task_id): [int(dep_task_id) for dep_task_id in dep_task_ids]
+            for task_id, dep_task_ids in value.get("step_dependencies", {}).items()
+        },
+        step_artifact_requirements={
+            int(task_id): [dict(requirement) for requirement in requirements]
+            for task_id, requirements in value.get("step_artifact_requirements", {}).items()
+        },
+    )
+
+
+@dataclass
+class _Savepoint:
+    undo: dict[str, dict[Any, Any] | None]
+    dirty_keys: dict[str, set[Any]]
+    deleted_keys: dict[str, set[Any]]
+    event_count: int
+    artifact_count: int
+    sequences: dict[str, int]
+    storage_token: Any = None
+
+
+def _unit_of_work(*, rollback_on_error: bool = True) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorate(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(self: InMemoryStore, *args: Any, **kwargs: Any) -> Any:
+            with self.transaction(rollback_on_error=rollback_on_error):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _serialized(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: InMemoryStore, *args: Any, **kwargs: Any) -> Any:
+        with self._transaction_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@dataclass(frozen=True)
+class _JournalCheckpoint:
+    lsn: int
+    payload: str | Iterable[bytes]
+
+
+@dataclass(frozen=True)
+class _SnapshotDue:
+    pass
+
+
+_SNAPSHOT_DUE = _SnapshotDue()
+
+
+_STATE_COLLECTIONS: tuple[str, ...] = (
+    "projects",
+    "skill_packs",
+    "roles",
+    "tasks",
+    "path_locks",
+    "task_locks",
+    "isolated_sessions",
+    "isolated_worktree_locks",
+    "isolated_branch_locks",
+    "workflow_templates",
+    "workflow_runs",
+    "task_latest_run",
+    "approvals",
+    "task_approval",
+    "audits",
+    "handoffs",
+)
+
+STATE_BACKENDS: tuple[str, ...] = ("snapshot", "journal", "directory", "sqlite")
+STATE_FORMATS: tuple[str, ...] = ("json", "binary")
+
+_TERMINAL_RUN_STATUSES: tuple[str, ...] = (
+    WorkflowRunStatus.SUCCESS.value,
+    WorkflowRunStatus.FAILED.value,
+    WorkflowRunStatus.ABORTED.value,
+)
+_LAZY_HISTORY_COLLECTIONS: tuple[str, ...] = ("workflow_runs", "tasks", "audits", "handoffs")
+_FAILED_TASK_STATUSES: frozenset[str] = frozenset(
+    {TaskStatus.FAILED.value, TaskStatus.CANCELED.value, TaskStatus.SUBMIT_FAILED.value}
+)
+_ACTIVE_TASK_STATUSES: frozenset[str] = frozenset(
+    {
+        TaskStatus.DISPATCHED.value,
+        TaskStatus.QUEUED.value,
+        TaskStatus.RUNNING.value,
+        TaskStatus.CANCEL_REQUESTED.value,
+    }
+)
+
+
+@functools.cache
+def _model_field_names(model: type[Any]) -> frozenset[str]:
+    return frozenset(model.model_fields)
+
+
+def _construct_trusted(model: type[Any], values: dict[str, Any]) -> Any:
+    field_names = _model_field_names(model)
+    if values.keys() != field_names:
+        return model(**values)
+    # Same shape model_construct() produces, without its per-field default handling.
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(field_names))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _trusted_artifact(value: dict[str, Any]) -> ArtifactRead:
+    return _construct_trusted(ArtifactRead, {**value, "artifact_type": ArtifactType(value["artifact_type"])})
+
+
+def _trusted_handoff(value: dict[str, Any]) -> TaskHandoffRead:
+    artifacts = [_construct_trusted(TaskHandoffArtifactRef, ref) for ref in value.get("artifacts", [])]
+    return _construct_trusted(TaskHandoffRead, {**value, "artifacts": artifacts})
+
+
+def _trusted_audit(value: dict[str, Any]) -> TaskAudit:
+    values = {
+        **value,
+        "context7_mode": Context7Mode(value["context7_mode"]),
+        "execution_mode": ExecutionMode(value["execution_mode"]),
+    }
+    if value.get("approval_status") is not None:
+        values["approval_status"] = ApprovalStatus(value["approval_status"])
+    if value.get("handoff") is not None:
+        values["handoff"] = _trusted_handoff(value["handoff"])
+    return _construct_trusted(TaskAudit, values)
+
+
+_TRUSTED_BUILDERS: dict[type[Any], Callable[[dict[str, Any]], Any]] = {
+    EventRead: functools.partial(_construct_trusted, EventRead),
+    ArtifactRead: _trusted_artifact,
+    TaskAudit: _trusted_audit,
+    TaskHandoffRead: _trusted_handoff,
+}
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Restoring large state allocates millions of containers; cyclic GC passes over them dominate load time.
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _merge_by_id(archived: list[Any], hot: list[Any]) -> list[Any]:
+    merged = {item.id: item for item in archived}
+    merged.update((item.id, item) for item in hot)
+    return [merged[key] for key in sorted(merged)]
+
+
+def _page_records(records: Mapping[int, Any], *, after_id: int | None, limit: int | None) -> list[Any]:
+    if after_id is None and limit is None:
+        return list(records.values())
+    return [records[key] for key in id_page([sorted(records)], after_id=after_id, limit=limit)]
+
+
+def _normalize_since(value: str | None) -> str | None:
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise ValidationError(f"invalid since timestamp '{value}'") from exc
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
 class InMemoryStore:
     _INTENT_KEYWORDS: dict[str, tuple[str, ...]] = {
         "feature": ("feature", "enhancement", "delivery"),
@@ -190,27 +645,100 @@ class InMemoryStore:
         "localization": ("localization", "localisation", "localized", "localised", "translation", "locale"),
     }
 
-    def __init__(self, state_file: str | None = None) -> None:
+    _supported_state_backends: tuple[str, ...] = ("snapshot", "journal", "directory")
+
+    def __init__(
+        self,
+        state_file: str | None = None,
+        *,
+        state_backend: str = "snapshot",
+        durability: str = "sync",
+        group_commit_interval_ms: int = 5,
+        group_commit_max_batch: int = 256,
+        journal_checkpoint_entries: int = 10_000,
+        journal_checkpoint_bytes: int = 64 * 1024 * 1024,
+        retention_max_age_s: float | None = None,
+        retention_hot_runs: int | None = None,
+        retention_check_interval_s: float = 60.0,
+        trusted_load: bool = True,
+        state_format: str = "json",
+    ) -> None:
+        if state_backend not in self._supported_state_backends:
+            raise ValueError(
+                f"unknown state backend '{state_backend}', expected one of: {', '.join(self._supported_state_backends)}"
+            )
+        if state_format not in STATE_FORMATS:
+            raise ValueError(f"unknown state format '{state_format}', expected one of: {', '.join(STATE_FORMATS)}")
+        if journal_checkpoint_entries < 1:
+            raise ValueError("journal_checkpoint_entries must be >= 1")
+        if journal_checkpoint_bytes < 1:
+            raise ValueError("journal_checkpoint_bytes must be >= 1")
+        if retention_max_age_s is not None and retention_max_age_s < 0:
+            raise ValueError("retention_max_age_s must be >= 0")
+        if retention_hot_runs is not None and retention_hot_runs < 0:
+            raise ValueError("retention_hot_runs must be >= 0")
+        if retention_check_interval_s < 0:
+            raise ValueError("retention_check_interval_s must be >= 0")
         self._state_file = Path(state_file).expanduser() if state_file else None
+        self._state_backend = state_backend
+        self._state_format = state_format
+        self._journal_file = journal_path_for(self._state_file) if self._state_file is not None else None
+        self._state_dir = (
+            directory_path_for(self._state_file)
+            if self._state_file is not None and state_backend == "directory"
+            else None
+        )
+        self._archive = RunArchive(archive_path_for(self._state_file)) if self._state_file is not None else None
+        self._archived_run_ids: set[int] = self._archive.run_ids if self._archive is not None else set()
+        self._retention_max_age_s = retention_max_age_s
+        self._retention_hot_runs = retention_hot_runs
+        self._retention_check_interval_s = retention_check_interval_s
+        self._last_retention_check = time.monotonic()
+        self._trusted_load = trusted_load
+        self._load_mode: str | None = None
+        self._transaction_lock = threading.RLock()
+        self._transaction_depth = 0
+        self._journal_checkpoint_entries = journal_checkpoint_entries
+        self._journal_checkpoint_bytes = journal_checkpoint_bytes
+        self._journal_lsn = 0
+        self._journal_tail_entries = 0
+        self._journal_tail_bytes = 0
+        self._persister = StatePersister(
+            self._write_state_batch,
+            durability=durability,
+            interval_ms=group_commit_interval_ms,
+            max_batch=group_commit_max_batch,
+        )
         self._skills_catalog = self._load_skills_catalog()
-        self._projects: dict[int, _ProjectRecord] = {}
-        self._skill_packs: dict[int, _SkillPackRecord] = {}
-        self._roles: dict[int, _RoleRecord] = {}
-        self._tasks: dict[int, _TaskRecord] = {}
-        self._path_locks: dict[str, int] = {}
-        self._task_locks: dict[int, list[str]] = {}
-        self._workflow_templates: dict[int, _WorkflowTemplateRecord] = {}
-        self._workflow_runs: dict[int, _WorkflowRunRecord] = {}
-        self._task_latest_run: dict[int, int] = {}
-        self._approvals: dict[int, _ApprovalRecord] = {}
-        self._task_approval: dict[int, int] = {}
-        self._isolated_sessions: dict[int, _IsolatedSessionRecord] = {}
-        self._isolated_worktree_locks: dict[str, int] = {}
-        self._isolated_branch_locks: dict[str, int] = {}
-        self._audits: dict[int, TaskAudit] = {}
-        self._handoffs: dict[int, TaskHandoffRead] = {}
-        self._events: list[EventRead] = []
+        self._projects: dict[int, _ProjectRecord] = _TrackedDict()
+        self._skill_packs: dict[int, _SkillPackRecord] = _TrackedDict()
+        self._roles: dict[int, _RoleRecord] = _TrackedDict()
+        self._tasks: dict[int, _TaskRecord] = _TrackedDict()
+        self._path_locks: dict[str, int] = _TrackedDict()
+        self._task_locks: dict[int, list[str]] = _TrackedDict()
+        self._workflow_templates: dict[int, _WorkflowTemplateRecord] = _TrackedDict()
+        self._workflow_runs: dict[int, _WorkflowRunRecord] = _TrackedDict()
+        self._task_latest_run: dict[int, int] = _TrackedDict()
+        self._approvals: dict[int, _ApprovalRecord] = _TrackedDict()
+        self._task_approval: dict[int, int] = _TrackedDict()
+        self._isolated_sessions: dict[int, _IsolatedSessionRecord] = _TrackedDict()
+        self._isolated_worktree_locks: dict[str, int] = _TrackedDict()
+        self._isolated_branch_locks: dict[str, int] = _TrackedDict()
+        self._audits: dict[int, TaskAudit] = _TrackedDict()
+        self._handoffs: dict[int, TaskHandoffRead] = _TrackedDict()
+        self._events = ColumnarEventLog()
+        self._event_index = EventIndex()
         self._artifacts: list[ArtifactRead] = []
+        self._artifact_index = ArtifactIndex()
+        self._run_index = WorkflowRunIndex()
+        self._task_index = TaskIndex()
+        self._lock_trie = PathLockTrie()
+        self._dispatch_counters = DispatchCounters(self._task_role_id)
+        self._pending_approvals = PendingApprovalIndex()
+        self._handoff_index = HandoffIndex()
+        self._read_models = ReadModelCache()
+        self._readiness: dict[int, RunReadiness] = {}
+        self._readiness_watchers: dict[int, set[int]] = {}
         self._project_seq = 1
         self._skill_pack_seq = 1
         self._role_seq = 1
@@ -220,8 +748,14 @@ class InMemoryStore:
         self._approval_seq = 1
         self._event_seq = 1
         self._artifact_seq = 1
-        self._load_state()
-
+        self._flushed_event_seq = 1
+        self._flushed_artifact_seq = 1
+        with _gc_paused():
+            self._load_state()
+        self._flushed_event_seq = self._event_seq
+        self._flushed_artifact_seq = self._artifact_seq
+
+    @_serialized
     def create_skill_pack(self, pack: SkillPackCreate) -> SkillPackRead:
         self._validate_skill_pack(name=pack.name, skills=pack.skills)
         if any(record.name == pack.name for record in self._skill_packs.values()):
@@ -243,6 +777,7 @@ class InMemoryStore:
             raise NotFoundError(f"skill pack {pack_id} not found")
         return self._to_skill_pack_read(record)
 
+    @_serialized
     def update_skill_pack(self, pack_id: int, pack: SkillPackUpdate) -> SkillPackRead:
         if pack_id not in self._skill_packs:
             raise NotFoundError(f"skill pack {pack_id} not found")
@@ -255,6 +790,7 @@ class InMemoryStore:
         self._persist_state()
         return self._to_skill_pack_read(updated)
 
+    @_serialized
     def delete_skill_pack(self, pack_id: int) -> None:
         record = self._skill_packs.get(pack_id)
         if record is None:
@@ -265,6 +801,7 @@ class InMemoryStore:
         del self._skill_packs[pack_id]
         self._persist_state()
 
+    @_serialized
     def create_project(self, project: ProjectCreate) -> ProjectRead:
         root = Path(project.root_path)
         try:
@@ -291,7 +828,7 @@ class InMemoryStore:
             allowed_paths=record.allowed_paths,
         )
 
-    def list_projects(self) -> list[ProjectRead]:
+    def list_projects(self, *, after_id: int | None = None, limit: int | None = None) -> list[ProjectRead]:
         return [
             ProjectRead(
                 id=record.id,
@@ -299,7 +836,7 @@ class InMemoryStore:
                 root_path=record.root_path,
                 allowed_paths=record.allowed_paths,
             )
-            for record in self._projects.values()
+            for record in _page_records(self._projects, after_id=after_id, limit=limit)
         ]
 
     def get_project(self, project_id: int) -> ProjectRead:
@@ -313,6 +850,7 @@ class InMemoryStore:
             allowed_paths=record.allowed_paths,
         )
 
+    @_serialized
     def update_project(self, project_id: int, project: ProjectCreate) -> ProjectRead:
         if project_id not in self._projects:
             raise NotFoundError(f"project {project_id} not found")
@@ -332,6 +870,7 @@ class InMemoryStore:
             allowed_paths=updated.allowed_paths,
         )
 
+    @_serialized
     def delete_project(self, project_id: int) -> None:
         if project_id not in self._projects:
             raise NotFoundError(f"project {project_id} not found")
@@ -344,6 +883,7 @@ class InMemoryStore:
         del self._projects[project_id]
         self._persist_state()
 
+    @_serialized
     def create_workflow_template(self, workflow: WorkflowTemplateCreate) -> WorkflowTemplateRead:
         if workflow.project_id is not None and workflow.project_id not in self._projects:
             raise NotFoundError(f"project {workflow.project_id} not found")
@@ -368,7 +908,12 @@ class InMemoryStore:
             steps=record.steps,
         )
 
-    def list_workflow_templates(self) -> list[WorkflowTemplateRead]:
+    def list_workflow_templates(
+        self,
+        *,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[WorkflowTemplateRead]:
         return [
             WorkflowTemplateRead(
                 id=record.id,
@@ -376,7 +921,7 @@ class InMemoryStore:
                 project_id=record.project_id,
                 steps=record.steps,
             )
-            for record in self._workflow_templates.values()
+            for record in _page_records(self._workflow_templates, after_id=after_id, limit=limit)
         ]
 
     def get_workflow_template(self, workflow_template_id: int) -> WorkflowTemplateRead:
@@ -467,6 +1012,7 @@ class InMemoryStore:
             recommendations=recommendations[: payload.limit],
         )
 
+    @_serialized
     def update_workflow_template(self, workflow_template_id: int, workflow: WorkflowTemplateCreate) -> WorkflowTemplateRead:
         if workflow_template_id not in self._workflow_templates:
             raise NotFoundError(f"workflow template {workflow_template_id} not found")
@@ -483,6 +1029,7 @@ class InMemoryStore:
             steps=workflow.steps,
         )
         self._workflow_templates[workflow_template_id] = updated
+        self._read_models.touch_activity(run_ids=self._run_index.template_run_ids(workflow_template_id))
         self._persist_state()
         return WorkflowTemplateRead(
             id=updated.id,
@@ -491,12 +1038,15 @@ class InMemoryStore:
             steps=updated.steps,
         )
 
+    @_serialized
     def delete_workflow_template(self, workflow_template_id: int) -> None:
         if workflow_template_id not in self._workflow_templates:
             raise NotFoundError(f"workflow template {workflow_template_id} not found")
         del self._workflow_templates[workflow_template_id]
+        self._read_models.touch_activity(run_ids=self._run_index.template_run_ids(workflow_template_id))
         self._persist_state()
 
+    @_unit_of_work()
     def create_workflow_run(self, run: WorkflowRunCreate) -> WorkflowRunRead:
         if run.workflow_template_id is not None and run.workflow_template_id not in self._workflow_templates:
             raise NotFoundError(f"workflow template {run.workflow_template_id} not found")
@@ -573,10 +1123,14 @@ class InMemoryStore:
             step_dependencies=step_dependencies,
             step_artifact_requirements=step_artifact_requirements,
         )
-        self._workflow_runs[run_id] = record
+        self._put_workflow_run(record)
+        self._dispatch_counters.load(run_id, [])
 
         for task_id in resolved_task_ids:
             self._task_latest_run[task_id] = run_id
+            approval_id = self._task_approval.get(task_id)
+            if approval_id is not None and approval_id in self._pending_approvals:
+                self._sync_pending_approval(approval_id)
 
         self._append_event(
             event_type="workflow_run.created",
@@ -590,8 +1144,129 @@ class InMemoryStore:
         self._persist_state()
         return self._to_workflow_run_read(record)
 
-    def list_workflow_runs(self) -> list[WorkflowRunRead]:
-        return [self._to_workflow_run_read(record) for record in self._workflow_runs.values()]
+    def list_workflow_runs(
+        self,
+        *,
+        workflow_template_id: int | None = None,
+        statuses: list[WorkflowRunStatus] | None = None,
+        since: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[WorkflowRunRead]:
+        records = self._select_workflow_run_records(
+            workflow_template_id=workflow_template_id,
+            statuses=statuses,
+            since=since,
+            after_id=after_id,
+            limit=limit,
+        )
+        return [self._to_workflow_run_read(record) for record in records]
+
+    def list_compact_workflow_runs(
+        self,
+        *,
+        workflow_template_id: int | None = None,
+        statuses: list[WorkflowRunStatus] | None = None,
+        since: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[WorkflowRunCompactRead]:
+        records = self._select_workflow_run_records(
+            workflow_template_id=workflow_template_id,
+            statuses=statuses,
+            since=since,
+            after_id=after_id,
+            limit=limit,
+        )
+        return [self._to_workflow_run_compact_read(record) for record in records]
+
+    def _select_workflow_run_records(
+        self,
+        *,
+        workflow_template_id: int | None,
+        statuses: list[WorkflowRunStatus] | None,
+        since: str | None,
+        after_id: int | None,
+        limit: int | None,
+    ) -> list[_WorkflowRunRecord]:
+        run_ids = self._run_index.select(
+            template_id=workflow_template_id,
+            statuses=[status.value for status in statuses] if statuses is not None else None,
+            since=_normalize_since(since),
+            after_id=after_id,
+            limit=limit,
+        )
+        return self._workflow_runs.many(run_ids)
+
+    def _put_workflow_run(self, record: _WorkflowRunRecord) -> None:
+        self._workflow_runs[record.id] = record
+        self._run_index.put(
+            record.id, record.workflow_template_id, record.status, record.created_at, record.updated_at
+        )
+        self._read_models.touch_run(record.id, record.task_ids)
+        self._retire_run_readiness(record)
+
+    def _put_audit(self, task_id: int, audit: TaskAudit) -> None:
+        self._audits[task_id] = audit
+        self._read_models.touch_task(task_id)
+
+    def _put_task(self, record: _TaskRecord) -> None:
+        self._tasks[record.id] = record
+        self._task_index.put(record.id, record.status)
+        self._read_models.touch_task(record.id)
+        for run_id in self._readiness_watchers.get(record.id, ()):
+            self._readiness[run_id].update(record.id, record.status)
+
+    def _run_readiness(self, run: _WorkflowRunRecord) -> RunReadiness:
+        readiness = self._readiness.get(run.id)
+        if (
+            readiness is not None
+            and readiness.task_ids is run.task_ids
+            and readiness.dependencies is run.step_dependencies
+        ):
+            return readiness
+        self._drop_run_readiness(run.id)
+        statuses: dict[int, str | None] = {}
+        for task_id in RunReadiness.watch_ids(run.task_ids, run.step_dependencies):
+            task = self._tasks.get(task_id)
+            statuses[task_id] = task.status if task is not None else None
+        readiness = RunReadiness(run.task_ids, run.step_dependencies, statuses)
+        if self._is_retired_run(run, readiness):
+            return readiness
+        self._readiness[run.id] = readiness
+        for task_id in statuses:
+            self._readiness_watchers.setdefault(task_id, set()).add(run.id)
+        return readiness
+
+    def _retire_run_readiness(self, run: _WorkflowRunRecord) -> None:
+        readiness = self._readiness.get(run.id)
+        if readiness is not None and self._is_retired_run(run, readiness):
+            self._drop_run_readiness(run.id)
+
+    @staticmethod
+    def _is_retired_run(run: _WorkflowRunRecord, readiness: RunReadiness) -> bool:
+        if run.status == WorkflowRunStatus.ABORTED.value:
+            return True
+        return run.status in _TERMINAL_RUN_STATUSES and not readiness.has_active_tasks()
+
+    def _drop_run_readiness(self, run_id: int) -> None:
+        readiness = self._readiness.pop(run_id, None)
+        if readiness is None:
+            return
+        for task_id in readiness.watched_task_ids():
+            watchers = self._readiness_watchers.get(task_id)
+            if watchers is not None:
+                watchers.discard(run_id)
+                if not watchers:
+                    del self._readiness_watchers[task_id]
+
+    def _reset_run_readiness(self) -> None:
+        self._readiness.clear()
+        self._readiness_watchers.clear()
+
+    def _task_role_id(self, task_id: int) -> int | None:
+        task = self._tasks.get(task_id)
+        return task.role_id if task is not None else None
 
     def get_workflow_run(self, run_id: int) -> WorkflowRunRead:
         record = self._workflow_runs.get(run_id)
@@ -599,6 +1274,47 @@ class InMemoryStore:
             raise NotFoundError(f"workflow run {run_id} not found")
         return self._to_workflow_run_read(record)
 
+    def workflow_run_version(self, run_id: int) -> str:
+        if run_id not in self._workflow_runs:
+            raise NotFoundError(f"workflow run {run_id} not found")
+        return f"{run_id}-{self._read_models.epoch}-{self._read_models.run_version(run_id)}"
+
+    def workflow_run_summary_version(self, run_id: int) -> str:
+        if run_id not in self._workflow_runs:
+            raise NotFoundError(f"workflow run {run_id} not found")
+        return f"{run_id}-{self._read_models.epoch}-{self._read_models.run_activity_version(run_id)}"
+
+    def events_version(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        event_type: str | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        run_ids: list[int] | None = None,
+        since: str | None = None,
+        limit: int = 200,
+    ) -> str:
+        query = {
+            "run_id": run_id,
+            "task_id": task_id,
+            "event_type": event_type,
+            "after_id": after_id,
+            "before_id": before_id,
+            "run_ids": sorted(set(run_ids)) if run_ids is not None else None,
+            "since": _normalize_since(since),
+            "limit": max(limit, 0),
+        }
+        digest = hashlib.sha256(json.dumps(query, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return f"{self._read_models.epoch}-{self._read_models.events_version()}-{digest}"
+
+    def get_compact_workflow_run(self, run_id: int) -> WorkflowRunCompactRead:
+        record = self._workflow_runs.get(run_id)
+        if record is None:
+            raise NotFoundError(f"workflow run {run_id} not found")
+        return self._to_workflow_run_compact_read(record)
+
     def plan_assistant_intent(self, payload: AssistantIntentPlanRequest) -> AssistantIntentPlanResponse:
         template = self._workflow_templates.get(payload.workflow_template_id)
         if template is None:
@@ -628,6 +1344,35 @@ class InMemoryStore:
         *,
         submitter: Callable[[RunnerSubmitPayload], RunnerSubmission],
     ) -> AssistantIntentStartResponse:
+        plan, run, dispatch_candidates, blocked_by_approval_task_ids = self._open_assistant_run(payload)
+
+        dispatches: list[DispatchResponse] = []
+        for task_id, consumed_artifact_ids in dispatch_candidates:
+            dispatch_result = self.dispatch_task(task_id, consumed_artifact_ids=consumed_artifact_ids)
+            runner_submission = submitter(dispatch_result.runner_payload)
+            self.apply_runner_submission(task_id, runner_submission)
+            dispatches.append(
+                DispatchResponse(
+                    task_id=dispatch_result.task_id,
+                    resolved_context7_enabled=dispatch_result.resolved_context7_enabled,
+                    runner_payload=dispatch_result.runner_payload,
+                    runner_submission=runner_submission,
+                )
+            )
+
+        machine_summary = self._build_assistant_machine_summary(run_id=run.id, phase="start")
+        return AssistantIntentStartResponse(
+            run=self.get_workflow_run(run.id),
+            steps=plan.steps,
+            dispatches=dispatches,
+            blocked_by_approval_task_ids=blocked_by_approval_task_ids,
+            machine_summary=machine_summary,
+        )
+
+    @_unit_of_work()
+    def _open_assistant_run(
+        self, payload: AssistantIntentStartRequest
+    ) -> tuple[AssistantIntentPlanResponse, WorkflowRunRead, list[tuple[int, list[int]]], list[int]]:
         plan = self.plan_assistant_intent(
             AssistantIntentPlanRequest(
                 workflow_template_id=payload.workflow_template_id,
@@ -642,48 +1387,23 @@ class InMemoryStore:
                 step_task_overrides=payload.step_task_overrides,
             )
         )
+        if not payload.dispatch_ready:
+            return plan, run, [], []
 
-        dispatches: list[DispatchResponse] = []
-        blocked_by_approval_task_ids: list[int] = []
-        if payload.dispatch_ready:
-            dispatch_candidates, blocked_by_approval_task_ids = self._assistant_dispatch_candidates(run.id)
-            for task_id in blocked_by_approval_task_ids:
-                approval_status = self._approval_status_for_task(task_id)
-                approval_id = self._task_approval.get(task_id)
-                self._append_event(
-                    event_type="task.dispatch_blocked_by_approval",
-                    run_id=run.id,
-                    task_id=task_id,
-                    payload={
-                        "approval_id": approval_id,
-                        "status": approval_status.value if approval_status is not None else None,
-                    },
-                )
-
-            for task_id, consumed_artifact_ids in dispatch_candidates:
-                dispatch_result = self.dispatch_task(task_id, consumed_artifact_ids=consumed_artifact_ids)
-                runner_submission = submitter(dispatch_result.runner_payload)
-                self.apply_runner_submission(task_id, runner_submission)
-                dispatches.append(
-                    DispatchResponse(
-                        task_id=dispatch_result.task_id,
-                        resolved_context7_enabled=dispatch_result.resolved_context7_enabled,
-                        runner_payload=dispatch_result.runner_payload,
-                        runner_submission=runner_submission,
-                    )
-                )
-
-            if blocked_by_approval_task_ids and not dispatch_candidates:
-                self._persist_state()
-
-        machine_summary = self._build_assistant_machine_summary(run_id=run.id, phase="start")
-        return AssistantIntentStartResponse(
-            run=self.get_workflow_run(run.id),
-            steps=plan.steps,
-            dispatches=dispatches,
-            blocked_by_approval_task_ids=blocked_by_approval_task_ids,
-            machine_summary=machine_summary,
-        )
+        dispatch_candidates, blocked_by_approval_task_ids = self._assistant_dispatch_candidates(run.id)
+        for task_id in blocked_by_approval_task_ids:
+            approval_status = self._approval_status_for_task(task_id)
+            approval_id = self._task_approval.get(task_id)
+            self._append_event(
+                event_type="task.dispatch_blocked_by_approval",
+                run_id=run.id,
+                task_id=task_id,
+                payload={
+                    "approval_id": approval_id,
+                    "status": approval_status.value if approval_status is not None else None,
+                },
+            )
+        return plan, run, dispatch_candidates, blocked_by_approval_task_ids
 
     def status_assistant_intent(self, payload: AssistantIntentStatusRequest) -> AssistantIntentStatusResponse:
         run = self.get_workflow_run(payload.run_id)
@@ -717,15 +1437,19 @@ class InMemoryStore:
             machine_summary=machine_summary,
         )
 
+    @_serialized
     def pause_workflow_run(self, run_id: int) -> WorkflowRunRead:
         return self._set_workflow_run_status(run_id, WorkflowRunStatus.PAUSED, "workflow_run.paused")
 
+    @_serialized
     def resume_workflow_run(self, run_id: int) -> WorkflowRunRead:
         return self._set_workflow_run_status(run_id, WorkflowRunStatus.RUNNING, "workflow_run.resumed")
 
+    @_serialized
     def abort_workflow_run(self, run_id: int) -> WorkflowRunRead:
         return self._set_workflow_run_status(run_id, WorkflowRunStatus.ABORTED, "workflow_run.aborted")
 
+    @_serialized
     def next_dispatchable_task_id(self, run_id: int) -> tuple[int | None, str | None, list[int]]:
         run = self._workflow_runs.get(run_id)
         if run is None:
@@ -736,37 +1460,24 @@ class InMemoryStore:
         if run.status == WorkflowRunStatus.PAUSED.value:
             raise ConflictError(f"workflow run {run_id} is paused")
 
-        dependency_blocked = False
+        readiness = self._run_readiness(run)
         artifact_blocked = False
         blocked_task_id: int | None = None
         blocked_requirements: list[dict[str, Any]] = []
-        for task_id in run.task_ids:
-            task = self._tasks.get(task_id)
-            if task is None:
-                continue
-            if task.status not in (TaskStatus.CREATED.value, TaskStatus.SUBMIT_FAILED.value):
+        for task_id in readiness.ready_task_ids():
+            consumed_artifact_ids, missing_requirements = self._resolve_handoff_artifacts(
+                run_id=run.id,
+                task_id=task_id,
+            )
+            if consumed_artifact_ids is None:
+                artifact_blocked = True
+                if blocked_task_id is None:
+                    blocked_task_id = task_id
+                    blocked_requirements = missing_requirements
                 continue
+            return task_id, None, consumed_artifact_ids
 
-            dependencies = run.step_dependencies.get(task_id, [])
-            if all(
-                self._tasks.get(dep_task_id) is not None
-                and self._tasks[dep_task_id].status == TaskStatus.SUCCESS.value
-                for dep_task_id in dependencies
-            ):
-                consumed_artifact_ids, missing_requirements = self._resolve_handoff_artifacts(
-                    run_id=run.id,
-                    task_id=task_id,
-                )
-                if consumed_artifact_ids is None:
-                    artifact_blocked = True
-                    if blocked_task_id is None:
-                        blocked_task_id = task_id
-                        blocked_requirements = missing_requirements
-                    continue
-                return task_id, None, consumed_artifact_ids
-            dependency_blocked = True
-
-        if dependency_blocked:
+        if readiness.has_blocked_pending():
             return None, "dependencies not satisfied", []
         if artifact_blocked:
             if blocked_task_id is not None:
@@ -783,7 +1494,16 @@ class InMemoryStore:
         run = self._workflow_runs.get(run_id)
         if run is None:
             raise NotFoundError(f"workflow run {run_id} not found")
+        return self._build_dispatch_plan(run, max_tasks=max_tasks)
 
+    def _build_dispatch_plan(
+        self,
+        run: _WorkflowRunRecord,
+        *,
+        max_tasks: int,
+        approval_statuses: dict[int, ApprovalStatus | None] | None = None,
+    ) -> WorkflowRunDispatchPlan:
+        run_id = run.id
         if max_tasks <= 0:
             return WorkflowRunDispatchPlan()
 
@@ -807,27 +1527,23 @@ class InMemoryStore:
             )
             return plan
 
-        for task_id in run.task_ids:
-            task = self._tasks.get(task_id)
-            if task is None:
-                continue
-            if task.status not in (TaskStatus.CREATED.value, TaskStatus.SUBMIT_FAILED.value):
-                continue
-
-            dependencies = run.step_dependencies.get(task_id, [])
-            unresolved_dependencies: list[dict[str, Any]] = []
-            for dependency_task_id in dependencies:
-                dependency_task = self._tasks.get(dependency_task_id)
-                dependency_status = (
-                    dependency_task.status
-                    if dependency_task is not None
-                    else "missing"
-                )
-                if dependency_status != TaskStatus.SUCCESS.value:
-                    unresolved_dependencies.append(
-                        {"task_id": dependency_task_id, "status": dependency_status}
+        readiness = self._run_readiness(run)
+        artifact_matches: dict[tuple[Any, ...], tuple[list[int] | None, dict[str, Any] | None]] = {}
+        for task_id in readiness.pending_task_ids():
+            task = self._tasks[task_id]
+            if task_id not in readiness.ready:
+                unresolved_dependencies: list[dict[str, Any]] = []
+                for dependency_task_id in run.step_dependencies.get(task_id, []):
+                    dependency_task = self._tasks.get(dependency_task_id)
+                    dependency_status = (
+                        dependency_task.status
+                        if dependency_task is not None
+                        else "missing"
                     )
-            if unresolved_dependencies:
+                    if dependency_status != TaskStatus.SUCCESS.value:
+                        unresolved_dependencies.append(
+                            {"task_id": dependency_task_id, "status": dependency_status}
+                        )
                 plan.blocked.append(
                     WorkflowRunDispatchBlockedItem(
                         task_id=task_id,
@@ -840,6 +1556,7 @@ class InMemoryStore:
             consumed_artifact_ids, missing_requirements = self._resolve_handoff_artifacts(
                 run_id=run_id,
                 task_id=task_id,
+                matches=artifact_matches,
             )
             if consumed_artifact_ids is None:
                 plan.blocked.append(
@@ -851,7 +1568,10 @@ class InMemoryStore:
                 )
                 continue
 
-            approval_status = self._approval_status_for_task(task_id)
+            if approval_statuses is not None and task_id in approval_statuses:
+                approval_status = approval_statuses[task_id]
+            else:
+                approval_status = self._approval_status_for_task(task_id)
             if task.requires_approval and approval_status != ApprovalStatus.APPROVED:
                 approval_id = self._task_approval.get(task_id)
                 plan.blocked.append(
@@ -884,6 +1604,7 @@ class InMemoryStore:
             )
         return plan
 
+    @_unit_of_work()
     def partial_rerun_workflow_run(
         self,
         run_id: int,
@@ -1001,8 +1722,8 @@ class InMemoryStore:
             task.exit_code = None
             task.stdout = None
             task.stderr = None
-            self._tasks[task_id] = task
-            self._handoffs.pop(task_id, None)
+            self._put_task(task)
+            self._drop_handoff(task_id)
             self._apply_partial_rerun_audit(
                 task_id=task_id,
                 run_id=run_id,
@@ -1034,7 +1755,7 @@ class InMemoryStore:
             step_dependencies=run.step_dependencies,
             step_artifact_requirements=run.step_artifact_requirements,
         )
-        self._workflow_runs[run_id] = updated_run
+        self._put_workflow_run(updated_run)
         self._append_event(
             event_type="workflow_run.partial_rerun_requested",
             run_id=run_id,
@@ -1058,38 +1779,29 @@ class InMemoryStore:
         if run is None:
             raise NotFoundError(f"workflow run {run_id} not found")
 
-        status_counts: dict[str, int] = {}
+        status_counts = dict(self._run_readiness(run).status_counts)
         successful_task_ids: list[int] = []
         failed_task_ids: list[int] = []
         active_task_ids: list[int] = []
         pending_task_ids: list[int] = []
         task_summaries: list[WorkflowRunExecutionTaskSummary] = []
+        approval_statuses: dict[int, ApprovalStatus | None] = {}
 
         for task_id in run.task_ids:
             task = self._tasks.get(task_id)
             if task is None:
                 continue
 
-            status_counts[task.status] = status_counts.get(task.status, 0) + 1
             if task.status == TaskStatus.SUCCESS.value:
                 successful_task_ids.append(task_id)
-            elif task.status in (
-                TaskStatus.FAILED.value,
-                TaskStatus.CANCELED.value,
-                TaskStatus.SUBMIT_FAILED.value,
-            ):
+            elif task.status in _FAILED_TASK_STATUSES:
                 failed_task_ids.append(task_id)
-            elif task.status in (
-                TaskStatus.DISPATCHED.value,
-                TaskStatus.QUEUED.value,
-                TaskStatus.RUNNING.value,
-                TaskStatus.CANCEL_REQUESTED.value,
-            ):
+            elif task.status in _ACTIVE_TASK_STATUSES:
                 active_task_ids.append(task_id)
             else:
                 pending_task_ids.append(task_id)
 
-            approval_status = self._approval_status_for_task(task_id)
+            approval_status = approval_statuses[task_id] = self._approval_status_for_task(task_id)
             audit = self._audits.get(task_id)
             handoff = self._handoffs.get(task_id)
             task_summaries.append(
@@ -1107,15 +1819,17 @@ class InMemoryStore:
                     consumed_artifact_ids=(list(audit.consumed_artifact_ids) if audit is not None else []),
                     produced_artifact_ids=(list(audit.produced_artifact_ids) if audit is not None else []),
                     handoff_summary=handoff.summary if handoff is not None else None,
-                    quality_gate_summary=self._evaluate_task_quality_gates(
-                        task,
-                        policy=self._task_quality_gate_policy(task),
-                    ),
+                    quality_gate_summary=self._to_task_read(task).quality_gate_summary,
                 )
             )
 
+        next_dispatch = self._build_dispatch_plan(
+            run,
+            max_tasks=max(len(run.task_ids), 1),
+            approval_statuses=approval_statuses,
+        )
         blocked_by_task_id: dict[int, list[str]] = {}
-        for item in self.plan_workflow_run_dispatch(run_id, max_tasks=max(len(run.task_ids), 1)).blocked:
+        for item in next_dispatch.blocked:
             if item.task_id is None:
                 continue
             blocked_by_task_id.setdefault(item.task_id, []).append(item.reason)
@@ -1124,9 +1838,7 @@ class InMemoryStore:
         if run.workflow_template_id is not None:
             workflow = self._workflow_templates.get(run.workflow_template_id)
             if workflow is not None:
-                for index, task_id in enumerate(run.task_ids):
-                    if index < len(workflow.steps):
-                        step_by_task_id[task_id] = workflow.steps[index]
+                step_by_task_id = dict(zip(run.task_ids, workflow.steps))
 
         timeline: list[WorkflowRunTimelineEntry] = []
         for task in task_summaries:
@@ -1138,9 +1850,9 @@ class InMemoryStore:
 
             if task.status == TaskStatus.SUCCESS.value:
                 stage_state = "done"
-            elif task.status in (TaskStatus.FAILED.value, TaskStatus.CANCELED.value, TaskStatus.SUBMIT_FAILED.value):
+            elif task.status in _FAILED_TASK_STATUSES:
                 stage_state = "blocked"
-            elif task.status in (TaskStatus.DISPATCHED.value, TaskStatus.QUEUED.value, TaskStatus.RUNNING.value, TaskStatus.CANCEL_REQUESTED.value):
+            elif task.status in _ACTIVE_TASK_STATUSES:
                 stage_state = "active"
             else:
                 stage_state = "blocked" if blocked_by_task_id.get(task.task_id) else "active"
@@ -1179,7 +1891,7 @@ class InMemoryStore:
             partial_completion=bool(successful_task_ids) and len(successful_task_ids) < len(task_summaries),
             progress_percent=progress_percent,
             branch_status_cards={"active": active_count, "blocked": blocked_count, "done": done_count},
-            next_dispatch=self.plan_workflow_run_dispatch(run_id, max_tasks=max(len(run.task_ids), 1)),
+            next_dispatch=next_dispatch,
             successful_task_ids=successful_task_ids,
             failed_task_ids=failed_task_ids,
             active_task_ids=active_task_ids,
@@ -1188,6 +1900,7 @@ class InMemoryStore:
             tasks=task_summaries,
         )
 
+    @_serialized
     def create_event(self, event: EventCreate) -> EventRead:
         if event.run_id is not None and event.run_id not in self._workflow_runs:
             raise NotFoundError(f"workflow run {event.run_id} not found")
@@ -1209,20 +1922,27 @@ class InMemoryStore:
         run_id: int | None = None,
         task_id: int | None = None,
         event_type: str | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        run_ids: list[int] | None = None,
+        since: str | None = None,
         limit: int = 200,
     ) -> list[EventRead]:
         if limit <= 0:
             return []
 
-        filtered = [
-            event
-            for event in self._events
-            if (run_id is None or event.run_id == run_id)
-            and (task_id is None or event.task_id == task_id)
-            and (event_type is None or event.event_type == event_type)
-        ]
-        return filtered[-limit:]
+        return self._select_events(
+            run_id=run_id,
+            task_id=task_id,
+            event_type=event_type,
+            after_id=after_id,
+            before_id=before_id,
+            run_ids=run_ids,
+            since=_normalize_since(since),
+            limit=limit,
+        )
 
+    @_serialized
     def create_artifact(self, artifact: ArtifactCreate) -> ArtifactRead:
         if artifact.producer_task_id not in self._tasks:
             raise NotFoundError(f"task {artifact.producer_task_id} not found")
@@ -1243,7 +1963,11 @@ class InMemoryStore:
             created_at=self._utc_now(),
         )
         self._artifact_seq += 1
-        self._artifacts.append(created)
+        self._store_artifact(created)
+        self._read_models.touch_activity(
+            run_ids=[created.run_id] if created.run_id is not None else [],
+            task_ids=[created.producer_task_id] if created.task_id is None else [created.producer_task_id, created.task_id],
+        )
         if created.task_id is not None:
             audit = self._audits.get(created.task_id)
             if audit is not None:
@@ -1270,37 +1994,39 @@ class InMemoryStore:
         run_id: int | None = None,
         task_id: int | None = None,
         artifact_type: ArtifactType | None = None,
+        after_id: int | None = None,
         limit: int = 200,
     ) -> list[ArtifactRead]:
         if limit <= 0:
             return []
 
-        filtered = [
-            artifact
-            for artifact in self._artifacts
-            if (run_id is None or artifact.run_id == run_id)
-            and (task_id is None or artifact.task_id == task_id)
-            and (artifact_type is None or artifact.artifact_type == artifact_type)
-        ]
-        return filtered[-limit:]
+        return self._select_artifacts(
+            run_id=run_id,
+            task_id=task_id,
+            artifact_type=artifact_type,
+            after_id=after_id,
+            limit=limit,
+        )
 
     def list_handoffs(
         self,
         *,
         run_id: int | None = None,
         task_id: int | None = None,
+        updated_after: str | None = None,
+        after_task_id: int | None = None,
         limit: int = 200,
     ) -> list[TaskHandoffRead]:
         if limit <= 0:
             return []
-        filtered = [
-            handoff
-            for handoff in self._handoffs.values()
-            if (run_id is None or handoff.run_id == run_id)
-            and (task_id is None or handoff.task_id == task_id)
-        ]
-        filtered.sort(key=lambda item: item.updated_at)
-        return filtered[-limit:]
+        task_ids = self._handoff_index.select(
+            run_id=run_id,
+            task_id=task_id,
+            updated_after=updated_after,
+            after_task_id=after_task_id,
+            limit=limit,
+        )
+        return [self._handoffs[selected_task_id] for selected_task_id in task_ids]
 
     def get_task_handoff(self, task_id: int) -> TaskHandoffRead:
         if task_id not in self._tasks:
@@ -1310,6 +2036,7 @@ class InMemoryStore:
             raise NotFoundError(f"handoff for task {task_id} not found")
         return handoff
 
+    @_serialized
     def create_role(self, role: RoleCreate) -> RoleRead:
         self._validate_role_skill_packs(role.skill_packs)
         role_id = self._role_seq
@@ -1335,7 +2062,7 @@ class InMemoryStore:
             execution_constraints=record.execution_constraints,
         )
 
-    def list_roles(self) -> list[RoleRead]:
+    def list_roles(self, *, after_id: int | None = None, limit: int | None = None) -> list[RoleRead]:
         return [
             RoleRead(
                 id=record.id,
@@ -1346,7 +2073,7 @@ class InMemoryStore:
                 skill_packs=record.skill_packs,
                 execution_constraints=record.execution_constraints,
             )
-            for record in self._roles.values()
+            for record in _page_records(self._roles, after_id=after_id, limit=limit)
         ]
 
     def get_role(self, role_id: int) -> RoleRead:
@@ -1363,6 +2090,7 @@ class InMemoryStore:
             execution_constraints=record.execution_constraints,
         )
 
+    @_serialized
     def update_role(
         self,
         role_id: int,
@@ -1388,6 +2116,7 @@ class InMemoryStore:
             execution_constraints=execution_constraints,
         )
         self._roles[role_id] = updated
+        self._read_models.touch_all()
         self._persist_state()
         return RoleRead(
             id=updated.id,
@@ -1399,6 +2128,7 @@ class InMemoryStore:
             execution_constraints=updated.execution_constraints,
         )
 
+    @_serialized
     def delete_role(self, role_id: int) -> None:
         if role_id not in self._roles:
             raise NotFoundError(f"role {role_id} not found")
@@ -1408,6 +2138,7 @@ class InMemoryStore:
         del self._roles[role_id]
         self._persist_state()
 
+    @_serialized
     def create_task(self, task: TaskCreate) -> TaskRead:
         if task.role_id not in self._roles:
             raise NotFoundError(f"role {task.role_id} not found")
@@ -1435,10 +2166,11 @@ class InMemoryStore:
             quality_gate_policy=task.quality_gate_policy.model_dump(),
             status=TaskStatus.CREATED.value,
         )
-        self._tasks[task_id] = record
+        self._put_task(record)
         if record.requires_approval:
             approval = self._create_pending_approval(task_id)
             self._task_approval[task_id] = approval.id
+            self._read_models.touch_task(task_id)
 
         self._append_event(
             event_type="task.created",
@@ -1459,17 +2191,59 @@ class InMemoryStore:
             raise NotFoundError(f"task {task_id} not found")
         return self._to_task_read(record)
 
-    def list_tasks(self, *, run_id: int | None = None) -> list[TaskRead]:
+    def get_compact_task(self, task_id: int) -> TaskCompactRead:
+        record = self._tasks.get(task_id)
+        if record is None:
+            raise NotFoundError(f"task {task_id} not found")
+        return self._to_task_compact_read(record)
+
+    def list_tasks(
+        self,
+        *,
+        run_id: int | None = None,
+        statuses: list[TaskStatus] | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[TaskRead]:
+        records = self._select_task_records(run_id=run_id, statuses=statuses, after_id=after_id, limit=limit)
+        return [self._to_task_read(record) for record in records]
+
+    def list_compact_tasks(
+        self,
+        *,
+        run_id: int | None = None,
+        statuses: list[TaskStatus] | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[TaskCompactRead]:
+        records = self._select_task_records(run_id=run_id, statuses=statuses, after_id=after_id, limit=limit)
+        return [self._to_task_compact_read(record) for record in records]
+
+    def _select_task_records(
+        self,
+        *,
+        run_id: int | None,
+        statuses: list[TaskStatus] | None,
+        after_id: int | None,
+        limit: int | None,
+    ) -> list[_TaskRecord]:
+        status_values = {status.value for status in statuses} if statuses is not None else None
         if run_id is not None:
             run = self._workflow_runs.get(run_id)
             if run is None:
                 raise NotFoundError(f"workflow run {run_id} not found")
-            run_task_ids = set(run.task_ids)
-            records = [record for record in self._tasks.values() if record.id in run_task_ids]
+            task_ids = id_page(
+                [sorted(set(run.task_ids))],
+                after_id=after_id,
+                limit=limit,
+                matches=lambda task_id: self._task_index.status(task_id) is not None
+                and (status_values is None or self._task_index.status(task_id) in status_values),
+            )
         else:
-            records = list(self._tasks.values())
-        return [self._to_task_read(record) for record in records]
+            task_ids = self._task_index.select(statuses=status_values, after_id=after_id, limit=limit)
+        return self._tasks.many(task_ids)
 
+    @_serialized
     def dispatch_task(self, task_id: int, *, consumed_artifact_ids: list[int] | None = None) -> DispatchResponse:
         task = self.get_task(task_id)
         if task.status not in (TaskStatus.CREATED, TaskStatus.SUBMIT_FAILED):
@@ -1524,7 +2298,7 @@ class InMemoryStore:
             consumed_artifact_ids = []
 
         previous_audit = self._audits.get(task.id)
-        self._audits[task.id] = TaskAudit(
+        audit = TaskAudit(
             task_id=task.id,
             role_id=task.role_id,
             context7_mode=task.context7_mode,
@@ -1561,12 +2335,13 @@ class InMemoryStore:
             last_rerun_at=previous_audit.last_rerun_at if previous_audit is not None else None,
             recent_event_ids=list(previous_audit.recent_event_ids) if previous_audit is not None else [],
         )
+        self._put_audit(task.id, audit)
         record = self._tasks.get(task.id)
         if record is None:
             raise NotFoundError(f"task {task.id} not found")
         record.status = TaskStatus.DISPATCHED.value
         record.runner_message = "dispatch accepted"
-        self._tasks[task.id] = record
+        self._put_task(record)
 
         self._append_event(
             event_type="task.dispatched",
@@ -1593,6 +2368,7 @@ class InMemoryStore:
             runner_payload=payload,
         )
 
+    @_serialized
     def apply_runner_submission(self, task_id: int, submission: RunnerSubmission) -> TaskRead:
         record = self._tasks.get(task_id)
         if record is None:
@@ -1616,7 +2392,7 @@ class InMemoryStore:
             audit = self._audits.get(task_id)
             if audit is not None and audit.execution_mode == ExecutionMode.DOCKER_SANDBOX:
                 audit.sandbox_error = record.runner_message
-                self._audits[task_id] = audit
+                self._put_audit(task_id, audit)
             retry_decision = self._evaluate_retry_for_failure(
                 task_id=task_id,
                 failure_status=TaskStatus.SUBMIT_FAILED.value,
@@ -1670,7 +2446,7 @@ class InMemoryStore:
                     event_payload["released_git_branch"] = released_session.git_branch
             event_type = "task.runner_submit_failed"
 
-        self._tasks[task_id] = record
+        self._put_task(record)
         self._append_event(
             event_type=event_type,
             run_id=run_id,
@@ -1682,6 +2458,7 @@ class InMemoryStore:
         self._persist_state()
         return self.get_task(task_id)
 
+    @_serialized
     def apply_runner_cancel_request(self, task_id: int, submission: RunnerSubmission) -> TaskRead:
         record = self._tasks.get(task_id)
         if record is None:
@@ -1723,7 +2500,7 @@ class InMemoryStore:
             record.runner_message = sanitized_message or "runner cancel failed"
             event_type = "task.runner_cancel_failed"
 
-        self._tasks[task_id] = record
+        self._put_task(record)
         self._append_event(
             event_type=event_type,
             run_id=run_id,
@@ -1735,6 +2512,7 @@ class InMemoryStore:
         self._persist_state()
         return self.get_task(task_id)
 
+    @_serialized
     def update_task_runner_status(
         self,
         task_id: int,
@@ -1785,7 +2563,7 @@ class InMemoryStore:
         if is_terminal and record.finished_at is None:
             record.finished_at = self._utc_now()
 
-        self._tasks[task_id] = record
+        self._put_task(record)
         audit = self._audits.get(task_id)
         if audit is not None and audit.execution_mode == ExecutionMode.DOCKER_SANDBOX:
             if container_id is not None:
@@ -1794,7 +2572,7 @@ class InMemoryStore:
                 audit.sandbox_exit_code = exit_code
             if status in (RunnerLifecycleStatus.FAILED, RunnerLifecycleStatus.CANCELED) and sanitized_message is not None:
                 audit.sandbox_error = sanitized_message
-            self._audits[task_id] = audit
+            self._put_audit(task_id, audit)
         elif audit is not None and audit.execution_mode == ExecutionMode.ISOLATED_WORKTREE:
             has_cleanup_update = (
                 worktree_cleanup_attempted is not None
@@ -1809,7 +2587,7 @@ class InMemoryStore:
                 audit.worktree_cleanup_message = sanitized_cleanup_message
             if has_cleanup_update:
                 audit.worktree_cleanup_at = self._utc_now()
-            self._audits[task_id] = audit
+            self._put_audit(task_id, audit)
 
         event_payload: dict[str, Any] = {
             "status": status.value,
@@ -1845,7 +2623,7 @@ class InMemoryStore:
                 record.exit_code = None
                 record.stdout = None
                 record.stderr = None
-                self._tasks[task_id] = record
+                self._put_task(record)
 
         if handoff is not None and not is_terminal:
             raise ValidationError("handoff payload is accepted only for terminal task status updates")
@@ -1856,13 +2634,13 @@ class InMemoryStore:
                 handoff=handoff,
             )
             event_payload["handoff_updated_at"] = saved_handoff.updated_at
-            event_payload["handoff_required_artifact_ids"] = [
-                item.artifact_id for item in saved_handoff.artifacts if item.is_required
-            ]
+            event_payload["handoff_required_artifact_ids"] = list(
+                self._handoff_index.required_artifact_ids[task_id]
+            )
             audit = self._audits.get(task_id)
             if audit is not None:
                 audit.handoff = saved_handoff
-                self._audits[task_id] = audit
+                self._put_audit(task_id, audit)
 
         if is_terminal and not (retry_decision is not None and retry_decision["retry_scheduled"]):
             released_paths = self._release_task_locks_internal(task_id=task_id, run_id=run_id, emit_event=True)
@@ -1950,6 +2728,7 @@ class InMemoryStore:
             raise NotFoundError(f"approval {approval_id} not found")
         return self._to_approval_read(record)
 
+    @_serialized
     def approve_approval(self, approval_id: int, *, actor: str | None, comment: str | None) -> ApprovalRead:
         return self._set_approval_status(
             approval_id,
@@ -1958,6 +2737,7 @@ class InMemoryStore:
             comment=comment,
         )
 
+    @_serialized
     def reject_approval(self, approval_id: int, *, actor: str | None, comment: str | None) -> ApprovalRead:
         return self._set_approval_status(
             approval_id,
@@ -1966,6 +2746,43 @@ class InMemoryStore:
             comment=comment,
         )
 
+    def list_approvals(
+        self,
+        *,
+        status: ApprovalStatus | None = None,
+        run_id: int | None = None,
+        project_id: int | None = None,
+        role_id: int | None = None,
+        limit: int = 200,
+    ) -> list[ApprovalRead]:
+        if limit <= 0:
+            raise ValidationError("limit must be a positive integer")
+        if status == ApprovalStatus.PENDING:
+            approval_ids = self._pending_approvals.select(run_id=run_id, project_id=project_id, role_id=role_id)
+            records = [self._approvals[approval_id] for approval_id in approval_ids[:limit]]
+        else:
+            wanted = (run_id, project_id, role_id)
+            records = [
+                record
+                for record in self._approvals.values()
+                if (status is None or record.status == status.value)
+                and all(key is None or key == actual for key, actual in zip(wanted, self._approval_scope(record)))
+            ][:limit]
+        return [self._to_approval_read(record) for record in records]
+
+    def decide_approvals(self, payload: ApprovalBulkDecisionRequest) -> list[ApprovalRead]:
+        with self.transaction():
+            return [
+                self._set_approval_status(
+                    decision.approval_id,
+                    status=decision.status.value,
+                    actor=payload.actor,
+                    comment=decision.comment if decision.comment is not None else payload.comment,
+                )
+                for decision in payload.decisions
+            ]
+
+    @_serialized
     def release_task_locks(self, task_id: int) -> list[str]:
         if task_id not in self._tasks:
             raise NotFoundError(f"task {task_id} not found")
@@ -2036,22 +2853,8 @@ class InMemoryStore:
 
         ready: list[tuple[int, list[int]]] = []
         blocked_by_approval: list[int] = []
-        for task_id in run.task_ids:
-            task = self._tasks.get(task_id)
-            if task is None:
-                continue
-            if task.status not in (TaskStatus.CREATED.value, TaskStatus.SUBMIT_FAILED.value):
-                continue
-
-            dependencies = run.step_dependencies.get(task_id, [])
-            dependencies_ready = all(
-                self._tasks.get(dep_task_id) is not None
-                and self._tasks[dep_task_id].status == TaskStatus.SUCCESS.value
-                for dep_task_id in dependencies
-            )
-            if not dependencies_ready:
-                continue
-
+        for task_id in self._run_readiness(run).ready_task_ids():
+            task = self._tasks[task_id]
             consumed_artifact_ids, _missing_requirements = self._resolve_handoff_artifacts(
                 run_id=run_id,
                 task_id=task_id,
@@ -2172,7 +2975,7 @@ class InMemoryStore:
         audit.last_rerun_reason = reason
         audit.last_rerun_at = rerun_at
         audit.handoff = None
-        self._audits[task_id] = audit
+        self._put_audit(task_id, audit)
 
     def _approval_status_for_task(self, task_id: int) -> ApprovalStatus | None:
         task = self._tasks.get(task_id)
@@ -2200,9 +3003,7 @@ class InMemoryStore:
             raise NotFoundError(f"workflow run {run_id} not found")
 
         task_records = [self._tasks[task_id] for task_id in run.task_ids if task_id in self._tasks]
-        status_counts: dict[str, int] = {}
-        for task in task_records:
-            status_counts[task.status] = status_counts.get(task.status, 0) + 1
+        status_counts = dict(self._run_readiness(run).status_counts)
 
         ready_candidates, blocked_by_approval_task_ids = self._assistant_dispatch_candidates(run_id)
         terminal_task_ids = [task.id for task in task_records if self._is_terminal_task_status(task.status)]
@@ -2250,7 +3051,13 @@ class InMemoryStore:
             recent_event_types=recent_event_types,
         )
 
-    def _resolve_handoff_artifacts(self, *, run_id: int, task_id: int) -> tuple[list[int] | None, list[dict[str, Any]]]:
+    def _resolve_handoff_artifacts(
+        self,
+        *,
+        run_id: int,
+        task_id: int,
+        matches: dict[tuple[Any, ...], tuple[list[int] | None, dict[str, Any] | None]] | None = None,
+    ) -> tuple[list[int] | None, list[dict[str, Any]]]:
         run = self._workflow_runs.get(run_id)
         if run is None:
             raise NotFoundError(f"workflow run {run_id} not found")
@@ -2259,50 +3066,24 @@ class InMemoryStore:
             return [], []
 
         resolved_artifact_ids: list[int] = []
-        missing_requirements: list[dict[str, Any]] = []
         for requirement in requirements:
             from_task_ids = {int(value) for value in requirement.get("from_task_ids", [])}
             expected_type = requirement.get("artifact_type")
             expected_label = requirement.get("label")
-            matched = [
-                artifact
-                for artifact in self._artifacts
-                if artifact.run_id == run_id
-                and artifact.producer_task_id in from_task_ids
-                and (expected_type is None or artifact.artifact_type.value == expected_type)
-                and self._artifact_has_label(artifact, expected_label)
-            ]
-            if not matched:
-                missing_requirements.append(
-                    {
-                        "from_task_ids": sorted(from_task_ids),
-                        "artifact_type": expected_type,
-                        "label": expected_label,
-                        "reason": "no matching artifacts",
-                    }
-                )
-                return None, missing_requirements
-
-            required_handoff_artifact_ids = self._required_handoff_artifact_ids(
-                run_id=run_id,
-                from_task_ids=from_task_ids,
-            )
-            matched_required_ids = [
-                artifact.id
-                for artifact in matched
-                if artifact.id in required_handoff_artifact_ids
-            ]
-            if not matched_required_ids:
-                missing_requirements.append(
-                    {
-                        "from_task_ids": sorted(from_task_ids),
-                        "artifact_type": expected_type,
-                        "label": expected_label,
-                        "required_handoff_artifact_ids": sorted(required_handoff_artifact_ids),
-                        "reason": "matching artifacts are not marked required in handoff",
-                    }
+            key = (frozenset(from_task_ids), expected_type, expected_label)
+            resolved = matches.get(key) if matches is not None else None
+            if resolved is None:
+                resolved = self._resolve_artifact_requirement(
+                    run_id=run_id,
+                    from_task_ids=from_task_ids,
+                    expected_type=expected_type,
+                    expected_label=expected_label,
                 )
-                return None, missing_requirements
+                if matches is not None:
+                    matches[key] = resolved
+            matched_required_ids, missing = resolved
+            if matched_required_ids is None:
+                return None, [dict(missing or {})]
             resolved_artifact_ids.extend(matched_required_ids)
 
         deduplicated: list[int] = []
@@ -2312,34 +3093,50 @@ class InMemoryStore:
             deduplicated.append(artifact_id)
         return deduplicated, []
 
+    def _resolve_artifact_requirement(
+        self,
+        *,
+        run_id: int,
+        from_task_ids: set[int],
+        expected_type: str | None,
+        expected_label: str | None,
+    ) -> tuple[list[int] | None, dict[str, Any] | None]:
+        matched = self._select_artifacts(
+            run_id=run_id,
+            producer_task_ids=from_task_ids,
+            artifact_type=ArtifactType(expected_type) if expected_type is not None else None,
+            label=expected_label,
+        )
+        if not matched:
+            return None, {
+                "from_task_ids": sorted(from_task_ids),
+                "artifact_type": expected_type,
+                "label": expected_label,
+                "reason": "no matching artifacts",
+            }
+
+        required_handoff_artifact_ids = self._required_handoff_artifact_ids(
+            run_id=run_id,
+            from_task_ids=from_task_ids,
+        )
+        matched_required_ids = [artifact.id for artifact in matched if artifact.id in required_handoff_artifact_ids]
+        if not matched_required_ids:
+            return None, {
+                "from_task_ids": sorted(from_task_ids),
+                "artifact_type": expected_type,
+                "label": expected_label,
+                "required_handoff_artifact_ids": sorted(required_handoff_artifact_ids),
+                "reason": "matching artifacts are not marked required in handoff",
+            }
+        return matched_required_ids, None
+
     def _required_handoff_artifact_ids(self, *, run_id: int, from_task_ids: set[int]) -> set[int]:
         required_artifact_ids: set[int] = set()
         for from_task_id in from_task_ids:
-            handoff = self._handoffs.get(from_task_id)
-            if handoff is None:
-                continue
-            if handoff.run_id != run_id:
-                continue
-            for artifact in handoff.artifacts:
-                if artifact.is_required:
-                    required_artifact_ids.add(artifact.artifact_id)
+            if self._handoff_index.run_id(from_task_id) == run_id:
+                required_artifact_ids.update(self._handoff_index.required_artifact_ids[from_task_id])
         return required_artifact_ids
 
-    @staticmethod
-    def _artifact_has_label(artifact: ArtifactRead, expected_label: str | None) -> bool:
-        if expected_label is None:
-            return True
-
-        label_value = artifact.metadata.get("label")
-        if isinstance(label_value, str) and label_value == expected_label:
-            return True
-
-        labels_value = artifact.metadata.get("labels")
-        if isinstance(labels_value, list) and expected_label in labels_value:
-            return True
-
-        return False
-
     def _validate_role_skill_packs(self, skill_packs: list[str]) -> None:
         if not skill_packs:
             return
@@ -2423,19 +3220,17 @@ class InMemoryStore:
         conflict_reasons: list[str] = []
 
         for candidate in normalized_paths:
-            candidate_path = Path(candidate)
-            for locked_path, owner_task_id in self._path_locks.items():
+            for locked_path, owner_task_id in self._lock_trie.conflicts(candidate):
                 if owner_task_id == task_id:
                     continue
-                locked_path_obj = Path(locked_path)
-                if self._paths_overlap(candidate_path, locked_path_obj):
-                    conflict_reasons.append(f"{candidate} locked by task {owner_task_id} ({locked_path})")
+                conflict_reasons.append(f"{candidate} locked by task {owner_task_id} ({locked_path})")
 
         if conflict_reasons:
             raise ConflictError(f"shared-workspace lock conflict: {'; '.join(conflict_reasons)}")
 
         for path in normalized_paths:
             self._path_locks[path] = task_id
+            self._lock_trie.put(path, task_id)
         self._task_locks[task_id] = normalized_paths
 
         project = self._projects.get(project_id)
@@ -2461,15 +3256,33 @@ class InMemoryStore:
         if run is None:
             return []
         dependency_task_ids = run.step_dependencies.get(task_id, [])
-        context: list[TaskHandoffRead] = []
-        for dependency_task_id in dependency_task_ids:
-            handoff = self._handoffs.get(dependency_task_id)
-            if handoff is None:
-                continue
-            if handoff.run_id != run_id:
-                continue
-            context.append(handoff)
-        return context
+        return [
+            self._handoffs[dependency_task_id]
+            for dependency_task_id in dependency_task_ids
+            if self._handoff_index.run_id(dependency_task_id) == run_id
+        ]
+
+    def _put_handoff(self, handoff: TaskHandoffRead) -> None:
+        self._handoffs[handoff.task_id] = handoff
+        self._index_handoff(handoff)
+        self._read_models.touch_task(handoff.task_id)
+
+    def _drop_handoff(self, task_id: int) -> None:
+        self._handoffs.pop(task_id, None)
+        self._handoff_index.discard(task_id)
+        self._read_models.touch_task(task_id)
+
+    def _index_handoff(self, handoff: TaskHandoffRead) -> None:
+        self._handoff_index.put(*self._handoff_index_entry(handoff))
+
+    @staticmethod
+    def _handoff_index_entry(handoff: TaskHandoffRead) -> tuple[int, int | None, str, list[int]]:
+        return (
+            handoff.task_id,
+            handoff.run_id,
+            handoff.updated_at,
+            [artifact.artifact_id for artifact in handoff.artifacts if artifact.is_required],
+        )
 
     def _upsert_task_handoff(
         self,
@@ -2478,7 +3291,7 @@ class InMemoryStore:
         run_id: int | None,
         handoff: TaskHandoffPayload,
     ) -> TaskHandoffRead:
-        known_artifacts_by_id = {artifact.id: artifact for artifact in self._artifacts}
+        known_artifacts_by_id = self._artifacts_by_ids([artifact_ref.artifact_id for artifact_ref in handoff.artifacts])
         for artifact_ref in handoff.artifacts:
             artifact = known_artifacts_by_id.get(artifact_ref.artifact_id)
             if artifact is None:
@@ -2506,7 +3319,7 @@ class InMemoryStore:
             created_at=created_at,
             updated_at=now,
         )
-        self._handoffs[task_id] = saved
+        self._put_handoff(saved)
         self._append_event(
             event_type="task.handoff_published",
             run_id=run_id,
@@ -2517,9 +3330,7 @@ class InMemoryStore:
                 "next_actions": saved.next_actions,
                 "open_questions": saved.open_questions,
                 "artifacts": [artifact.model_dump() for artifact in saved.artifacts],
-                "required_artifact_ids": [
-                    artifact.artifact_id for artifact in saved.artifacts if artifact.is_required
-                ],
+                "required_artifact_ids": list(self._handoff_index.required_artifact_ids[task_id]),
             },
         )
         return saved
@@ -2629,7 +3440,7 @@ class InMemoryStore:
                 audit.worktree_cleanup_message = cleanup_message
             if has_cleanup_update:
                 audit.worktree_cleanup_at = self._utc_now()
-            self._audits[task_id] = audit
+            self._put_audit(task_id, audit)
 
         if session is None:
             return None
@@ -2767,7 +3578,7 @@ class InMemoryStore:
             decided_by=None,
             comment=None,
         )
-        self._approvals[approval_id] = record
+        self._put_approval(record)
         self._append_event(
             event_type="approval.pending",
             task_id=task_id,
@@ -2775,6 +3586,33 @@ class InMemoryStore:
         )
         return record
 
+    def _put_approval(self, record: _ApprovalRecord) -> None:
+        self._approvals[record.id] = record
+        self._sync_pending_approval(record.id)
+        self._read_models.touch_task(record.task_id)
+
+    def _sync_pending_approval(self, approval_id: int) -> None:
+        record = self._approvals.get(approval_id)
+        if record is None or record.status != ApprovalStatus.PENDING.value:
+            self._pending_approvals.discard(approval_id)
+            return
+        self._pending_approvals.put(record.id, *self._approval_scope(record))
+
+    def _rebuild_pending_approvals(self) -> None:
+        self._pending_approvals.rebuild(
+            (record.id, *self._approval_scope(record))
+            for record in self._approvals.values()
+            if record.status == ApprovalStatus.PENDING.value
+        )
+
+    def _approval_scope(self, record: _ApprovalRecord) -> tuple[int | None, int | None, int | None]:
+        task = self._tasks.get(record.task_id)
+        return (
+            self._task_latest_run.get(record.task_id),
+            task.project_id if task is not None else None,
+            task.role_id if task is not None else None,
+        )
+
     def _set_approval_status(self, approval_id: int, *, status: str, actor: str | None, comment: str | None) -> ApprovalRead:
         record = self._approvals.get(approval_id)
         if record is None:
@@ -2787,7 +3625,7 @@ class InMemoryStore:
             decided_by=actor,
             comment=comment,
         )
-        self._approvals[approval_id] = updated
+        self._put_approval(updated)
 
         run_id = self._task_latest_run.get(record.task_id)
         self._append_event(
@@ -2805,9 +3643,8 @@ class InMemoryStore:
 
     def _release_task_locks_internal(self, *, task_id: int, run_id: int | None, emit_event: bool) -> list[str]:
         released_paths = self._task_locks.pop(task_id, [])
-        for path in released_paths:
-            if self._path_locks.get(path) == task_id:
-                del self._path_locks[path]
+        for path in self._lock_trie.release(released_paths, task_id):
+            del self._path_locks[path]
 
         if emit_event:
             self._append_event(
@@ -2864,7 +3701,7 @@ class InMemoryStore:
             if audit is not None:
                 audit.retry_attempts = retry_attempt
                 audit.last_retry_reason = retry_reason
-                self._audits[task_id] = audit
+                self._put_audit(task_id, audit)
         else:
             retries_remaining = max(max_retries - retry_attempt, 0)
             if audit is not None:
@@ -2876,7 +3713,7 @@ class InMemoryStore:
                     audit.last_retry_reason = f"retry policy skipped: category '{category}' not in retry_on"
                 elif retry_attempt >= max_retries:
                     audit.last_retry_reason = f"retry policy exhausted at {retry_attempt}/{max_retries}"
-                self._audits[task_id] = audit
+                self._put_audit(task_id, audit)
 
         return {
             "retry_scheduled": retry_allowed,
@@ -2999,41 +3836,29 @@ class InMemoryStore:
         if run.status == WorkflowRunStatus.ABORTED.value:
             return
 
-        statuses: list[str] = []
-        for task_id in run.task_ids:
-            task = self._tasks.get(task_id)
-            if task is None:
-                continue
-            statuses.append(task.status)
-
-        if not statuses:
+        readiness = self._run_readiness(run)
+        counts = readiness.status_counts
+        total = sum(counts.values())
+        if not total:
             return
 
         next_status = run.status
         event_type: str | None = None
-        if all(status == TaskStatus.SUCCESS.value for status in statuses):
+        if counts.get(TaskStatus.SUCCESS.value, 0) == total:
             next_status = WorkflowRunStatus.SUCCESS.value
             event_type = "workflow_run.succeeded"
         elif any(
-            status in (TaskStatus.FAILED.value, TaskStatus.CANCELED.value, TaskStatus.SUBMIT_FAILED.value)
-            for status in statuses
+            status in counts
+            for status in (TaskStatus.FAILED.value, TaskStatus.CANCELED.value, TaskStatus.SUBMIT_FAILED.value)
         ):
             next_status = WorkflowRunStatus.FAILED.value
             event_type = "workflow_run.failed"
-        elif any(
-            status
-            in (
-                TaskStatus.DISPATCHED.value,
-                TaskStatus.QUEUED.value,
-                TaskStatus.RUNNING.value,
-                TaskStatus.CANCEL_REQUESTED.value,
-            )
-            for status in statuses
-        ):
+        elif readiness.has_active_tasks():
             next_status = WorkflowRunStatus.RUNNING.value
             event_type = "workflow_run.running"
 
         if next_status == run.status:
+            self._retire_run_readiness(run)
             return
 
         updated = _WorkflowRunRecord(
@@ -3047,7 +3872,7 @@ class InMemoryStore:
             step_dependencies=run.step_dependencies,
             step_artifact_requirements=run.step_artifact_requirements,
         )
-        self._workflow_runs[run_id] = updated
+        self._put_workflow_run(updated)
         if event_type is not None:
             self._append_event(
                 event_type=event_type,
@@ -3085,12 +3910,12 @@ class InMemoryStore:
         return " ".join(parts).lower()
 
     def _workflow_template_history_metrics(self, template_id: int) -> tuple[int, float | None]:
-        run_records = [run for run in self._workflow_runs.values() if run.workflow_template_id == template_id]
-        if not run_records:
+        counts = self._run_index.template_counts(template_id)
+        total = sum(counts.values())
+        if not total:
             return 0, None
-        success_count = sum(1 for run in run_records if run.status == WorkflowRunStatus.SUCCESS.value)
-        success_rate = round((success_count / len(run_records)) * 100, 2)
-        return len(run_records), success_rate
+        success_rate = round((counts.get(WorkflowRunStatus.SUCCESS.value, 0) / total) * 100, 2)
+        return total, success_rate
 
     @staticmethod
     def _is_terminal_task_status(status: str) -> bool:
@@ -3120,7 +3945,7 @@ class InMemoryStore:
             step_dependencies=record.step_dependencies,
             step_artifact_requirements=record.step_artifact_requirements,
         )
-        self._workflow_runs[run_id] = updated
+        self._put_workflow_run(updated)
         self._append_event(
             event_type=event_type,
             run_id=run_id,
@@ -3148,7 +3973,11 @@ class InMemoryStore:
             created_at=self._utc_now(),
         )
         self._event_seq += 1
-        self._events.append(event)
+        self._store_event(event)
+        self._read_models.touch_events()
+        self._dispatch_counters.add(event)
+        if event.event_type in DispatchCounters.event_types and event.run_id is not None:
+            self._read_models.touch_run(event.run_id)
         if task_id is not None:
             audit = self._audits.get(task_id)
             if audit is not None:
@@ -3158,98 +3987,741 @@ class InMemoryStore:
                 self._audits[task_id] = audit
         return event
 
+    def _store_event(self, event: EventRead) -> None:
+        self._event_index.add(len(self._events), event)
+        self._events.append(event)
+
+    def _replace_events(self, events: Iterable[EventRead]) -> None:
+        self._events = ColumnarEventLog(events)
+        self._event_index.rebuild(self._events)
+
+    def _store_artifact(self, artifact: ArtifactRead) -> None:
+        self._artifact_index.add(len(self._artifacts), artifact)
+        self._artifacts.append(artifact)
+
+    def _replace_artifacts(self, artifacts: list[ArtifactRead]) -> None:
+        self._artifacts = artifacts
+        self._artifact_index.rebuild(artifacts)
+
+    def _select_events(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        event_type: str | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        run_ids: list[int] | None = None,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> list[EventRead]:
+        if run_ids is not None and run_id is not None:
+            run_ids = [candidate for candidate in run_ids if candidate == run_id]
+        if run_ids is not None and not run_ids:
+            return []
+        events = self._select_hot_events(
+            run_id=run_id,
+            task_id=task_id,
+            event_type=event_type,
+            after_id=after_id,
+            before_id=before_id,
+            run_ids=run_ids,
+            since=since,
+            limit=limit,
+        )
+        if run_ids is not None:
+            archived_run_ids = sorted(self._archived_run_ids.intersection(run_ids))
+        else:
+            archived_run_id = self._archived_run_for(run_id=run_id, task_id=task_id)
+            archived_run_ids = [] if archived_run_id is None else [archived_run_id]
+        if not archived_run_ids or self._archive is None:
+            return events
+        archived = [
+            EventRead(**record)
+            for archived_run_id in archived_run_ids
+            for record in self._archive.read_run(archived_run_id)[0]
+            if (task_id is None or record["task_id"] == task_id)
+            and (event_type is None or record["event_type"] == event_type)
+            and (after_id is None or record["id"] > after_id)
+            and (before_id is None or record["id"] < before_id)
+            and (since is None or _normalize_since(record["created_at"]) >= since)
+        ]
+        merged = _merge_by_id(archived, events)
+        if limit is None:
+            return merged
+        return merged[:limit] if after_id is not None else merged[-limit:]
+
+    def _select_artifacts(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        artifact_type: ArtifactType | None = None,
+        producer_task_ids: set[int] | None = None,
+        label: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[ArtifactRead]:
+        artifacts = self._select_hot_artifacts(
+            run_id=run_id,
+            task_id=task_id,
+            artifact_type=artifact_type,
+            producer_task_ids=producer_task_ids,
+            label=label,
+            after_id=after_id,
+            limit=limit,
+        )
+        archived_run_id = self._archived_run_for(run_id=run_id, task_id=task_id)
+        if archived_run_id is None or self._archive is None:
+            return artifacts
+        archived = [
+            ArtifactRead(**record)
+            for record in self._archive.read_run(archived_run_id)[1]
+            if (task_id is None or record["task_id"] == task_id)
+            and (artifact_type is None or record["artifact_type"] == artifact_type.value)
+            and (producer_task_ids is None or record["producer_task_id"] in producer_task_ids)
+            and (after_id is None or record["id"] > after_id)
+        ]
+        if label is not None:
+            archived = [artifact for artifact in archived if label in artifact_labels(artifact)]
+        merged = _merge_by_id(archived, artifacts)
+        if limit is None:
+            return merged
+        return merged[:limit] if after_id is not None else merged[-limit:]
+
+    def _artifacts_by_ids(self, artifact_ids: list[int]) -> dict[int, ArtifactRead]:
+        found = self._hot_artifacts_by_ids(artifact_ids)
+        missing = set(artifact_ids) - set(found)
+        if missing and self._archive is not None:
+            found.update((int(record["id"]), ArtifactRead(**record)) for record in self._archive.read_artifacts(missing))
+        return found
+
+    def _archived_run_for(self, *, run_id: int | None, task_id: int | None) -> int | None:
+        if not self._archived_run_ids:
+            return None
+        if run_id is None and task_id is not None:
+            run_id = self._task_latest_run.get(task_id)
+        return run_id if run_id in self._archived_run_ids else None
+
+    def _select_hot_events(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        event_type: str | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        run_ids: list[int] | None = None,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> list[EventRead]:
+        if run_ids is not None or since is not None:
+            if run_ids is None and run_id is not None:
+                run_ids = [run_id]
+            positions = self._events.select_positions(
+                positions=None if run_ids is None else self._event_index.run_positions(run_ids, event_type),
+                task_id=task_id,
+                event_types=None if event_type is None or run_ids is not None else [event_type],
+                since=since,
+                after_id=after_id,
+                before_id=before_id,
+            )
+            if limit is not None:
+                positions = positions[:limit] if after_id is not None else positions[len(positions) - limit :]
+            return self._events.materialize(positions)
+        return self._event_index.select(
+            self._events,
+            run_id=run_id,
+            task_id=task_id,
+            event_type=event_type,
+            after_id=after_id,
+            before_id=before_id,
+            limit=limit,
+        )
+
+    def _select_hot_artifacts(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        artifact_type: ArtifactType | None = None,
+        producer_task_ids: set[int] | None = None,
+        label: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[ArtifactRead]:
+        return self._artifact_index.select(
+            self._artifacts,
+            run_id=run_id,
+            task_id=task_id,
+            artifact_type=artifact_type.value if artifact_type is not None else None,
+            producer_task_ids=producer_task_ids,
+            label=label,
+            after_id=after_id,
+            limit=limit,
+        )
+
+    def _hot_artifacts_by_ids(self, artifact_ids: list[int]) -> dict[int, ArtifactRead]:
+        return self._artifact_index.get(self._artifacts, artifact_ids)
+
+    @contextmanager
+    def transaction(self, *, rollback_on_error: bool = True) -> Iterator[None]:
+        with self._transaction_lock:
+            savepoint = self._open_savepoint() if rollback_on_error else None
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._transaction_depth -= 1
+                if savepoint is not None:
+                    self._rollback_savepoint(savepoint)
+                if not self._transaction_depth:
+                    self._persist_state()
+                raise
+            self._transaction_depth -= 1
+            if savepoint is not None:
+                self._release_savepoint(savepoint)
+            if not self._transaction_depth:
+                self._persist_state()
+
+    def _open_savepoint(self) -> _Savepoint:
+        savepoint = _Savepoint(
+            undo={},
+            dirty_keys={},
+            deleted_keys={},
+            event_count=len(self._events),
+            artifact_count=len(self._artifacts),
+            sequences=self._sequences_snapshot(),
+        )
+        for collection in _STATE_COLLECTIONS:
+            tracked: _TrackedDict = getattr(self, f"_{collection}")
+            savepoint.undo[collection] = tracked.undo
+            savepoint.dirty_keys[collection] = set(tracked.dirty_keys)
+            savepoint.deleted_keys[collection] = set(tracked.deleted_keys)
+            tracked.undo = {}
+        savepoint.storage_token = self._open_storage_savepoint()
+        return savepoint
+
+    def _release_savepoint(self, savepoint: _Savepoint) -> None:
+        for collection in _STATE_COLLECTIONS:
+            tracked: _TrackedDict = getattr(self, f"_{collection}")
+            parent = savepoint.undo[collection]
+            if parent is not None and tracked.undo:
+                for key, value in tracked.undo.items():
+                    parent.setdefault(key, value)
+            tracked.undo = parent
+        self._release_storage_savepoint(savepoint.storage_token)
+
+    def _rollback_savepoint(self, savepoint: _Savepoint) -> None:
+        touched_run_ids = list(self._workflow_runs.undo or {})
+        touched_task_ids = list(self._tasks.undo or {})
+        touched_lock_paths = list(self._path_locks.undo or {})
+        touched_approval_ids = set(self._approvals.undo or {})
+        touched_handoff_task_ids = list(self._handoffs.undo or {})
+        touched_approval_ids.update(
+            approval_id
+            for task_id in self._task_latest_run.undo or {}
+            if (approval_id := dict.get(self._task_approval, task_id)) is not None
+        )
+        for collection in _STATE_COLLECTIONS:
+            tracked: _TrackedDict = getattr(self, f"_{collection}")
+            tracked.rollback_undo()
+            tracked.undo = savepoint.undo[collection]
+            tracked.dirty_keys = savepoint.dirty_keys[collection]
+            tracked.deleted_keys = savepoint.deleted_keys[collection]
+        stale_run_ids = set(touched_run_ids)
+        stale_run_ids.update(
+            run_id
+            for position in range(savepoint.event_count, len(self._events))
+            if (run_id := self._events.keys_at(position)[1]) is not None
+        )
+        for task_id in touched_task_ids:
+            stale_run_ids.update(self._readiness_watchers.get(task_id, ()))
+        for run_id in stale_run_ids:
+            self._drop_run_readiness(run_id)
+            self._dispatch_counters.discard(run_id)
+        self._read_models.touch_all()
+        for run_id in touched_run_ids:
+            record = dict.get(self._workflow_runs, run_id)
+            if record is None:
+                self._run_index.discard(run_id)
+            else:
+                self._run_index.put(
+                    run_id, record.workflow_template_id, record.status, record.created_at, record.updated_at
+                )
+        for task_id in touched_task_ids:
+            task_record = dict.get(self._tasks, task_id)
+            if task_record is None:
+                self._task_index.discard(task_id)
+            else:
+                self._task_index.put(task_id, task_record.status)
+        for path in touched_lock_paths:
+            owner_task_id = dict.get(self._path_locks, path)
+            if owner_task_id is None:
+                self._lock_trie.discard(path)
+            else:
+                self._lock_trie.put(path, owner_task_id)
+        for approval_id in touched_approval_ids:
+            self._sync_pending_approval(approval_id)
+        for task_id in touched_handoff_task_ids:
+            handoff = self._handoffs.get(task_id)
+            if handoff is None:
+                self._handoff_index.discard(task_id)
+            else:
+                self._index_handoff(handoff)
+        self._event_index.truncate(self._events, savepoint.event_count)
+        self._events.truncate(savepoint.event_count)
+        self._artifact_index.truncate(self._artifacts, savepoint.artifact_count)
+        del self._artifacts[savepoint.artifact_count :]
+        sequences = savepoint.sequences
+        self._project_seq = sequences["project_seq"]
+        self._skill_pack_seq = sequences["skill_pack_seq"]
+        self._role_seq = sequences["role_seq"]
+        self._task_seq = sequences["task_seq"]
+        self._workflow_template_seq = sequences["workflow_template_seq"]
+        self._workflow_run_seq = sequences["workflow_run_seq"]
+        self._approval_seq = sequences["approval_seq"]
+        self._event_seq = sequences["event_seq"]
+        self._artifact_seq = sequences["artifact_seq"]
+        self._rollback_storage_savepoint(savepoint.storage_token)
+
+    def _open_storage_savepoint(self) -> Any:
+        return None
+
+    def _release_storage_savepoint(self, token: Any) -> None:
+        return None
+
+    def _rollback_storage_savepoint(self, token: Any) -> None:
+        return None
+
     def _persist_state(self) -> None:
+        with self._transaction_lock:
+            if self._transaction_depth:
+                return
+            self._flush_state_changes()
+            if self._retention_due():
+                self.apply_retention()
+
+    def _flush_state_changes(self) -> None:
         if self._state_file is None:
+            self._reset_dirty_tracking()
+            return
+
+        if self._state_backend == "journal":
+            entry = self._collect_journal_entry()
+            if entry is None:
+                return
+            self._journal_lsn += 1
+            entry["lsn"] = self._journal_lsn
+            line = encode_journal_entry(entry)
+            self._persister.submit(line)
+            self._journal_tail_entries += 1
+            self._journal_tail_bytes += len(line)
+            if (
+                self._journal_tail_entries >= self._journal_checkpoint_entries
+                or self._journal_tail_bytes >= self._journal_checkpoint_bytes
+            ):
+                self.checkpoint_state()
             return
 
+        if self._state_backend == "directory":
+            change = self._collect_directory_change()
+            if change is not None:
+                self._persister.submit(change)
+            return
+
+        self._reset_dirty_tracking()
+        self._persister.submit(_SNAPSHOT_DUE)
+
+    @_serialized
+    def checkpoint_state(self) -> None:
+        if self._state_file is None or self._state_backend != "journal":
+            return
+        self._persister.submit(
+            _JournalCheckpoint(
+                lsn=self._journal_lsn,
+                payload=self._encode_snapshot(journal_lsn=self._journal_lsn),
+            )
+        )
+        self._journal_tail_entries = 0
+        self._journal_tail_bytes = 0
+
+    def apply_retention(self, *, now: datetime | None = None) -> dict[str, int]:
+        result = {"archived_runs": 0, "archived_events": 0, "archived_artifacts": 0}
+        with self._transaction_lock:
+            if self._archive is None or self._transaction_depth:
+                return result
+            self._last_retention_check = time.monotonic()
+            run_ids = self._retention_candidates(now or datetime.now(timezone.utc))
+            if not run_ids:
+                return result
+            self._flush_state_changes()
+            events, artifacts = self._select_run_history(run_ids)
+            self._archive.write_segment(
+                events=[event.model_dump(mode="json") for event in events],
+                artifacts=[artifact.model_dump(mode="json") for artifact in artifacts],
+            )
+            self._archived_run_ids.update(run_ids)
+            self._prune_run_history(run_ids, events=events, artifacts=artifacts)
+            self._read_models.touch_activity(run_ids=run_ids)
+            self._read_models.touch_events()
+        result.update(archived_runs=len(run_ids), archived_events=len(events), archived_artifacts=len(artifacts))
+        return result
+
+    def _retention_due(self) -> bool:
+        if self._archive is None or (self._retention_max_age_s is None and self._retention_hot_runs is None):
+            return False
+        return time.monotonic() - self._last_retention_check >= self._retention_check_interval_s
+
+    def _retention_candidates(self, now: datetime) -> set[int]:
+        if self._retention_max_age_s is None and self._retention_hot_runs is None:
+            return set()
+        hot_run_ids = self._history_run_ids()
+        terminal_runs = sorted(
+            (
+                (self._run_index.updated_at(run_id), run_id)
+                for run_id in self._run_index.select(statuses=_TERMINAL_RUN_STATUSES)
+            ),
+            reverse=True,
+        )
+        candidates: set[int] = set()
+        for position, (updated_at, run_id) in enumerate(terminal_runs):
+            if run_id not in hot_run_ids:
+                continue
+            expired = (
+                self._retention_max_age_s is not None
+                and (now - datetime.fromisoformat(updated_at)).total_seconds() >= self._retention_max_age_s
+            )
+            overflow = self._retention_hot_runs is not None and position >= self._retention_hot_runs
+            if expired or overflow:
+                candidates.add(run_id)
+        return candidates
+
+    def _history_run_ids(self) -> set[int]:
+        run_ids = self._event_index.run_ids()
+        run_ids.update(self._artifact_index.run_ids())
+        return run_ids
+
+    def _select_run_history(self, run_ids: set[int]) -> tuple[list[EventRead], list[ArtifactRead]]:
+        positions = sorted(position for run_id in run_ids for position in self._event_index.by_run.get(run_id, []))
+        artifact_positions = sorted(
+            position for run_id in run_ids for position in self._artifact_index.by_run.get(run_id, [])
+        )
+        return (
+            self._events.materialize(positions),
+            [self._artifacts[position] for position in artifact_positions],
+        )
+
+    def _prune_run_history(
+        self,
+        run_ids: set[int],
+        *,
+        events: list[EventRead],
+        artifacts: list[ArtifactRead],
+    ) -> None:
+        self._replace_events(
+            self._events.materialize(
+                position for position in range(len(self._events)) if self._events.keys_at(position)[1] not in run_ids
+            )
+        )
+        self._replace_artifacts([artifact for artifact in self._artifacts if artifact.run_id not in run_ids])
+        if self._state_file is None:
+            return
+        if self._state_backend == "journal":
+            self.checkpoint_state()
+        elif self._state_backend == "directory":
+            self._persister.submit(
+                DirectoryChange(
+                    pruned_events={event.id for event in events},
+                    pruned_artifacts={artifact.id for artifact in artifacts},
+                )
+            )
+        else:
+            self._flush_state_changes()
+
+    def _write_state_batch(self, batch: list[Any], fsync: bool) -> None:
+        if self._state_file is None:
+            return
+        if self._state_dir is not None:
+            write_directory_changes(self._state_dir, batch, fsync=fsync)
+            return
+        if self._state_backend != "journal":
+            # One encode per batch: queued items only mark the snapshot as due.
+            with self._transaction_lock:
+                payload = self._encode_snapshot()
+            self._write_snapshot(payload, fsync=fsync)
+            return
+        if self._journal_file is None:
+            return
+
+        checkpoint_index = max(
+            (index for index, item in enumerate(batch) if isinstance(item, _JournalCheckpoint)),
+            default=None,
+        )
+        if checkpoint_index is not None:
+            checkpoint: _JournalCheckpoint = batch[checkpoint_index]
+            self._write_snapshot(checkpoint.payload, fsync=True)
+            truncate_journal(self._journal_file, fsync=True)
+            batch = batch[checkpoint_index + 1 :]
+        lines = [item for item in batch if not isinstance(item, _JournalCheckpoint)]
+        if lines:
+            append_journal_lines(self._journal_file, lines, fsync=fsync)
+
+    def _write_snapshot(self, payload: str | Iterable[bytes], *, fsync: bool) -> None:
+        if self._state_file is None:
+            return
+        chunks = [payload.encode("utf-8")] if isinstance(payload, str) else payload
+        write_checksummed(self._state_file, chunks, fsync=fsync)
+
+    def _encode_snapshot(self, *, journal_lsn: int | None = None) -> str | Iterable[bytes]:
+        if self._state_format == "binary":
+            frames = encode_binary_snapshot(self._snapshot_sections(journal_lsn=journal_lsn))
+            # Sync writes run inline under the store lock, so frames can stream straight from live state.
+            return frames if self._persister.durability == "sync" else list(frames)
         snapshot = self._snapshot()
-        self._state_file.parent.mkdir(parents=True, exist_ok=True)
-        tmp_file = self._state_file.with_name(f"{self._state_file.name}.tmp")
-        tmp_file.write_text(json.dumps(snapshot, ensure_ascii=True, sort_keys=True), encoding="utf-8")
-        tmp_file.replace(self._state_file)
+        if journal_lsn is not None:
+            snapshot["journal_lsn"] = journal_lsn
+        return json.dumps(snapshot, ensure_ascii=True, sort_keys=True)
+
+    def _snapshot_sections(self, *, journal_lsn: int | None = None) -> Iterator[Section]:
+        for collection in _STATE_COLLECTIONS:
+            yield collection, "map", (
+                (str(key), self._serialize_state_value(collection, value))
+                for key, value in getattr(self, f"_{collection}").items()
+            )
+        yield "events", "list", (("", record) for record in self._events.records())
+        yield "artifacts", "list", (("", artifact.model_dump()) for artifact in self._artifacts)
+        yield "sequences", "map", self._sequences_snapshot().items()
+        if journal_lsn is not None:
+            yield "journal_lsn", "value", [("", journal_lsn)]
+
+    def flush_state(self) -> None:
+        self._persister.flush()
+
+    def close(self, *, flush: bool = True) -> None:
+        self._persister.close(flush=flush)
+
+    def read_model_stats(self) -> dict[str, int]:
+        return self._read_models.stats()
+
+    def persistence_stats(self) -> dict[str, Any]:
+        return {
+            "state_backend": self._state_backend,
+            "durability": self._persister.durability,
+            "submitted_writes": self._persister.submitted_count,
+            "disk_batches": self._persister.batch_count,
+            "idle": self._persister.is_idle(),
+            "journal_lsn": self._journal_lsn,
+            "journal_tail_entries": self._journal_tail_entries,
+            "journal_tail_bytes": self._journal_tail_bytes,
+            "load_mode": self._load_mode,
+            "archive": self._archive.stats() if self._archive is not None else None,
+            "last_error": str(self._persister.last_error) if self._persister.last_error is not None else None,
+        }
+
+    def _reset_dirty_tracking(self) -> None:
+        for collection in _STATE_COLLECTIONS:
+            getattr(self, f"_{collection}").reset_tracking()
+        self._flushed_event_seq = self._event_seq
+        self._flushed_artifact_seq = self._artifact_seq
+
+    def _drain_dirty_records(self) -> tuple[dict[str, dict[str, Any]], dict[str, list[str]]]:
+        upserts: dict[str, dict[str, Any]] = {}
+        deletes: dict[str, list[str]] = {}
+        for collection in _STATE_COLLECTIONS:
+            tracked: _TrackedDict = getattr(self, f"_{collection}")
+            if tracked.dirty_keys:
+                upserts[collection] = {
+                    str(key): self._serialize_state_value(collection, tracked[key])
+                    for key in tracked.dirty_keys
+                }
+            if tracked.deleted_keys:
+                deletes[collection] = [str(key) for key in tracked.deleted_keys]
+            tracked.reset_tracking()
+        return upserts, deletes
+
+    def _drain_new_history(self) -> tuple[list[EventRead], list[ArtifactRead]]:
+        new_event_count = self._event_seq - self._flushed_event_seq
+        new_artifact_count = self._artifact_seq - self._flushed_artifact_seq
+        self._flushed_event_seq = self._event_seq
+        self._flushed_artifact_seq = self._artifact_seq
+        new_events = self._events[-new_event_count:] if new_event_count > 0 else []
+        new_artifacts = self._artifacts[-new_artifact_count:] if new_artifact_count > 0 else []
+        return new_events, new_artifacts
+
+    def _collect_journal_entry(self) -> dict[str, Any] | None:
+        upserts, deletes = self._drain_dirty_records()
+        new_events, new_artifacts = self._drain_new_history()
+        if not upserts and not deletes and not new_events and not new_artifacts:
+            return None
+
+        entry: dict[str, Any] = {"sequences": self._sequences_snapshot()}
+        if upserts:
+            entry["upserts"] = upserts
+        if deletes:
+            entry["deletes"] = deletes
+        if new_events:
+            entry["events"] = [event.model_dump() for event in new_events]
+        if new_artifacts:
+            entry["artifacts"] = [artifact.model_dump() for artifact in new_artifacts]
+        return entry
+
+    def _collect_directory_change(self, *, full: bool = False) -> DirectoryChange | None:
+        change = DirectoryChange()
+        for collection in _STATE_COLLECTIONS:
+            tracked: _TrackedDict = getattr(self, f"_{collection}")
+            if full or tracked.dirty_keys or tracked.deleted_keys:
+                change.collections[collection] = encode_record(
+                    {str(key): self._serialize_state_value(collection, value) for key, value in tracked.items()},
+                    sort_keys=True,
+                )
+            tracked.reset_tracking()
+        new_events, new_artifacts = self._drain_new_history()
+        if full:
+            new_events, new_artifacts = self._events, self._artifacts
+        change.events = [(event.id, encode_record(event.model_dump()) + "\n") for event in new_events]
+        change.artifacts = [(artifact.id, encode_record(artifact.model_dump()) + "\n") for artifact in new_artifacts]
+        if not change.collections and not change.events and not change.artifacts:
+            return None
+        change.sequences = encode_record(self._sequences_snapshot(), sort_keys=True)
+        return change
 
     def _load_state(self) -> None:
-        if self._state_file is None or not self._state_file.exists():
+        if self._state_file is None:
+            return
+        if self._state_dir is not None and has_directory_state(self._state_dir):
+            self._restore_state(read_directory_state(self._state_dir))
+            return
+
+        data: dict[str, Any] = {}
+        trusted = False
+        if self._state_file.exists() and is_binary_snapshot(self._state_file):
+            trusted = self._trusted_load and verify_checksum_file(self._state_file)
+            data = read_binary_snapshot(self._state_file)
+        elif self._state_file.exists():
+            raw = self._state_file.read_bytes()
+            data = json.loads(raw)
+            trusted = self._trusted_load and verify_checksum(self._state_file, raw)
+        journal_entries = (
+            read_journal_entries(self._journal_file)
+            if self._state_backend in ("journal", "directory") and self._journal_file is not None
+            else []
+        )
+        if not data and not journal_entries:
             return
+        checkpoint_lsn = int(data.get("journal_lsn", 0))
+        self._journal_lsn = checkpoint_lsn
+        for entry in journal_entries:
+            lsn = int(entry.get("lsn", 0))
+            if 0 < lsn <= checkpoint_lsn:
+                continue
+            apply_journal_entry(data, entry)
+            self._journal_lsn = max(self._journal_lsn, lsn)
+            self._journal_tail_entries += 1
+        if self._journal_tail_entries and self._journal_file is not None:
+            self._journal_tail_bytes = self._journal_file.stat().st_size
+        self._restore_state(data, trusted=trusted and not self._journal_tail_entries)
+        if self._state_dir is not None:
+            migrated = self._collect_directory_change(full=True)
+            if migrated is not None:
+                write_directory_changes(self._state_dir, [migrated], fsync=True)
+
+    def _restore_state(self, data: dict[str, Any], *, trusted: bool = False) -> None:
+        if trusted:
+            try:
+                self._restore_records(data, build=self._build_trusted_model)
+                self._load_mode = "trusted"
+                return
+            except (KeyError, TypeError, ValueError):
+                pass
+        self._restore_records(data, build=self._build_validated_model)
+        self._load_mode = "validated"
+
+    @staticmethod
+    def _build_trusted_model(model: type[Any], value: dict[str, Any]) -> Any:
+        return _TRUSTED_BUILDERS[model](value)
 
-        raw = self._state_file.read_text(encoding="utf-8")
-        data = json.loads(raw)
-        self._projects = {
-            int(key): _ProjectRecord(**value)
+    @staticmethod
+    def _build_validated_model(model: type[Any], value: dict[str, Any]) -> Any:
+        return model(**value)
+
+    def _restore_records(self, data: dict[str, Any], *, build: Callable[[type[Any], dict[str, Any]], Any]) -> None:
+        self._projects = _TrackedDict(
+            (int(key), _ProjectRecord(**value))
             for key, value in data.get("projects", {}).items()
-        }
-        self._skill_packs = {
-            int(key): _SkillPackRecord(**value)
+        )
+        self._skill_packs = _TrackedDict(
+            (int(key), _SkillPackRecord(**value))
             for key, value in data.get("skill_packs", {}).items()
-        }
-        self._roles = {
-            int(key): _RoleRecord(**value)
+        )
+        self._roles = _TrackedDict(
+            (int(key), _RoleRecord(**value))
             for key, value in data.get("roles", {}).items()
-        }
-        self._tasks = {
-            int(key): _TaskRecord(**value)
+        )
+        self._tasks = _TrackedDict(
+            (int(key), _TaskRecord(**value))
             for key, value in data.get("tasks", {}).items()
-        }
-        self._path_locks = {str(key): int(value) for key, value in data.get("path_locks", {}).items()}
-        self._task_locks = {
-            int(key): [str(item) for item in value]
+        )
+        self._task_index.rebuild((record.id, record.status) for record in self._tasks.values())
+        self._path_locks = _TrackedDict((str(key), int(value)) for key, value in data.get("path_locks", {}).items())
+        self._lock_trie.rebuild(self._path_locks.items())
+        self._task_locks = _TrackedDict(
+            (int(key), [str(item) for item in value])
             for key, value in data.get("task_locks", {}).items()
-        }
-        self._isolated_sessions = {
-            int(key): _IsolatedSessionRecord(**value)
+        )
+        self._isolated_sessions = _TrackedDict(
+            (int(key), _IsolatedSessionRecord(**value))
             for key, value in data.get("isolated_sessions", {}).items()
-        }
-        self._isolated_worktree_locks = {
-            str(key): int(value) for key, value in data.get("isolated_worktree_locks", {}).items()
-        }
-        self._isolated_branch_locks = {
-            str(key): int(value) for key, value in data.get("isolated_branch_locks", {}).items()
-        }
-        self._workflow_templates = {
-            int(key): _WorkflowTemplateRecord(
-                id=int(value["id"]),
-                name=value["name"],
-                project_id=value["project_id"],
-                steps=[WorkflowStep(**step) for step in value["steps"]],
+        )
+        self._isolated_worktree_locks = _TrackedDict(
+            (str(key), int(value)) for key, value in data.get("isolated_worktree_locks", {}).items()
+        )
+        self._isolated_branch_locks = _TrackedDict(
+            (str(key), int(value)) for key, value in data.get("isolated_branch_locks", {}).items()
+        )
+        self._workflow_templates = _TrackedDict(
+            (
+                int(key),
+                _WorkflowTemplateRecord(
+                    id=int(value["id"]),
+                    name=value["name"],
+                    project_id=value["project_id"],
+                    steps=[WorkflowStep(**step) for step in value["steps"]],
+                ),
             )
             for key, value in data.get("workflow_templates", {}).items()
-        }
-        self._workflow_runs = {
-            int(key): _WorkflowRunRecord(
-                id=int(value["id"]),
-                workflow_template_id=value.get("workflow_template_id"),
-                task_ids=[int(task_id) for task_id in value.get("task_ids", [])],
-                status=value["status"],
-                initiated_by=value.get("initiated_by"),
-                created_at=value["created_at"],
-                updated_at=value["updated_at"],
-                step_dependencies={
-                    int(task_id): [int(dep_task_id) for dep_task_id in dep_task_ids]
-                    for task_id, dep_task_ids in value.get("step_dependencies", {}).items()
-                },
-                step_artifact_requirements={
-                    int(task_id): [dict(requirement) for requirement in requirements]
-                    for task_id, requirements in value.get("step_artifact_requirements", {}).items()
-                },
-            )
+        )
+        self._workflow_runs = _TrackedDict(
+            (int(key), _restore_workflow_run(value))
             for key, value in data.get("workflow_runs", {}).items()
-        }
-        self._task_latest_run = {int(key): int(value) for key, value in data.get("task_latest_run", {}).items()}
-        self._approvals = {
-            int(key): _ApprovalRecord(**value)
+        )
+        self._run_index.rebuild(
+            (record.id, record.workflow_template_id, record.status, record.created_at, record.updated_at)
+            for record in self._workflow_runs.values()
+        )
+        self._reset_run_readiness()
+        self._dispatch_counters.clear()
+        self._task_latest_run = _TrackedDict(
+            (int(key), int(value)) for key, value in data.get("task_latest_run", {}).items()
+        )
+        self._approvals = _TrackedDict(
+            (int(key), _ApprovalRecord(**value))
             for key, value in data.get("approvals", {}).items()
-        }
-        self._task_approval = {int(key): int(value) for key, value in data.get("task_approval", {}).items()}
-        self._audits = {
-            int(key): TaskAudit(**value)
+        )
+        self._task_approval = _TrackedDict((int(key), int(value)) for key, value in data.get("task_approval", {}).items())
+        self._rebuild_pending_approvals()
+        self._read_models.clear()
+        self._audits = _TrackedDict(
+            (int(key), build(TaskAudit, value))
             for key, value in data.get("audits", {}).items()
-        }
-        self._handoffs = {
-            int(key): TaskHandoffRead(**value)
+        )
+        self._handoffs = _TrackedDict(
+            (int(key), build(TaskHandoffRead, value))
             for key, value in data.get("handoffs", {}).items()
-        }
-        self._events = [EventRead(**event) for event in data.get("events", [])]
-        self._artifacts = [ArtifactRead(**artifact) for artifact in data.get("artifacts", [])]
+        )
+        self._handoff_index.rebuild(self._handoff_index_entry(handoff) for handoff in self._handoffs.values())
+        self._replace_events(build(EventRead, event) for event in data.get("events", []))
+        self._replace_artifacts([build(ArtifactRead, artifact) for artifact in data.get("artifacts", [])])
 
         sequences = data.get("sequences", {})
         self._project_seq = int(sequences.get("project_seq", 1))
@@ -3263,44 +4735,44 @@ class InMemoryStore:
         self._artifact_seq = int(sequences.get("artifact_seq", 1))
 
     def _snapshot(self) -> dict[str, Any]:
+        snapshot: dict[str, Any] = {
+            collection: {
+                str(key): self._serialize_state_value(collection, value)
+                for key, value in getattr(self, f"_{collection}").items()
+            }
+            for collection in _STATE_COLLECTIONS
+        }
+        snapshot["events"] = list(self._events.records())
+        snapshot["artifacts"] = [artifact.model_dump() for artifact in self._artifacts]
+        snapshot["sequences"] = self._sequences_snapshot()
+        return snapshot
+
+    @staticmethod
+    def _serialize_state_value(collection: str, value: Any) -> Any:
+        if collection == "workflow_templates":
+            return {
+                "id": value.id,
+                "name": value.name,
+                "project_id": value.project_id,
+                "steps": [step.model_dump() for step in value.steps],
+            }
+        if collection in ("audits", "handoffs"):
+            return value.model_dump()
+        if hasattr(value, "__dataclass_fields__"):
+            return value.__dict__
+        return value
+
+    def _sequences_snapshot(self) -> dict[str, int]:
         return {
-            "projects": {str(key): value.__dict__ for key, value in self._projects.items()},
-            "skill_packs": {str(key): value.__dict__ for key, value in self._skill_packs.items()},
-            "roles": {str(key): value.__dict__ for key, value in self._roles.items()},
-            "tasks": {str(key): value.__dict__ for key, value in self._tasks.items()},
-            "path_locks": self._path_locks,
-            "task_locks": {str(key): value for key, value in self._task_locks.items()},
-            "isolated_sessions": {str(key): value.__dict__ for key, value in self._isolated_sessions.items()},
-            "isolated_worktree_locks": self._isolated_worktree_locks,
-            "isolated_branch_locks": self._isolated_branch_locks,
-            "workflow_templates": {
-                str(key): {
-                    "id": value.id,
-                    "name": value.name,
-                    "project_id": value.project_id,
-                    "steps": [step.model_dump() for step in value.steps],
-                }
-                for key, value in self._workflow_templates.items()
-            },
-            "workflow_runs": {str(key): value.__dict__ for key, value in self._workflow_runs.items()},
-            "task_latest_run": {str(key): value for key, value in self._task_latest_run.items()},
-            "approvals": {str(key): value.__dict__ for key, value in self._approvals.items()},
-            "task_approval": {str(key): value for key, value in self._task_approval.items()},
-            "audits": {str(key): value.model_dump() for key, value in self._audits.items()},
-            "handoffs": {str(key): value.model_dump() for key, value in self._handoffs.items()},
-            "events": [event.model_dump() for event in self._events],
-            "artifacts": [artifact.model_dump() for artifact in self._artifacts],
-            "sequences": {
-                "project_seq": self._project_seq,
-                "skill_pack_seq": self._skill_pack_seq,
-                "role_seq": self._role_seq,
-                "task_seq": self._task_seq,
-                "workflow_template_seq": self._workflow_template_seq,
-                "workflow_run_seq": self._workflow_run_seq,
-                "approval_seq": self._approval_seq,
-                "event_seq": self._event_seq,
-                "artifact_seq": self._artifact_seq,
-            },
+            "project_seq": self._project_seq,
+            "skill_pack_seq": self._skill_pack_seq,
+            "role_seq": self._role_seq,
+            "task_seq": self._task_seq,
+            "workflow_template_seq": self._workflow_template_seq,
+            "workflow_run_seq": self._workflow_run_seq,
+            "approval_seq": self._approval_seq,
+            "event_seq": self._event_seq,
+            "artifact_seq": self._artifact_seq,
         }
 
     @staticmethod
@@ -3326,6 +4798,28 @@ class InMemoryStore:
         )
 
     def _to_task_read(self, record: _TaskRecord) -> TaskRead:
+        version = self._read_models.task_version(record.id)
+        cached = self._read_models.task(record.id, version)
+        if cached is not None:
+            return cached
+        read_model = self._build_task_read(record)
+        self._read_models.put_task(record.id, version, read_model)
+        return read_model
+
+    @staticmethod
+    def _to_task_compact_read(record: _TaskRecord) -> TaskCompactRead:
+        return TaskCompactRead(
+            id=record.id,
+            role_id=record.role_id,
+            title=record.title,
+            status=record.status,
+            project_id=record.project_id,
+            started_at=record.started_at,
+            finished_at=record.finished_at,
+            exit_code=record.exit_code,
+        )
+
+    def _build_task_read(self, record: _TaskRecord) -> TaskRead:
         sandbox = SandboxConfig(**record.sandbox) if record.sandbox is not None else None
         quality_gate_policy = self._task_quality_gate_policy(record)
         quality_gate_summary = self._evaluate_task_quality_gates(record, policy=quality_gate_policy)
@@ -3430,15 +4924,13 @@ class InMemoryStore:
                         status = QualityGateCheckStatus.PENDING
                         message = "handoff artifacts are not available yet"
                 else:
-                    required_artifact_ids = [
-                        artifact.artifact_id for artifact in handoff.artifacts if artifact.is_required
-                    ]
+                    required_artifact_ids = list(self._handoff_index.required_artifact_ids[record.id])
                     details["required_artifact_ids"] = required_artifact_ids
                     if not required_artifact_ids:
                         status = QualityGateCheckStatus.PASS
                         message = "no required handoff artifacts declared"
                     else:
-                        artifacts_by_id = {artifact.id: artifact for artifact in self._artifacts}
+                        artifacts_by_id = self._artifacts_by_ids(required_artifact_ids)
                         missing_artifact_ids: list[int] = []
                         invalid_producer_ids: list[int] = []
                         invalid_run_ids: list[int] = []
@@ -3556,15 +5048,22 @@ class InMemoryStore:
             return None
         return int((finished - started).total_seconds() * 1000)
 
+    def _load_dispatch_counters(self, run_id: int) -> DispatchCounters:
+        if not self._dispatch_counters.loaded(run_id):
+            self._dispatch_counters.load(
+                run_id,
+                heapq.merge(
+                    *(
+                        self._select_events(run_id=run_id, event_type=event_type)
+                        for event_type in DispatchCounters.event_types
+                    ),
+                    key=lambda event: event.id,
+                ),
+            )
+        return self._dispatch_counters
+
     def _dispatch_attempts_by_task_id(self, run_id: int) -> dict[int, int]:
-        attempts: dict[int, int] = {}
-        for event in self._events:
-            if event.run_id != run_id:
-                continue
-            if event.event_type != "task.dispatched" or event.task_id is None:
-                continue
-            attempts[event.task_id] = attempts.get(event.task_id, 0) + 1
-        return attempts
+        return self._load_dispatch_counters(run_id).attempts(run_id)
 
     def _build_workflow_run_metrics(
         self,
@@ -3575,8 +5074,9 @@ class InMemoryStore:
             return None, 0.0, 0, []
 
         updated_at = self._parse_timestamp(record.updated_at)
-        dispatch_attempts = self._dispatch_attempts_by_task_id(record.id)
-        retries_total = sum(max(0, attempts - 1) for attempts in dispatch_attempts.values())
+        counters = self._load_dispatch_counters(record.id)
+        retries_total = counters.retries_total(record.id)
+        role_retries = counters.role_retries(record.id)
 
         successful_tasks = sum(1 for task in task_records if task.status == TaskStatus.SUCCESS.value)
         success_rate = round((successful_tasks / len(task_records)) * 100, 2)
@@ -3608,7 +5108,6 @@ class InMemoryStore:
                     "successful_tasks": 0,
                     "failed_tasks": 0,
                     "throughput_tasks": 0,
-                    "retries_total": 0,
                     "duration_ms_total": 0,
                     "duration_samples": 0,
                 },
@@ -3620,7 +5119,6 @@ class InMemoryStore:
             elif task.status in failed_statuses:
                 aggregate["failed_tasks"] += 1
                 aggregate["throughput_tasks"] += 1
-            aggregate["retries_total"] += max(0, dispatch_attempts.get(task.id, 0) - 1)
 
             task_duration_ms = self._duration_ms(
                 started_at=task.started_at,
@@ -3643,7 +5141,7 @@ class InMemoryStore:
                     failed_tasks=aggregate["failed_tasks"],
                     throughput_tasks=aggregate["throughput_tasks"],
                     success_rate=role_success_rate,
-                    retries_total=aggregate["retries_total"],
+                    retries_total=role_retries.get(role_id, 0),
                     duration_ms=aggregate["duration_ms_total"] if aggregate["duration_samples"] > 0 else None,
                 )
             )
@@ -3651,6 +5149,27 @@ class InMemoryStore:
         return duration_ms, success_rate, retries_total, per_role
 
     def _to_workflow_run_read(self, record: _WorkflowRunRecord) -> WorkflowRunRead:
+        version = self._read_models.run_version(record.id)
+        cached = self._read_models.run(record.id, version)
+        if cached is not None:
+            return cached
+        self._read_models.link_run(record.id, record.task_ids)
+        read_model = self._build_workflow_run_read(record)
+        self._read_models.put_run(record.id, version, read_model)
+        return read_model
+
+    @staticmethod
+    def _to_workflow_run_compact_read(record: _WorkflowRunRecord) -> WorkflowRunCompactRead:
+        return WorkflowRunCompactRead(
+            id=record.id,
+            workflow_template_id=record.workflow_template_id,
+            status=record.status,
+            initiated_by=record.initiated_by,
+            created_at=record.created_at,
+            updated_at=record.updated_at,
+        )
+
+    def _build_workflow_run_read(self, record: _WorkflowRunRecord) -> WorkflowRunRead:
         retry_summary, retry_categories, retry_hints = self._build_workflow_retry_surface(record)
         triage_categories, triage_hints, suggested_next_actions = self._triage_for_run_record(record)
         duration_ms, success_rate, retries_total, per_role = self._build_workflow_run_metrics(record)
@@ -3705,10 +5224,7 @@ class InMemoryStore:
             if task_record is None:
                 continue
             total_tasks += 1
-            task_summary = self._evaluate_task_quality_gates(
-                task_record,
-                policy=self._task_quality_gate_policy(task_record),
-            )
+            task_summary = self._to_task_read(task_record).quality_gate_summary
 
             if task_summary.status == QualityGateSummaryStatus.PASS:
                 passing_tasks += 1
@@ -3773,6 +5289,7 @@ class InMemoryStore:
     def _build_workflow_retry_surface(
         self, record: _WorkflowRunRecord
     ) -> tuple[dict[str, Any], list[str], list[str]]:
+        scheduled_retries = self._load_dispatch_counters(record.id).scheduled_retries(record.id)
         total_retries = 0
         retried_task_ids: list[int] = []
         exhausted_task_ids: list[int] = []
@@ -3780,12 +5297,12 @@ class InMemoryStore:
         failure_triage_hints: list[str] = []
 
         for task_id in record.task_ids:
+            if scheduled_retries.get(task_id, 0) > 0:
+                total_retries += scheduled_retries[task_id]
+                retried_task_ids.append(task_id)
             audit = self._audits.get(task_id)
             if audit is None:
                 continue
-            if audit.retry_attempts > 0:
-                total_retries += audit.retry_attempts
-                retried_task_ids.append(task_id)
             for category in audit.failure_categories:
                 self._append_unique(failure_categories, category)
             for hint in audit.failure_triage_hints:
@@ -4064,6 +5581,311 @@ class InMemoryStore:
     def _is_same_or_under(base: Path, candidate: Path) -> bool:
         return candidate == base or base in candidate.parents
 
-    @classmethod
-    def _paths_overlap(cls, left: Path, right: Path) -> bool:
-        return cls._is_same_or_under(left, right) or cls._is_same_or_under(right, left)
+
+class SqliteStore(InMemoryStore):
+    _supported_state_backends: tuple[str, ...] = ("sqlite",)
+
+    def __init__(
+        self,
+        state_file: str | None = None,
+        *,
+        durability: str = "sync",
+        retention_max_age_s: float | None = None,
+        retention_hot_runs: int | None = None,
+        retention_check_interval_s: float = 60.0,
+        lazy_history: bool = False,
+        history_cache_size: int = 1024,
+    ) -> None:
+        if history_cache_size < 1:
+            raise ValueError("history_cache_size must be >= 1")
+        state_path = Path(state_file).expanduser() if state_file else None
+        self._database_file = sqlite_path_for(state_path) if state_path is not None else None
+        self._connection = connect_state_database(self._database_file, durability=durability)
+        self._database_lock = threading.RLock()
+        self._lazy_history = lazy_history
+        self._history_cache_size = history_cache_size
+        super().__init__(
+            state_file,
+            state_backend="sqlite",
+            durability=durability,
+            retention_max_age_s=retention_max_age_s,
+            retention_hot_runs=retention_hot_runs,
+            retention_check_interval_s=retention_check_interval_s,
+        )
+
+    def close(self, *, flush: bool = True) -> None:
+        super().close(flush=flush)
+        with self._database_lock:
+            self._connection.close()
+
+    def persistence_stats(self) -> dict[str, Any]:
+        stats = super().persistence_stats()
+        stats["lazy_history"] = {
+            collection: tracked.stats()
+            for collection in _LAZY_HISTORY_COLLECTIONS
+            if isinstance(tracked := getattr(self, f"_{collection}"), _LazyRecordDict)
+        } or None
+        return stats
+
+    def _load_state(self) -> None:
+        with self._database_lock:
+            if has_state(self._connection):
+                if self._lazy_history:
+                    self._load_lazy_state()
+                else:
+                    self._restore_state(load_state_rows(self._connection))
+                return
+
+            super()._load_state()
+            if not self._events and not self._artifacts and not any(
+                getattr(self, f"_{collection}") for collection in _STATE_COLLECTIONS
+            ):
+                return
+            snapshot = self._snapshot()
+            write_state_changes(
+                self._connection,
+                upserts={collection: snapshot[collection] for collection in _STATE_COLLECTIONS},
+                deletes={},
+                sequences=snapshot["sequences"],
+            )
+            for event in self._events:
+                insert_event(self._connection, event.model_dump(mode="json"))
+            for artifact in self._artifacts:
+                insert_artifact(self._connection, artifact.model_dump(mode="json"))
+            self._connection.commit()
+            self._replace_events([])
+            self._replace_artifacts([])
+
+    def _load_lazy_state(self) -> None:
+        data = load_state_rows(self._connection, skip=_LAZY_HISTORY_COLLECTIONS)
+        run_statuses = row_statuses(self._connection, "workflow_runs")
+        cold_run_ids = {run_id for run_id, status in run_statuses.items() if status in _TERMINAL_RUN_STATUSES}
+        latest_runs = {int(key): int(value) for key, value in data.get("task_latest_run", {}).items()}
+        task_statuses = row_statuses(self._connection, "tasks")
+        cold_task_ids = {
+            task_id
+            for task_id, status in task_statuses.items()
+            if self._is_terminal_task_status(status) and latest_runs.get(task_id) in cold_run_ids
+        }
+        cold_keys: dict[str, set[int]] = {"workflow_runs": cold_run_ids, "tasks": cold_task_ids}
+        data["workflow_runs"] = load_rows_by_id(
+            self._connection,
+            "workflow_runs",
+            [run_id for run_id in run_statuses if run_id not in cold_run_ids],
+        )
+        data["tasks"] = load_rows_by_id(
+            self._connection,
+            "tasks",
+            [task_id for task_id in task_statuses if task_id not in cold_task_ids],
+        )
+        for collection in ("audits", "handoffs"):
+            keys = record_keys(self._connection, collection)
+            cold_keys[collection] = {int(key) for key in keys if int(key) in cold_task_ids}
+            data[collection] = load_records_by_key(
+                self._connection,
+                collection,
+                [key for key in keys if int(key) not in cold_task_ids],
+            )
+        self._restore_state(data)
+        for collection, keys in cold_keys.items():
+            setattr(
+                self,
+                f"_{collection}",
+                _LazyRecordDict(
+                    getattr(self, f"_{collection}"),
+                    loader=functools.partial(self._load_cold_records, collection),
+                    cold_keys=keys,
+                    capacity=self._history_cache_size,
+                ),
+            )
+        self._run_index.rebuild(workflow_run_index_rows(self._connection))
+        self._task_index.rebuild(task_statuses.items())
+        self._rebuild_pending_approvals()
+        self._read_models.clear()
+        self._handoff_index.rebuild(handoff_index_rows(self._connection))
+
+    def _load_cold_records(self, collection: str, keys: list[int]) -> dict[int, Any]:
+        with self._database_lock:
+            if collection in ("tasks", "workflow_runs"):
+                rows = load_rows_by_id(self._connection, collection, keys)
+            else:
+                rows = {
+                    int(key): value
+                    for key, value in load_records_by_key(self._connection, collection, [str(key) for key in keys]).items()
+                }
+        if collection == "tasks":
+            return {key: _TaskRecord(**value) for key, value in rows.items()}
+        if collection == "workflow_runs":
+            return {key: _restore_workflow_run(value) for key, value in rows.items()}
+        model = TaskAudit if collection == "audits" else TaskHandoffRead
+        return {key: model(**value) for key, value in rows.items()}
+
+    def _open_storage_savepoint(self) -> Any:
+        name = f"uow_{self._transaction_depth}"
+        with self._database_lock:
+            self._connection.execute(f"SAVEPOINT {name}")
+        return name
+
+    def _release_storage_savepoint(self, token: Any) -> None:
+        with self._database_lock:
+            self._connection.execute(f"RELEASE SAVEPOINT {token}")
+
+    def _rollback_storage_savepoint(self, token: Any) -> None:
+        with self._database_lock:
+            self._connection.execute(f"ROLLBACK TO SAVEPOINT {token}")
+            self._connection.execute(f"RELEASE SAVEPOINT {token}")
+
+    def _flush_state_changes(self) -> None:
+        with self._database_lock:
+            upserts, deletes = self._drain_dirty_records()
+            write_state_changes(
+                self._connection,
+                upserts=upserts,
+                deletes=deletes,
+                sequences=self._sequences_snapshot(),
+            )
+            self._connection.commit()
+
+    def _history_run_ids(self) -> set[int]:
+        with self._database_lock:
+            return history_run_ids(self._connection)
+
+    def _select_run_history(self, run_ids: set[int]) -> tuple[list[EventRead], list[ArtifactRead]]:
+        in_filters = {"run_id": sorted(run_ids)}
+        with self._database_lock:
+            event_rows = select_rows(self._connection, "events", filters={}, in_filters=in_filters)
+            artifact_rows = select_rows(self._connection, "artifacts", filters={}, in_filters=in_filters)
+        return [EventRead(**row) for row in event_rows], [ArtifactRead(**row) for row in artifact_rows]
+
+    def _prune_run_history(
+        self,
+        run_ids: set[int],
+        *,
+        events: list[EventRead],
+        artifacts: list[ArtifactRead],
+    ) -> None:
+        with self._database_lock:
+            delete_run_history(self._connection, run_ids)
+            self._connection.commit()
+
+    def _store_event(self, event: EventRead) -> None:
+        with self._database_lock:
+            insert_event(self._connection, event.model_dump(mode="json"))
+
+    def _store_artifact(self, artifact: ArtifactRead) -> None:
+        with self._database_lock:
+            insert_artifact(self._connection, artifact.model_dump(mode="json"))
+
+    def _select_hot_events(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        event_type: str | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        run_ids: list[int] | None = None,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> list[EventRead]:
+        with self._database_lock:
+            rows = select_rows(
+                self._connection,
+                "events",
+                filters={"run_id": run_id, "task_id": task_id, "event_type": event_type},
+                in_filters={"run_id": sorted(set(run_ids))} if run_ids is not None else None,
+                created_since=since,
+                after_id=after_id,
+                before_id=before_id,
+                limit=limit,
+            )
+        return [EventRead(**row) for row in rows]
+
+    def _select_hot_artifacts(
+        self,
+        *,
+        run_id: int | None = None,
+        task_id: int | None = None,
+        artifact_type: ArtifactType | None = None,
+        producer_task_ids: set[int] | None = None,
+        label: str | None = None,
+        after_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[ArtifactRead]:
+        if producer_task_ids is not None and not producer_task_ids:
+            return []
+        with self._database_lock:
+            rows = select_rows(
+                self._connection,
+                "artifacts",
+                filters={
+                    "run_id": run_id,
+                    "task_id": task_id,
+                    "artifact_type": artifact_type.value if artifact_type is not None else None,
+                },
+                in_filters={"producer_task_id": sorted(producer_task_ids)} if producer_task_ids is not None else None,
+                after_id=after_id,
+                limit=limit if label is None else None,
+            )
+        artifacts = [ArtifactRead(**row) for row in rows]
+        if label is None:
+            return artifacts
+        matched = [artifact for artifact in artifacts if label in artifact_labels(artifact)]
+        if limit is None:
+            return matched
+        return matched[:limit] if after_id is not None else matched[-limit:]
+
+    def _hot_artifacts_by_ids(self, artifact_ids: list[int]) -> dict[int, ArtifactRead]:
+        if not artifact_ids:
+            return {}
+        with self._database_lock:
+            rows = select_rows(
+                self._connection,
+                "artifacts",
+                filters={},
+                in_filters={"id": sorted(set(artifact_ids))},
+            )
+        return {int(row["id"]): ArtifactRead(**row) for row in rows}
+
+
+def create_store(
+    state_file: str | None = None,
+    *,
+    state_backend: str = "snapshot",
+    durability: str = "sync",
+    group_commit_interval_ms: int = 5,
+    group_commit_max_batch: int = 256,
+    journal_checkpoint_entries: int = 10_000,
+    journal_checkpoint_bytes: int = 64 * 1024 * 1024,
+    retention_max_age_s: float | None = None,
+    retention_hot_runs: int | None = None,
+    retention_check_interval_s: float = 60.0,
+    trusted_load: bool = True,
+    state_format: str = "json",
+    lazy_history: bool = False,
+    history_cache_size: int = 1024,
+) -> InMemoryStore:
+    if state_backend == "sqlite":
+        return SqliteStore(
+            state_file,
+            durability=durability,
+            retention_max_age_s=retention_max_age_s,
+            retention_hot_runs=retention_hot_runs,
+            retention_check_interval_s=retention_check_interval_s,
+            lazy_history=lazy_history,
+            history_cache_size=history_cache_size,
+        )
+    return InMemoryStore(
+        state_file,
+        state_backend=state_backend,
+        durability=durability,
+        group_commit_interval_ms=group_commit_interval_ms,
+        group_commit_max_batch=group_commit_max_batch,
+        journal_checkpoint_entries=journal_checkpoint_entries,
+        journal_checkpoint_bytes=journal_checkpoint_bytes,
+        retention_max_age_s=retention_max_age_s,
+        retention_hot_runs=retention_hot_runs,
+        retention_check_interval_s=retention_check_interval_s,
+        trusted_load=trusted_load,
+        state_format=state_format,
+    )
@@ -94,3 +94,78 @@ def test_task_without_approval_gate_has_no_approval_record() -> None:
 
     dispatch = client.post(f"/tasks/{task['id']}/dispatch")
     assert dispatch.status_code == 200
+
+
+def test_pending_approvals_listing_and_bulk_decisions() -> None:
+    role_id = _create_role("approval-bulk")
+    other_role_id = _create_role("approval-bulk-other")
+    task_ids = [
+        client.post(
+            "/tasks",
+            json={"role_id": role_id, "title": f"bulk gated {index}", "requires_approval": True},
+        ).json()["id"]
+        for index in range(3)
+    ]
+    other_task_id = client.post(
+        "/tasks",
+        json={"role_id": other_role_id, "title": "bulk gated other", "requires_approval": True},
+    ).json()["id"]
+    run = client.post("/workflow-runs", json={"task_ids": task_ids[:2], "initiated_by": "bulk-test"}).json()
+    approval_ids = [client.get(f"/tasks/{task_id}/approval").json()["id"] for task_id in task_ids]
+    other_approval_id = client.get(f"/tasks/{other_task_id}/approval").json()["id"]
+
+    pending = client.get("/approvals", params={"status": "pending", "role_id": role_id})
+    assert pending.status_code == 200
+    assert [item["id"] for item in pending.json()] == approval_ids
+    by_run = client.get("/approvals", params={"status": "pending", "run_id": run["id"]}).json()
+    assert [item["id"] for item in by_run] == approval_ids[:2]
+    first = client.get("/approvals", params={"status": "pending", "role_id": role_id, "limit": 1}).json()
+    assert [item["id"] for item in first] == approval_ids[:1]
+    for limit in (0, -1):
+        for status in ("pending", "approved"):
+            rejected_limit = client.get("/approvals", params={"status": status, "limit": limit})
+            assert rejected_limit.status_code == 422
+
+    missing = client.post(
+        "/approvals/bulk",
+        json={
+            "actor": "operator",
+            "decisions": [
+                {"approval_id": approval_ids[0], "status": "approved"},
+                {"approval_id": 999_999, "status": "approved"},
+            ],
+        },
+    )
+    assert missing.status_code == 404
+    assert client.get(f"/approvals/{approval_ids[0]}").json()["status"] == "pending"
+    still_pending = client.get("/approvals", params={"status": "pending", "role_id": role_id}).json()
+    assert [item["id"] for item in still_pending] == approval_ids
+
+    invalid = client.post(
+        "/approvals/bulk",
+        json={"decisions": [{"approval_id": approval_ids[0], "status": "pending"}]},
+    )
+    assert invalid.status_code == 422
+
+    decided = client.post(
+        "/approvals/bulk",
+        json={
+            "actor": "operator",
+            "comment": "batch review",
+            "decisions": [
+                {"approval_id": approval_ids[0], "status": "approved"},
+                {"approval_id": approval_ids[1], "status": "rejected", "comment": "not now"},
+                {"approval_id": other_approval_id, "status": "approved"},
+            ],
+        },
+    )
+    assert decided.status_code == 200
+    assert [(item["status"], item["comment"]) for item in decided.json()["approvals"]] == [
+        ("approved", "batch review"),
+        ("rejected", "not now"),
+        ("approved", "batch review"),
+    ]
+    remaining = client.get("/approvals", params={"status": "pending", "role_id": role_id}).json()
+    assert [item["id"] for item in remaining] == [approval_ids[2]]
+    rejected = client.get("/approvals", params={"status": "rejected", "run_id": run["id"]}).json()
+    assert [item["id"] for item in rejected] == [approval_ids[1]]
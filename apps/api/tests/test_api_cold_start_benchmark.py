@@ -0,0 +1,19 @@
+from multyagents_api.cold_start_benchmark import ColdStartBenchmarkConfig, run_cold_start_benchmark
+
+
+def test_cold_start_benchmark_checkpoint_bounds_replayed_tail() -> None:
+    report = run_cold_start_benchmark(
+        ColdStartBenchmarkConfig(
+            event_counts=(200, 1_000),
+            tail_entries=50,
+            journal_checkpoint_entries=100,
+        )
+    )
+
+    assert report["task"] == "TASK-083"
+    assert report["summary"]["overall_status"] == "pass"
+    assert [scenario["event_count"] for scenario in report["scenarios"]] == [200, 1_000]
+    for scenario in report["scenarios"]:
+        assert scenario["checkpoint_tail"]["replayed_entries"] == 50
+        assert scenario["journal_replay"]["replayed_entries"] >= scenario["event_count"]
+        assert scenario["checkpoint_tail"]["synthetic_event_count"] == scenario["event_count"]
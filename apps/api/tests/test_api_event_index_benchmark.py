@@ -0,0 +1,19 @@
+from multyagents_api.event_index_benchmark import EventIndexBenchmarkConfig, run_event_index_benchmark
+
+
+def test_event_index_benchmark_pages_stay_complete_as_log_grows() -> None:
+    report = run_event_index_benchmark(EventIndexBenchmarkConfig(event_counts=(1_000, 5_000), samples=5))
+
+    assert report["task"] == "TASK-085"
+    assert [scenario["event_count"] for scenario in report["scenarios"]] == [1_000, 5_000]
+    for scenario in report["scenarios"]:
+        assert scenario["status"] == "pass"
+        assert set(scenario["latency_us"]) == {
+            "global-tail",
+            "run-timeline",
+            "task-timeline",
+            "run-event-type",
+            "after-cursor",
+            "before-cursor",
+        }
+    assert len(report["latency_checks"]) == 6
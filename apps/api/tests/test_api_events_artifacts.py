@@ -56,6 +56,178 @@ def test_create_and_filter_events() -> None:
     assert event_id in audit.json()["recent_event_ids"]
 
 
+def test_events_page_with_after_and_before_cursors() -> None:
+    role_id = _create_role("events-cursor-role")
+    task = client.post(
+        "/tasks",
+        json={"role_id": role_id, "title": "events cursor task", "execution_mode": "no-workspace"},
+    )
+    assert task.status_code == 200
+    task_id = task.json()["id"]
+    run = client.post("/workflow-runs", json={"task_ids": [task_id], "initiated_by": "test"})
+    assert run.status_code == 200
+    run_id = run.json()["id"]
+
+    note_ids = []
+    for index in range(5):
+        created = client.post(
+            "/events",
+            json={"event_type": "agent.note", "run_id": run_id, "task_id": task_id, "payload": {"index": index}},
+        )
+        assert created.status_code == 200
+        note_ids.append(created.json()["id"])
+
+    latest = client.get(f"/events?run_id={run_id}&event_type=agent.note&limit=2")
+    assert [item["id"] for item in latest.json()] == note_ids[3:]
+
+    older = client.get(f"/events?run_id={run_id}&event_type=agent.note&before_id={note_ids[3]}&limit=2")
+    assert [item["id"] for item in older.json()] == note_ids[1:3]
+
+    newer = client.get(f"/events?run_id={run_id}&event_type=agent.note&after_id={note_ids[0]}&limit=2")
+    assert [item["id"] for item in newer.json()] == note_ids[1:3]
+
+    window = client.get(
+        f"/events?run_id={run_id}&event_type=agent.note&after_id={note_ids[0]}&before_id={note_ids[4]}&limit=10"
+    )
+    assert [item["id"] for item in window.json()] == note_ids[1:4]
+
+    notes = client.get(f"/events?run_id={run_id}&event_type=agent.note&limit=10").json()
+    since = notes[2]["created_at"]
+    multi_run = client.get(
+        "/events",
+        params={"run_ids": [run_id, run_id + 10_000], "event_type": "agent.note", "since": since, "limit": 10},
+    )
+    assert multi_run.status_code == 200
+    assert [item["id"] for item in multi_run.json()] == [item["id"] for item in notes if item["created_at"] >= since]
+    assert client.get("/events", params={"since": "not-a-time"}).status_code == 422
+
+
+
+def test_events_artifacts_and_handoffs_resume_from_next_cursor() -> None:
+    role_id = _create_role("resume-cursor-role")
+    task_ids = [
+        client.post(
+            "/tasks",
+            json={"role_id": role_id, "title": f"resume cursor task {index}", "execution_mode": "no-workspace"},
+        ).json()["id"]
+        for index in range(3)
+    ]
+    run_id = client.post("/workflow-runs", json={"task_ids": task_ids, "initiated_by": "test"}).json()["id"]
+
+    def _note(index: int) -> int:
+        created = client.post(
+            "/events",
+            json={"event_type": "agent.note", "run_id": run_id, "task_id": task_ids[0], "payload": {"index": index}},
+        )
+        return created.json()["id"]
+
+    def _artifact(task_id: int) -> int:
+        created = client.post(
+            "/artifacts",
+            json={
+                "artifact_type": "text",
+                "location": f"/tmp/multyagents/cursor/{task_id}.md",
+                "summary": "cursor artifact",
+                "producer_task_id": task_id,
+                "run_id": run_id,
+            },
+        )
+        return created.json()["id"]
+
+    note_ids = [_note(index) for index in range(3)]
+    first = client.get("/events", params={"run_id": run_id, "event_type": "agent.note", "limit": 2})
+    assert [item["id"] for item in first.json()] == note_ids[1:]
+    cursor = first.headers["x-next-cursor"]
+    idle = client.get("/events", params={"run_id": run_id, "event_type": "agent.note", "cursor": cursor})
+    assert idle.json() == []
+    assert idle.headers["x-next-cursor"] == cursor
+    note_ids.extend(_note(index) for index in range(3, 6))
+    resumed = client.get("/events", params={"run_id": run_id, "event_type": "agent.note", "cursor": cursor, "limit": 2})
+    assert [item["id"] for item in resumed.json()] == note_ids[3:5]
+    rest = client.get(
+        "/events",
+        params={"run_id": run_id, "event_type": "agent.note", "cursor": resumed.headers["x-next-cursor"]},
+    )
+    assert [item["id"] for item in rest.json()] == note_ids[5:]
+    assert client.get("/events", params={"cursor": cursor, "after_id": 1}).status_code == 422
+
+    artifact_ids = [_artifact(task_id) for task_id in task_ids[:2]]
+    artifacts = client.get("/artifacts", params={"run_id": run_id, "limit": 1})
+    assert [item["id"] for item in artifacts.json()] == artifact_ids[1:]
+    artifact_ids.append(_artifact(task_ids[2]))
+    new_artifacts = client.get("/artifacts", params={"run_id": run_id, "cursor": artifacts.headers["x-next-cursor"]})
+    assert [item["id"] for item in new_artifacts.json()] == artifact_ids[2:]
+    assert client.get("/artifacts", params={"cursor": cursor}).status_code == 422
+
+    def _complete(task_id: int) -> None:
+        completed = client.post(f"/runner/tasks/{task_id}/status", json={"status": "success", "handoff": {"summary": "done"}})
+        assert completed.status_code == 200
+
+    _complete(task_ids[0])
+    _complete(task_ids[1])
+    handoffs = client.get("/handoffs", params={"run_id": run_id})
+    assert [item["task_id"] for item in handoffs.json()] == task_ids[:2]
+    _complete(task_ids[2])
+    new_handoffs = client.get("/handoffs", params={"run_id": run_id, "cursor": handoffs.headers["x-next-cursor"]})
+    assert [item["task_id"] for item in new_handoffs.json()] == task_ids[2:]
+    assert client.get("/handoffs", params={"cursor": cursor}).status_code == 422
+
+
+def test_run_summary_and_events_answer_conditional_gets() -> None:
+    role_id = _create_role("etag-role")
+    task = client.post("/tasks", json={"role_id": role_id, "title": "etag task", "execution_mode": "no-workspace"})
+    assert task.status_code == 200
+    task_id = task.json()["id"]
+    run = client.post("/workflow-runs", json={"task_ids": [task_id], "initiated_by": "test"})
+    assert run.status_code == 200
+    run_id = run.json()["id"]
+
+    paths = [
+        f"/workflow-runs/{run_id}",
+        f"/workflow-runs/{run_id}?view=compact",
+        f"/workflow-runs/{run_id}/execution-summary",
+        f"/events?run_id={run_id}",
+    ]
+    etags = {}
+    for path in paths:
+        first = client.get(path)
+        assert first.status_code == 200
+        etags[path] = first.headers["ETag"]
+        cached = client.get(path, headers={"If-None-Match": f'"stale", {etags[path]}'})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etags[path]
+        assert cached.content == b""
+    assert etags[paths[0]] != etags[paths[1]]
+    assert client.get(paths[0], headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get(f"/workflow-runs/{run_id + 10_000}", headers={"If-None-Match": "*"}).status_code == 404
+    other_run = client.post("/workflow-runs", json={"task_ids": [task_id], "initiated_by": "test"}).json()
+    assert client.get(f"/workflow-runs/{other_run['id']}").headers["ETag"] != etags[paths[0]]
+
+    event_etag = etags[paths[3]]
+    for params in (
+        {"run_id": run_id, "limit": 1},
+        {"run_id": run_id, "event_type": "workflow_run.created"},
+        {"task_id": task_id},
+        {"run_id": run_id, "since": "2000-01-01T00:00:00"},
+    ):
+        filtered = client.get("/events", params=params, headers={"If-None-Match": event_etag})
+        assert filtered.status_code == 200
+        assert filtered.headers["ETag"] != event_etag
+    assert (
+        client.get("/events", params={"run_id": run_id, "since": "2000-01-01T00:00:00"}).headers["ETag"]
+        == client.get("/events", params={"run_id": run_id, "since": "2000-01-01T00:00:00+00:00"}).headers["ETag"]
+    )
+    for params in ({"since": "not-a-timestamp"}, {"cursor": "bogus"}, {"cursor": "bogus", "after_id": 1}):
+        assert client.get("/events", params=params, headers={"If-None-Match": "*"}).status_code == 422
+
+    dispatch = client.post(f"/tasks/{task_id}/dispatch")
+    assert dispatch.status_code == 200
+    for path in paths:
+        refreshed = client.get(path, headers={"If-None-Match": etags[path]})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["ETag"] != etags[path]
+
+
 def test_create_and_filter_artifacts() -> None:
     role_id = _create_role("artifacts-role")
     task = client.post(
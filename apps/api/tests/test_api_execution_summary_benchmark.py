@@ -0,0 +1,38 @@
+import pytest
+from execution_summary_reference import reference_execution_summary
+
+from multyagents_api.execution_summary_benchmark import (
+    ExecutionSummaryBenchmarkConfig,
+    run_execution_summary_benchmark,
+)
+
+
+def test_execution_summary_benchmark_matches_reference_summary() -> None:
+    report = run_execution_summary_benchmark(
+        reference_execution_summary,
+        ExecutionSummaryBenchmarkConfig(
+            task_counts=(40, 80),
+            branch_count=8,
+            completed_rounds=2,
+            samples=2,
+            min_cold_speedup=0.01,
+            min_warm_speedup=0.01,
+        ),
+    )
+
+    assert report["task"] == "TASK-086"
+    assert report["summary"]["overall_status"] == "pass"
+    assert [scenario["task_count"] for scenario in report["scenarios"]] == [40, 80]
+    for scenario in report["scenarios"]:
+        checks = {check["id"]: check for check in scenario["checks"]}
+        assert checks["summary-matches-reference"]["passed"] is True
+        assert scenario["task_status_counts"]["success"] == 16
+        assert set(scenario["latency_us"]) == {"reference", "single_pass_cold", "single_pass_warm"}
+
+
+def test_execution_summary_benchmark_rejects_uneven_branches() -> None:
+    with pytest.raises(ValueError):
+        run_execution_summary_benchmark(
+            reference_execution_summary,
+            ExecutionSummaryBenchmarkConfig(task_counts=(30,), branch_count=8),
+        )
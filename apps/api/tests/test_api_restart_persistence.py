@@ -16,7 +16,7 @@ def test_restart_persistence_suite_report_invariants_pass() -> None:
     assert report["summary"]["invariants_total"] == report["summary"]["invariants_passed"]
 
     scenario_names = {scenario["name"] for scenario in report["scenarios"]}
-    assert scenario_names == {"restart-callback-replay"}
+    assert scenario_names == {"restart-callback-replay", "durability-sync", "durability-group", "durability-async"}
     assert all(scenario["status"] == "pass" for scenario in report["scenarios"])
 
 
@@ -35,3 +35,28 @@ def test_restart_persistence_suite_tracks_replay_recoverability() -> None:
     assert invariants["state-recoverability"]["actual"]["callback_replays"] == callback_replays
     assert invariants["no-duplicate-dispatch-events"]["passed"] is True
     assert invariants["no-duplicate-dispatch-events"]["actual"]["duplicate_dispatch_task_ids"] == []
+
+
+def test_restart_persistence_suite_bounds_loss_per_durability_mode() -> None:
+    report = run_restart_persistence_invariant_suite(
+        RestartPersistenceConfig(
+            callback_replays=1,
+            callback_storm_size=10,
+            group_commit_interval_ms=50,
+        )
+    )
+    scenarios = {scenario["name"]: scenario for scenario in report["scenarios"]}
+
+    sync_invariants = {item["id"]: item for item in scenarios["durability-sync"]["invariants"]}
+    assert sync_invariants["sync-crash-loss-bounded"]["actual"]["lost_events"] == 0
+    assert sync_invariants["sync-callback-storm-coalesced"]["passed"] is True
+
+    for durability in ("group", "async"):
+        scenario = scenarios[f"durability-{durability}"]
+        invariants = {item["id"]: item for item in scenario["invariants"]}
+        assert scenario["status"] == "pass"
+        assert invariants[f"{durability}-crash-recovers-consistent-prefix"]["actual"]["event_ids_contiguous"] is True
+        assert invariants[f"{durability}-durable-after-flush-window"]["passed"] is True
+        assert invariants[f"{durability}-graceful-restart-loses-nothing"]["passed"] is True
+        storm = invariants[f"{durability}-callback-storm-coalesced"]["actual"]
+        assert storm["disk_batches"] < storm["submitted_writes"]
@@ -43,3 +43,74 @@ def test_list_tasks_can_filter_by_run_id() -> None:
 
     missing = client.get("/tasks?run_id=999999")
     assert missing.status_code == 404
+
+
+def test_list_tasks_pages_with_cursor_and_status_filter() -> None:
+    role_id = _create_role("tasks-cursor-role")
+    created_ids = [
+        client.post("/tasks", json={"role_id": role_id, "title": f"cursor-{index}", "context7_mode": "inherit"}).json()["id"]
+        for index in range(5)
+    ]
+
+    seen: list[int] = []
+    params: dict[str, object] = {"limit": 2}
+    while True:
+        page = client.get("/tasks", params=params)
+        assert page.status_code == 200
+        assert len(page.json()) <= 2
+        seen.extend(item["id"] for item in page.json())
+        if "cursor" not in params:
+            late = client.post("/tasks", json={"role_id": role_id, "title": "cursor-late", "context7_mode": "inherit"})
+            created_ids.append(late.json()["id"])
+        if "x-next-cursor" not in page.headers:
+            break
+        params["cursor"] = page.headers["x-next-cursor"]
+
+    assert seen == sorted(set(seen))
+    assert set(created_ids) <= set(seen)
+
+    pending = client.get("/tasks", params={"status": ["created", "submit-failed"], "limit": 1000})
+    assert pending.status_code == 200
+    assert {item["status"] for item in pending.json()} <= {"created", "submit-failed"}
+    assert set(created_ids) <= {item["id"] for item in pending.json()}
+
+    run = client.post("/workflow-runs", json={"task_ids": created_ids[:1], "initiated_by": "test"})
+    assert run.status_code == 200
+    runs_cursor = client.get("/workflow-runs", params={"limit": 1}).headers["x-next-cursor"]
+    assert client.get("/tasks", params={"cursor": runs_cursor}).status_code == 422
+    assert client.get("/tasks", params={"cursor": "not-a-cursor"}).status_code == 422
+
+
+def test_compact_view_returns_slim_tasks_and_runs() -> None:
+    role_id = _create_role("tasks-compact-role")
+    task = client.post("/tasks", json={"role_id": role_id, "title": "compact-task", "context7_mode": "inherit"}).json()
+    run = client.post("/workflow-runs", json={"task_ids": [task["id"]], "initiated_by": "test"}).json()
+
+    compact_task = client.get(f"/tasks/{task['id']}", params={"view": "compact"})
+    assert compact_task.status_code == 200
+    assert set(compact_task.json()) == {
+        "id",
+        "role_id",
+        "title",
+        "status",
+        "project_id",
+        "started_at",
+        "finished_at",
+        "exit_code",
+    }
+    assert "quality_gate_summary" in client.get(f"/tasks/{task['id']}").json()
+    listed = client.get("/tasks", params={"run_id": run["id"], "view": "compact"}).json()
+    assert listed == [compact_task.json()]
+
+    compact_run = client.get(f"/workflow-runs/{run['id']}", params={"view": "compact"}).json()
+    assert compact_run == {
+        "id": run["id"],
+        "workflow_template_id": None,
+        "status": run["status"],
+        "initiated_by": "test",
+        "created_at": run["created_at"],
+        "updated_at": compact_run["updated_at"],
+    }
+    assert "per_role" in client.get(f"/workflow-runs/{run['id']}").json()
+    assert compact_run in client.get("/workflow-runs", params={"view": "compact"}).json()
+    assert client.get("/tasks", params={"view": "slim"}).status_code == 422
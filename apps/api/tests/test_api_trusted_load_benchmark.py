@@ -0,0 +1,14 @@
+from multyagents_api.trusted_load_benchmark import TrustedLoadBenchmarkConfig, run_trusted_load_benchmark
+
+
+def test_trusted_load_benchmark_matches_validated_load() -> None:
+    report = run_trusted_load_benchmark(TrustedLoadBenchmarkConfig(event_counts=(200, 1_000)))
+
+    assert report["task"] == "TASK-084"
+    assert report["summary"]["overall_status"] == "pass"
+    assert [scenario["event_count"] for scenario in report["scenarios"]] == [200, 1_000]
+    for scenario in report["scenarios"]:
+        assert scenario["validated_load"]["load_mode"] == "validated"
+        assert scenario["trusted_load"]["load_mode"] == "trusted"
+        assert scenario["checksum_fallback"]["load_mode"] == "validated"
+        assert scenario["trusted_load"]["event_count"] == scenario["event_count"]
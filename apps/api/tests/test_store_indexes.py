@@ -0,0 +1,588 @@
+import pytest
+
+from multyagents_api.schemas import (
+    ArtifactCreate,
+    ArtifactType,
+    EventCreate,
+    EventRead,
+    RoleCreate,
+    RunnerLifecycleStatus,
+    TaskCreate,
+    TaskHandoffPayload,
+    TaskStatus,
+    WorkflowRunCreate,
+    WorkflowRunStatus,
+    WorkflowTemplateCreate,
+)
+from multyagents_api.state_events import ColumnarEventLog
+from multyagents_api.state_index import PathLockTrie
+from multyagents_api.store import InMemoryStore, NotFoundError, ValidationError
+
+
+def _seed(store: InMemoryStore) -> tuple[int, list[int]]:
+    role = store.create_role(RoleCreate(name="index-role"))
+    task_ids = [
+        store.create_task(TaskCreate(role_id=role.id, title=f"index task {index}", execution_mode="no-workspace")).id
+        for index in range(3)
+    ]
+    run = store.create_workflow_run(WorkflowRunCreate(task_ids=task_ids, initiated_by="index-test"))
+    for index in range(30):
+        producer_task_id = task_ids[index % 3]
+        store.create_event(
+            EventCreate(event_type=f"agent.step{index % 2}", run_id=run.id, task_id=producer_task_id, payload={})
+        )
+        store.create_artifact(
+            ArtifactCreate(
+                artifact_type=["text", "report", "diff"][index % 3],
+                location=f"/tmp/index/{index}.md",
+                summary=f"index artifact {index}",
+                producer_task_id=producer_task_id,
+                run_id=run.id,
+                metadata={"label": f"label-{index % 4}", "labels": ["shared"]} if index % 5 else {},
+            )
+        )
+    return run.id, task_ids
+
+
+def test_artifact_index_matches_full_scan() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+
+    for producer_task_ids in ({task_ids[0]}, {task_ids[1], task_ids[2]}):
+        for artifact_type in (None, ArtifactType.TEXT, ArtifactType.REPORT):
+            for label in (None, "label-1", "shared", "missing"):
+                expected = [
+                    artifact
+                    for artifact in store._artifacts
+                    if artifact.run_id == run_id
+                    and artifact.producer_task_id in producer_task_ids
+                    and (artifact_type is None or artifact.artifact_type == artifact_type)
+                    and (
+                        label is None
+                        or artifact.metadata.get("label") == label
+                        or label in artifact.metadata.get("labels", [])
+                    )
+                ]
+                assert store._select_artifacts(
+                    run_id=run_id,
+                    producer_task_ids=producer_task_ids,
+                    artifact_type=artifact_type,
+                    label=label,
+                ) == expected
+
+    wanted = [store._artifacts[3].id, store._artifacts[17].id, 10_000]
+    expected_by_id = {artifact.id: artifact for artifact in store._artifacts if artifact.id in wanted}
+    assert store._artifacts_by_ids(wanted) == expected_by_id
+    assert store.list_artifacts(task_id=task_ids[2], artifact_type=ArtifactType.DIFF, limit=2) == [
+        artifact
+        for artifact in store._artifacts
+        if artifact.task_id == task_ids[2] and artifact.artifact_type == ArtifactType.DIFF
+    ][-2:]
+
+
+def test_indexes_follow_rollback_and_retention_prune() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+    event_count = len(store._events)
+    artifact_count = len(store._artifacts)
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.create_event(EventCreate(event_type="agent.step0", run_id=run_id, task_id=task_ids[0], payload={}))
+            store.create_artifact(
+                ArtifactCreate(
+                    artifact_type="text",
+                    location="/tmp/index/rolled-back.md",
+                    summary="rolled back",
+                    producer_task_id=task_ids[0],
+                    run_id=run_id,
+                )
+            )
+            raise RuntimeError("abort")
+
+    assert len(store._events) == event_count
+    assert len(store._artifacts) == artifact_count
+    assert len(store.list_events(run_id=run_id, event_type="agent.step0", limit=1000)) == 15
+    assert len(store._select_artifacts(run_id=run_id, producer_task_ids={task_ids[0]})) == 10
+
+    store._prune_run_history({run_id}, events=[], artifacts=[])
+    assert store.list_events(run_id=run_id, limit=1000) == []
+    assert store._select_artifacts(run_id=run_id, producer_task_ids=set(task_ids)) == []
+    assert store._artifact_index.run_ids() == set()
+
+
+def test_template_run_index_tracks_status_changes_and_rollback() -> None:
+    store = InMemoryStore()
+    role = store.create_role(RoleCreate(name="template-index-role"))
+    template_ids = [
+        store.create_workflow_template(
+            WorkflowTemplateCreate(
+                name=f"template-index-{index}",
+                steps=[{"step_id": "single", "role_id": role.id, "title": "single", "depends_on": []}],
+            )
+        ).id
+        for index in range(2)
+    ]
+    runs = [
+        store.create_workflow_run(WorkflowRunCreate(workflow_template_id=template_ids[0], task_ids=[]))
+        for _ in range(3)
+    ]
+    other = store.create_workflow_run(WorkflowRunCreate(workflow_template_id=template_ids[1], task_ids=[]))
+    store.update_task_runner_status(runs[0].task_ids[0], status=RunnerLifecycleStatus.SUCCESS)
+    store.update_task_runner_status(runs[1].task_ids[0], status=RunnerLifecycleStatus.FAILED)
+
+    assert store._workflow_template_history_metrics(template_ids[0]) == (3, 33.33)
+    template_runs = store.list_workflow_runs(workflow_template_id=template_ids[0])
+    assert [run.id for run in template_runs] == [run.id for run in runs]
+    assert [run.id for run in store.list_workflow_runs(workflow_template_id=template_ids[1])] == [other.id]
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.create_workflow_run(WorkflowRunCreate(workflow_template_id=template_ids[0], task_ids=[]))
+            store.update_task_runner_status(runs[2].task_ids[0], status=RunnerLifecycleStatus.SUCCESS)
+            assert store._workflow_template_history_metrics(template_ids[0]) == (4, 50.0)
+            raise RuntimeError("abort")
+
+    assert store._workflow_template_history_metrics(template_ids[0]) == (3, 33.33)
+    assert store.get_workflow_run(runs[2].id).status == "created"
+    assert len(store.list_workflow_runs(workflow_template_id=template_ids[0])) == 3
+
+
+def test_task_and_run_pages_follow_status_changes_and_rollback() -> None:
+    store = InMemoryStore()
+    role = store.create_role(RoleCreate(name="page-index-role"))
+    task_ids = [
+        store.create_task(TaskCreate(role_id=role.id, title=f"page task {index}", execution_mode="no-workspace")).id
+        for index in range(6)
+    ]
+    runs = [
+        store.create_workflow_run(WorkflowRunCreate(task_ids=[task_id], initiated_by="page-test")) for task_id in task_ids
+    ]
+    for task_id in task_ids[::2]:
+        store.update_task_runner_status(task_id, status=RunnerLifecycleStatus.SUCCESS)
+
+    first_page = store.list_tasks(limit=4)
+    assert [task.id for task in first_page] == task_ids[:4]
+    assert [task.id for task in store.list_tasks(after_id=first_page[-1].id, limit=4)] == task_ids[4:]
+    success = store.list_tasks(statuses=[TaskStatus.SUCCESS, TaskStatus.FAILED], limit=2)
+    assert [task.id for task in success] == task_ids[:4:2]
+    assert [task.id for task in store.list_tasks(statuses=[TaskStatus.SUCCESS], after_id=success[-1].id)] == [
+        task_ids[4]
+    ]
+    assert [run.id for run in store.list_workflow_runs(statuses=[WorkflowRunStatus.SUCCESS])] == [
+        run.id for run in runs[::2]
+    ]
+    since = store.get_workflow_run(runs[3].id).created_at
+    assert [run.id for run in store.list_workflow_runs(since=since, limit=10)] == [run.id for run in runs[3:]]
+    with pytest.raises(ValidationError):
+        store.list_workflow_runs(since="yesterday")
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.create_task(TaskCreate(role_id=role.id, title="page task rolled back", execution_mode="no-workspace"))
+            store.update_task_runner_status(task_ids[1], status=RunnerLifecycleStatus.SUCCESS)
+            assert len(store.list_tasks(statuses=[TaskStatus.SUCCESS])) == 4
+            raise RuntimeError("abort")
+
+    assert [task.id for task in store.list_tasks(statuses=[TaskStatus.SUCCESS])] == task_ids[::2]
+    assert [task.id for task in store.list_tasks(after_id=task_ids[-1], limit=5)] == []
+    assert [run.id for run in store.list_workflow_runs(statuses=[WorkflowRunStatus.SUCCESS])] == [
+        run.id for run in runs[::2]
+    ]
+
+
+def _brute_force_ready(store: InMemoryStore, run_id: int) -> list[int]:
+    run = store._workflow_runs[run_id]
+    return [
+        task_id
+        for task_id in run.task_ids
+        if store._tasks[task_id].status in ("created", "submit_failed")
+        and all(store._tasks[dep].status == "success" for dep in run.step_dependencies.get(task_id, []))
+    ]
+
+
+def test_run_readiness_tracks_wide_dag_and_partial_rerun() -> None:
+    store = InMemoryStore()
+    role = store.create_role(RoleCreate(name="readiness-role"))
+    steps = [{"step_id": "root", "role_id": role.id, "title": "root", "depends_on": []}]
+    steps.extend(
+        {"step_id": f"fan-{index}", "role_id": role.id, "title": f"fan {index}", "depends_on": ["root"]}
+        for index in range(40)
+    )
+    steps.append(
+        {"step_id": "join", "role_id": role.id, "title": "join", "depends_on": [f"fan-{index}" for index in range(40)]}
+    )
+    template = store.create_workflow_template(WorkflowTemplateCreate(name="readiness-template", steps=steps))
+    run = store.create_workflow_run(WorkflowRunCreate(workflow_template_id=template.id, task_ids=[]))
+    root_id, fan_ids, join_id = run.task_ids[0], run.task_ids[1:-1], run.task_ids[-1]
+
+    def ready_ids() -> list[int]:
+        plan = store.plan_workflow_run_dispatch(run.id, max_tasks=1000)
+        assert [item.task_id for item in plan.ready] == _brute_force_ready(store, run.id)
+        return [item.task_id for item in plan.ready]
+
+    assert ready_ids() == [root_id]
+    assert store.next_dispatchable_task_id(run.id)[0] == root_id
+    store.dispatch_task(root_id)
+    assert ready_ids() == []
+    assert store.next_dispatchable_task_id(run.id) == (None, "dependencies not satisfied", [])
+    store.update_task_runner_status(root_id, status=RunnerLifecycleStatus.SUCCESS)
+    assert ready_ids() == fan_ids
+
+    store.dispatch_task(fan_ids[0])
+    store.update_task_runner_status(fan_ids[0], status=RunnerLifecycleStatus.FAILED)
+    for task_id in fan_ids[1:]:
+        store.dispatch_task(task_id)
+        store.update_task_runner_status(task_id, status=RunnerLifecycleStatus.SUCCESS)
+    assert store.get_workflow_run(run.id).status == "failed"
+
+    store.partial_rerun_workflow_run(
+        run.id,
+        task_ids=[fan_ids[0]],
+        step_ids=[],
+        requested_by="readiness-test",
+        reason="rerun failed branch",
+    )
+    assert ready_ids() == [fan_ids[0]]
+    assert [item.task_id for item in store.plan_workflow_run_dispatch(run.id).blocked] == [join_id]
+    store.dispatch_task(fan_ids[0])
+    store.update_task_runner_status(fan_ids[0], status=RunnerLifecycleStatus.SUCCESS)
+    assert ready_ids() == [join_id]
+    assert store.next_dispatchable_task_id(run.id)[0] == join_id
+
+
+def test_run_status_counters_follow_task_transitions() -> None:
+    store = InMemoryStore()
+    role = store.create_role(RoleCreate(name="counter-role"))
+    steps = [
+        {"step_id": f"step-{index}", "role_id": role.id, "title": f"step {index}", "depends_on": []}
+        for index in range(6)
+    ]
+    template = store.create_workflow_template(WorkflowTemplateCreate(name="counter-template", steps=steps))
+    run = store.create_workflow_run(WorkflowRunCreate(workflow_template_id=template.id, task_ids=[]))
+
+    def assert_counts() -> None:
+        expected: dict[str, int] = {}
+        for task_id in run.task_ids:
+            status = store._tasks[task_id].status
+            expected[status] = expected.get(status, 0) + 1
+        assert store.get_workflow_run_execution_summary(run.id).task_status_counts == expected
+
+    assert_counts()
+    for task_id in run.task_ids:
+        store.dispatch_task(task_id)
+    assert store.get_workflow_run(run.id).status == "running"
+    assert_counts()
+
+    store.update_task_runner_status(run.task_ids[0], status=RunnerLifecycleStatus.FAILED)
+    assert store.get_workflow_run(run.id).status == "failed"
+    assert run.id in store._readiness
+    for task_id in run.task_ids[1:]:
+        store.update_task_runner_status(task_id, status=RunnerLifecycleStatus.SUCCESS)
+        assert_counts()
+    assert store.get_workflow_run(run.id).status == "failed"
+    assert run.id not in store._readiness
+    assert store._readiness_watchers == {}
+
+
+def test_path_lock_trie_reports_ancestor_and_descendant_owners() -> None:
+    trie = PathLockTrie()
+    locks = {"/repo/src": 1, "/repo/docs/api": 2, "/repo/docs/guide/intro.md": 3, "/repo/tests/unit": 4}
+    trie.rebuild(locks.items())
+
+    def overlapping(path: str) -> list[tuple[str, int]]:
+        return sorted(
+            (locked, owner)
+            for locked, owner in locks.items()
+            if locked == path or locked.startswith(path + "/") or path.startswith(locked + "/")
+        )
+
+    for path in ("/repo", "/repo/src/app.py", "/repo/docs", "/repo/docs/api", "/repo/doc", "/repo/tests", "/other"):
+        assert sorted(trie.conflicts(path)) == overlapping(path)
+
+    assert trie.release(["/repo/src", "/repo/docs/api"], 2) == ["/repo/docs/api"]
+    del locks["/repo/docs/api"]
+    assert trie.conflicts("/repo/docs") == [("/repo/docs/guide/intro.md", 3)]
+    assert trie.discard("/repo/docs/guide/intro.md")
+    assert trie.conflicts("/repo/docs") == []
+    assert trie.conflicts("/repo") == [("/repo/src", 1), ("/repo/tests/unit", 4)]
+
+
+def test_dispatch_counters_match_event_log_after_rollback_and_restore() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+
+    def dispatch(task_id: int) -> None:
+        store._append_event(event_type="task.dispatched", run_id=run_id, task_id=task_id, payload={})
+
+    def from_log() -> tuple[dict[int, int], int]:
+        attempts: dict[int, int] = {}
+        for event in store.list_events(run_id=run_id, event_type="task.dispatched", limit=1000):
+            attempts[event.task_id] = attempts.get(event.task_id, 0) + 1
+        return attempts, sum(count - 1 for count in attempts.values())
+
+    for task_id in (task_ids[0], task_ids[1], task_ids[0], task_ids[0]):
+        dispatch(task_id)
+    assert (store._dispatch_attempts_by_task_id(run_id), store.get_workflow_run(run_id).retries_total) == from_log()
+    assert from_log()[1] == 2
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            dispatch(task_ids[1])
+            assert store.get_workflow_run(run_id).retries_total == 3
+            raise RuntimeError("abort")
+    assert (store._dispatch_attempts_by_task_id(run_id), store.get_workflow_run(run_id).retries_total) == from_log()
+
+    store._restore_state(store._snapshot())
+    dispatch(task_ids[2])
+    dispatch(task_ids[2])
+    assert (store._dispatch_attempts_by_task_id(run_id), store.get_workflow_run(run_id).retries_total) == from_log()
+    assert store.get_workflow_run(run_id).retries_total == 3
+
+
+def test_dispatch_counters_track_retry_schedules_and_survive_other_run_rollbacks() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+    other_role = store.create_role(RoleCreate(name="index-other-role"))
+    other_task = store.create_task(TaskCreate(role_id=other_role.id, title="other", execution_mode="no-workspace"))
+    other_run = store.create_workflow_run(WorkflowRunCreate(task_ids=[other_task.id], initiated_by="index-test"))
+
+    for event_type, task_id in (
+        ("task.dispatched", task_ids[0]),
+        ("task.retry_scheduled", task_ids[0]),
+        ("task.dispatched", task_ids[0]),
+        ("task.dispatched", task_ids[1]),
+    ):
+        store._append_event(event_type=event_type, run_id=run_id, task_id=task_id, payload={})
+    for _ in range(2):
+        store._append_event(event_type="task.dispatched", run_id=other_run.id, task_id=other_task.id, payload={})
+
+    run = store.get_workflow_run(run_id)
+    assert run.retries_total == 1
+    assert [(metric.role_id, metric.retries_total) for metric in run.per_role] == [(run.per_role[0].role_id, 1)]
+    assert store.get_workflow_run(other_run.id).per_role[0].retries_total == 1
+    assert store._dispatch_counters.scheduled_retries(run_id) == {task_ids[0]: 1}
+    assert run.retry_summary == {"total_retries": 1, "retried_task_ids": [task_ids[0]]}
+    store.next_dispatchable_task_id(run_id)
+    readiness = store._readiness[run_id]
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store._append_event(event_type="task.dispatched", run_id=other_run.id, task_id=other_task.id, payload={})
+            store.update_task_runner_status(other_task.id, status=RunnerLifecycleStatus.FAILED)
+            raise RuntimeError("abort")
+
+    assert store._dispatch_counters.loaded(run_id)
+    assert store._readiness[run_id] is readiness
+    assert not store._dispatch_counters.loaded(other_run.id)
+    assert store.get_workflow_run(other_run.id).per_role[0].retries_total == 1
+    assert store._dispatch_counters.attempts(run_id) == {task_ids[0]: 2, task_ids[1]: 1}
+
+
+def test_handoff_index_pages_by_update_time_and_tracks_required_artifacts() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+    produced = {
+        task_id: [artifact.id for artifact in store.list_artifacts(task_id=task_id, limit=1000)]
+        for task_id in task_ids
+    }
+
+    def publish(task_id: int, required: list[int]) -> None:
+        store._upsert_task_handoff(
+            task_id=task_id,
+            run_id=run_id,
+            handoff=TaskHandoffPayload(
+                summary=f"handoff {task_id}",
+                artifacts=[{"artifact_id": artifact_id, "is_required": True} for artifact_id in required],
+            ),
+        )
+
+    for task_id in task_ids:
+        publish(task_id, produced[task_id][:2])
+    publish(task_ids[0], produced[task_ids[0]][2:3])
+
+    ordered = [handoff.task_id for handoff in store.list_handoffs(run_id=run_id)]
+    assert ordered == [
+        handoff.task_id for handoff in sorted(store._handoffs.values(), key=lambda item: (item.updated_at, item.task_id))
+    ]
+    assert ordered[-1] == task_ids[0]
+    first_page = store.list_handoffs(run_id=run_id, updated_after="", limit=2)
+    assert [handoff.task_id for handoff in first_page] == ordered[:2]
+    second_page = store.list_handoffs(
+        run_id=run_id,
+        updated_after=first_page[-1].updated_at,
+        after_task_id=first_page[-1].task_id,
+        limit=2,
+    )
+    assert [handoff.task_id for handoff in second_page] == ordered[2:]
+    assert store._required_handoff_artifact_ids(run_id=run_id, from_task_ids=set(task_ids)) == {
+        *produced[task_ids[0]][2:3],
+        *produced[task_ids[1]][:2],
+        *produced[task_ids[2]][:2],
+    }
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            publish(task_ids[1], [])
+            raise RuntimeError("abort")
+    assert [handoff.task_id for handoff in store.list_handoffs(run_id=run_id)] == ordered
+    assert store._handoff_index.required_artifact_ids[task_ids[1]] == tuple(produced[task_ids[1]][:2])
+
+    store._drop_handoff(task_ids[2])
+    assert [handoff.task_id for handoff in store.list_handoffs(limit=1000)] == [
+        task_id for task_id in ordered if task_id != task_ids[2]
+    ]
+    assert store.list_handoffs(task_id=task_ids[2]) == []
+
+
+def test_columnar_event_log_round_trips_and_filters_like_full_scan() -> None:
+    events = [
+        EventRead(
+            id=1,
+            event_type="agent.note",
+            run_id=None,
+            task_id=None,
+            producer_role="system",
+            payload={},
+            created_at="2026-01-01T00:00:00Z",
+        ),
+        EventRead(
+            id=2,
+            contract_version="v2",
+            event_type="task.runner_status_updated",
+            run_id=4,
+            task_id=9,
+            producer_role="runner",
+            payload={"status": "running", "nested": {"text": "h\u00e9llo"}},
+            created_at="2026-01-01T00:00:01.250000+00:00",
+        ),
+    ]
+    log = ColumnarEventLog(events)
+    assert list(log) == events
+    assert log[-1] == events[-1]
+    assert list(log.records()) == [event.model_dump() for event in events]
+    log.truncate(1)
+    assert log == events[:1]
+
+    store = InMemoryStore()
+    role = store.create_role(RoleCreate(name="columnar-role"))
+    run_ids: list[int] = []
+    for index in range(6):
+        task = store.create_task(TaskCreate(role_id=role.id, title=f"columnar {index}", execution_mode="no-workspace"))
+        run_ids.append(store.create_workflow_run(WorkflowRunCreate(task_ids=[task.id], initiated_by="columnar")).id)
+    for index in range(120):
+        store.create_event(
+            EventCreate(
+                event_type=["task.runner_status_updated", "agent.note"][index % 2],
+                run_id=run_ids[index % len(run_ids)],
+                payload={"index": index},
+            )
+        )
+    everything = store.list_events(limit=10_000)
+    since = everything[len(everything) // 2].created_at
+    wanted = set(run_ids[::2])
+    expected = [
+        event
+        for event in everything
+        if event.run_id in wanted and event.event_type == "task.runner_status_updated" and event.created_at >= since
+    ]
+    selected = store.list_events(
+        run_ids=sorted(wanted),
+        event_type="task.runner_status_updated",
+        since=since,
+        limit=10_000,
+    )
+    assert selected == expected
+    assert store.list_events(run_ids=sorted(wanted), since=since, limit=3) == [
+        event for event in everything if event.run_id in wanted and event.created_at >= since
+    ][-3:]
+    assert store.list_events(run_id=run_ids[1], run_ids=sorted(wanted)) == []
+    with pytest.raises(ValidationError):
+        store.list_events(since="yesterday")
+
+
+def test_read_model_cache_serves_unchanged_entities_and_follows_writes() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+
+    def fresh_run():
+        return store._build_workflow_run_read(store._workflow_runs[run_id])
+
+    def fresh_task(task_id: int):
+        return store._build_task_read(store._tasks[task_id])
+
+    run = store.get_workflow_run(run_id)
+    task = store.get_task(task_ids[1])
+    hits = store.read_model_stats()["hits"]
+    assert store.list_workflow_runs()[0] is run
+    assert store.get_task(task_ids[1]) is task
+    assert store.read_model_stats()["hits"] == hits + 2
+
+    store.dispatch_task(task_ids[0])
+    store.update_task_runner_status(task_ids[0], status=RunnerLifecycleStatus.FAILED, message="network timeout")
+    assert store.get_task(task_ids[0]) == fresh_task(task_ids[0])
+    assert store.get_task(task_ids[0]).failure_category == "network"
+    assert store.get_workflow_run(run_id) == fresh_run()
+    assert store.get_workflow_run(run_id).per_role != run.per_role
+    assert store.get_task(task_ids[1]) is task
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.dispatch_task(task_ids[1])
+            assert store.get_task(task_ids[1]).status.value == "dispatched"
+            raise RuntimeError("abort")
+    assert store.get_task(task_ids[1]) == task
+    assert store.get_workflow_run(run_id) == fresh_run()
+
+    store._restore_state(store._snapshot())
+    assert store.get_task(task_ids[0]) == fresh_task(task_ids[0])
+    assert store.read_model_stats()["cached_runs"] == 0
+
+
+def test_compact_reads_skip_derived_sections() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+    store.update_task_runner_status(task_ids[0], status=RunnerLifecycleStatus.FAILED, message="network timeout")
+    stats = store.read_model_stats()
+
+    compact_tasks = store.list_compact_tasks(run_id=run_id)
+    compact_run = store.get_compact_workflow_run(run_id)
+    assert store.list_compact_workflow_runs(statuses=[compact_run.status]) == [compact_run]
+    assert store.get_compact_task(task_ids[0]) == compact_tasks[0]
+    assert store.read_model_stats() == stats
+
+    full_tasks = store.list_tasks(run_id=run_id)
+    for compact, full in zip(compact_tasks, full_tasks, strict=True):
+        assert compact.model_dump() == full.model_dump(include=set(type(compact).model_fields))
+    full_run = store.get_workflow_run(run_id)
+    assert compact_run.model_dump() == full_run.model_dump(include=set(type(compact_run).model_fields))
+
+
+def test_entity_versions_follow_writes_without_building_read_models() -> None:
+    store = InMemoryStore()
+    run_id, task_ids = _seed(store)
+    store._restore_state(store._snapshot())
+    store.get_workflow_run_execution_summary(run_id)
+    stats = store.read_model_stats()
+    run_version = store.workflow_run_version(run_id)
+    summary_version = store.workflow_run_summary_version(run_id)
+    events_version = store.events_version()
+    assert store.workflow_run_version(run_id) == run_version
+    assert store.workflow_run_summary_version(run_id) == summary_version
+    assert store.events_version() == events_version
+    assert store.read_model_stats() == stats
+
+    store.create_artifact(
+        ArtifactCreate(artifact_type="text", location="/tmp/index/extra.md", summary="extra", producer_task_id=task_ids[2])
+    )
+    assert store.workflow_run_version(run_id) == run_version
+    assert store.workflow_run_summary_version(run_id) != summary_version
+    assert store.events_version() != events_version
+
+    summary_version = store.workflow_run_summary_version(run_id)
+    store.update_task_runner_status(task_ids[0], status=RunnerLifecycleStatus.FAILED, message="network timeout")
+    assert store.workflow_run_version(run_id) != run_version
+    assert store.workflow_run_summary_version(run_id) != summary_version
+    assert store.get_workflow_run(run_id) == store._build_workflow_run_read(store._workflow_runs[run_id])
+    with pytest.raises(NotFoundError):
+        store.workflow_run_version(run_id + 1)
@@ -1,7 +1,24 @@
+import json
+import threading
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
-from multyagents_api.schemas import ArtifactCreate, EventCreate, RoleCreate, SkillPackCreate, TaskCreate, WorkflowRunCreate
-from multyagents_api.store import InMemoryStore
+import pytest
+
+from multyagents_api.schemas import (
+    ArtifactCreate,
+    EventCreate,
+    RoleCreate,
+    RunnerLifecycleStatus,
+    SkillPackCreate,
+    TaskCreate,
+    WorkflowRunCreate,
+)
+from multyagents_api.state_binary import MAGIC, convert_binary_to_json, convert_json_to_binary, read_binary_snapshot
+from multyagents_api.state_persister import StatePersister
+from multyagents_api.store import InMemoryStore, SqliteStore
 
 
 def test_store_restores_snapshot_from_state_file(tmp_path: Path) -> None:
@@ -70,3 +87,474 @@ def test_store_restores_snapshot_from_state_file(tmp_path: Path) -> None:
     assert any(event.event_type == "task.dispatched" for event in events)
     assert any(event.event_type == "agent.note" for event in events)
     assert any(artifact.artifact_type == "report" for artifact in artifacts)
+
+
+def _seed_run(store: InMemoryStore) -> tuple[int, int]:
+    role = store.create_role(RoleCreate(name="journal-role"))
+    task = store.create_task(
+        TaskCreate(
+            role_id=role.id,
+            title="journal task",
+            context7_mode="inherit",
+            execution_mode="no-workspace",
+        )
+    )
+    run = store.create_workflow_run(WorkflowRunCreate(task_ids=[task.id], initiated_by="journal-test"))
+    return task.id, run.id
+
+
+def test_store_journal_backend_replays_changes_on_restart(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    journal_file = tmp_path / "api-state.json.journal"
+    first = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    task_id, run_id = _seed_run(first)
+    first.dispatch_task(task_id)
+    first.create_event(
+        EventCreate(event_type="agent.note", run_id=run_id, task_id=task_id, payload={"message": "journaled"})
+    )
+
+    assert not state_file.exists()
+    assert journal_file.exists()
+
+    second = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    assert second.get_task(task_id).status == first.get_task(task_id).status
+    assert second.get_workflow_run(run_id).status == first.get_workflow_run(run_id).status
+    assert [event.id for event in second.list_events(run_id=run_id, limit=100)] == [
+        event.id for event in first.list_events(run_id=run_id, limit=100)
+    ]
+
+    extra = second.create_event(EventCreate(event_type="agent.note", run_id=run_id, payload={}))
+    assert extra.id > max(event.id for event in first.list_events(limit=100))
+
+
+def test_store_journal_entry_contains_only_changed_records(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    journal_file = tmp_path / "api-state.json.journal"
+    store = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    _, run_id = _seed_run(store)
+    for index in range(5):
+        store.create_role(RoleCreate(name=f"bulk-role-{index}"))
+
+    store.create_event(EventCreate(event_type="agent.note", run_id=run_id, payload={"message": "tail"}))
+    last_entry = json.loads(journal_file.read_text(encoding="utf-8").splitlines()[-1])
+
+    assert "upserts" not in last_entry
+    assert [event["event_type"] for event in last_entry["events"]] == ["agent.note"]
+    assert last_entry["sequences"]["role_seq"] == 7
+
+
+def test_store_journal_ignores_torn_trailing_entry(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    journal_file = tmp_path / "api-state.json.journal"
+    first = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    task_id, _ = _seed_run(first)
+    with journal_file.open("a", encoding="utf-8") as handle:
+        handle.write('{"upserts": {"roles": {"99": ')
+
+    second = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    assert second.get_task(task_id).title == "journal task"
+    assert second.list_roles()[-1].name == "journal-role"
+
+
+def test_store_journal_truncates_torn_tail_before_next_append(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    journal_file = tmp_path / "api-state.json.journal"
+    first = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    _seed_run(first)
+    intact = journal_file.read_bytes()
+    with journal_file.open("a", encoding="utf-8") as handle:
+        handle.write('{"upserts": {"roles": {"99": ')
+
+    second = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    assert journal_file.read_bytes() == intact
+    role = second.create_role(RoleCreate(name="after-torn-tail"))
+
+    third = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    assert third.list_roles()[-1] == role
+    third.create_role(RoleCreate(name="after-restart"))
+    fourth = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    assert [item.name for item in fourth.list_roles()][-2:] == ["after-torn-tail", "after-restart"]
+
+
+def test_sqlite_store_keeps_history_on_disk_and_restores(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    first = SqliteStore(state_file=str(state_file))
+    task_id, run_id = _seed_run(first)
+    first.dispatch_task(task_id)
+    for index in range(3):
+        first.create_event(
+            EventCreate(event_type="agent.note", run_id=run_id, task_id=task_id, payload={"index": index})
+        )
+    first.create_artifact(
+        ArtifactCreate(
+            artifact_type="report",
+            location="/tmp/multyagents/sqlite/report.md",
+            summary="sqlite artifact",
+            producer_task_id=task_id,
+            run_id=run_id,
+        )
+    )
+
+    assert first._events == []
+    assert first._artifacts == []
+    notes = first.list_events(run_id=run_id, event_type="agent.note", limit=2)
+    assert [event.payload["index"] for event in notes] == [1, 2]
+    first.close()
+
+    second = SqliteStore(state_file=str(state_file))
+    assert (tmp_path / "api-state.json.sqlite3").exists()
+    assert not state_file.exists()
+    assert second.get_task(task_id).status == "dispatched"
+    assert len(second.list_events(run_id=run_id, event_type="agent.note", limit=100)) == 3
+    assert [artifact.artifact_type.value for artifact in second.list_artifacts(run_id=run_id, limit=100)] == ["report"]
+    extra = second.create_event(EventCreate(event_type="agent.note", run_id=run_id, payload={}))
+    assert extra.id == max(event.id for event in second.list_events(limit=1000))
+    plan = second._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM events WHERE run_id = ? AND event_type = ? ORDER BY id DESC",
+        (run_id, "agent.note"),
+    ).fetchall()
+    assert any("idx_events" in str(row) for row in plan)
+    second.close()
+
+
+def test_sqlite_store_imports_existing_snapshot(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    snapshot_store = InMemoryStore(state_file=str(state_file))
+    task_id, run_id = _seed_run(snapshot_store)
+
+    migrated = SqliteStore(state_file=str(state_file))
+    assert migrated.get_task(task_id).title == "journal task"
+    assert any(event.event_type == "workflow_run.created" for event in migrated.list_events(run_id=run_id, limit=100))
+    migrated.close()
+
+    reopened = SqliteStore(state_file=str(state_file))
+    assert reopened.get_workflow_run(run_id).task_ids == [task_id]
+    reopened.close()
+
+
+def test_store_journal_checkpoints_and_replays_only_tail(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    journal_file = tmp_path / "api-state.json.journal"
+    first = InMemoryStore(state_file=str(state_file), state_backend="journal", journal_checkpoint_entries=5)
+    for index in range(12):
+        first.create_role(RoleCreate(name=f"checkpoint-role-{index}"))
+
+    checkpoint = json.loads(state_file.read_text(encoding="utf-8"))
+    tail = [json.loads(line) for line in journal_file.read_text(encoding="utf-8").splitlines()]
+    assert checkpoint["journal_lsn"] == 10
+    assert [entry["lsn"] for entry in tail] == [11, 12]
+
+    second = InMemoryStore(state_file=str(state_file), state_backend="journal", journal_checkpoint_entries=5)
+    assert {role.name for role in second.list_roles()} == {f"checkpoint-role-{index}" for index in range(12)}
+    assert second.persistence_stats()["journal_tail_entries"] == 2
+
+
+def test_store_journal_skips_entries_already_in_checkpoint(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    journal_file = tmp_path / "api-state.json.journal"
+    first = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    task_id, run_id = _seed_run(first)
+    stale_journal = journal_file.read_text(encoding="utf-8")
+    first.checkpoint_state()
+    with journal_file.open("a", encoding="utf-8") as handle:
+        handle.write(stale_journal)
+
+    second = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    event_ids = [event.id for event in second.list_events(run_id=run_id, limit=100)]
+    assert event_ids == sorted(set(event_ids))
+    assert second.get_task(task_id).title == "journal task"
+    assert second.persistence_stats()["journal_tail_entries"] == 0
+
+
+def test_store_directory_backend_rewrites_only_changed_collections(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    state_dir = tmp_path / "api-state.json.d"
+    first = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    task_id, run_id = _seed_run(first)
+    assert (state_dir / "collections" / "tasks.json").exists()
+    assert (state_dir / "events" / "000001.jsonl").exists()
+
+    assert not (state_dir / "collections" / "handoffs.json").exists()
+    (state_dir / "collections" / "tasks.json").unlink()
+    first.create_role(RoleCreate(name="directory-role"))
+
+    assert not (state_dir / "collections" / "tasks.json").exists()
+    assert not (state_dir / "collections" / "handoffs.json").exists()
+    roles = json.loads((state_dir / "collections" / "roles.json").read_text(encoding="utf-8"))
+    assert sorted(role["name"] for role in roles.values()) == ["directory-role", "journal-role"]
+
+    first.dispatch_task(task_id)
+    second = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    assert second.get_task(task_id).status == "dispatched"
+    assert [event.id for event in second.list_events(run_id=run_id, limit=100)] == [
+        event.id for event in first.list_events(run_id=run_id, limit=100)
+    ]
+
+
+def test_store_directory_backend_truncates_torn_segment_tail(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    segment_file = tmp_path / "api-state.json.d" / "events" / "000001.jsonl"
+    first = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    _, run_id = _seed_run(first)
+    intact = segment_file.read_bytes()
+    with segment_file.open("a", encoding="utf-8") as handle:
+        handle.write('{"id": 99, "event_type": "agent.')
+
+    second = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    assert segment_file.read_bytes() == intact
+    event = second.create_event(EventCreate(event_type="agent.note", run_id=run_id, payload={}))
+
+    third = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    assert third.list_events(limit=100)[-1] == event
+    third.create_event(EventCreate(event_type="agent.note", run_id=run_id, payload={"after": "restart"}))
+    fourth = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    assert [item.payload for item in fourth.list_events(limit=100)][-2:] == [{}, {"after": "restart"}]
+
+
+def test_store_directory_backend_migrates_single_state_file(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    snapshot_store = InMemoryStore(state_file=str(state_file))
+    task_id, run_id = _seed_run(snapshot_store)
+    event_ids = [event.id for event in snapshot_store.list_events(limit=100)]
+
+    migrated = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    assert (tmp_path / "api-state.json.d" / "sequences.json").exists()
+    assert migrated.get_task(task_id).title == "journal task"
+    assert [event.id for event in migrated.list_events(limit=100)] == event_ids
+
+    created = migrated.create_event(EventCreate(event_type="agent.note", run_id=run_id, payload={}))
+    reopened = InMemoryStore(state_file=str(state_file), state_backend="directory")
+    assert [event.id for event in reopened.list_events(limit=100)] == [*event_ids, created.id]
+
+
+def test_store_trusted_load_requires_matching_checksum(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    first = InMemoryStore(state_file=str(state_file))
+    task_id, run_id = _seed_run(first)
+    first.dispatch_task(task_id)
+    first.create_artifact(
+        ArtifactCreate(
+            artifact_type="text",
+            location="/tmp/trusted.md",
+            summary="trusted artifact",
+            producer_task_id=task_id,
+            run_id=run_id,
+        )
+    )
+
+    trusted = InMemoryStore(state_file=str(state_file))
+    validated = InMemoryStore(state_file=str(state_file), trusted_load=False)
+    assert trusted.persistence_stats()["load_mode"] == "trusted"
+    assert validated.persistence_stats()["load_mode"] == "validated"
+    assert trusted.get_task_audit(task_id) == validated.get_task_audit(task_id)
+    assert trusted.list_events(limit=100) == validated.list_events(limit=100)
+    assert trusted.list_artifacts(limit=100) == validated.list_artifacts(limit=100)
+    assert json.dumps(trusted._snapshot(), sort_keys=True) == json.dumps(validated._snapshot(), sort_keys=True)
+
+    state_file.write_text(state_file.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    tampered = InMemoryStore(state_file=str(state_file))
+    assert tampered.persistence_stats()["load_mode"] == "validated"
+    assert tampered.get_task_audit(task_id) == validated.get_task_audit(task_id)
+
+
+def test_store_trusted_load_skipped_when_journal_tail_is_replayed(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    first = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    _seed_run(first)
+    first.checkpoint_state()
+    assert InMemoryStore(state_file=str(state_file), state_backend="journal").persistence_stats()["load_mode"] == "trusted"
+    first.create_role(RoleCreate(name="tail-role"))
+
+    reopened = InMemoryStore(state_file=str(state_file), state_backend="journal")
+
+    assert reopened.persistence_stats()["journal_tail_entries"] > 0
+    assert reopened.persistence_stats()["load_mode"] == "validated"
+
+
+def test_store_binary_snapshot_round_trips_state(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.bin"
+    first = InMemoryStore(state_file=str(state_file), state_format="binary")
+    task_id, run_id = _seed_run(first)
+    first.dispatch_task(task_id)
+    first.create_event(EventCreate(event_type="agent.note", run_id=run_id, task_id=task_id, payload={"n": 1}))
+
+    assert state_file.read_bytes().startswith(MAGIC)
+    second = InMemoryStore(state_file=str(state_file))
+    assert second.persistence_stats()["load_mode"] == "trusted"
+    assert json.dumps(second._snapshot(), sort_keys=True) == json.dumps(first._snapshot(), sort_keys=True)
+
+    second.create_role(RoleCreate(name="json-again"))
+    assert json.loads(state_file.read_text(encoding="utf-8"))["roles"]
+
+
+def test_store_binary_journal_checkpoint_with_group_commit(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.bin"
+    first = InMemoryStore(
+        state_file=str(state_file),
+        state_backend="journal",
+        state_format="binary",
+        durability="group",
+        journal_checkpoint_entries=2,
+    )
+    task_id, run_id = _seed_run(first)
+    first.create_event(EventCreate(event_type="agent.note", run_id=run_id, task_id=task_id))
+    first.close()
+
+    assert read_binary_snapshot(state_file)["journal_lsn"] >= 2
+    second = InMemoryStore(state_file=str(state_file), state_backend="journal", state_format="binary")
+    assert json.dumps(second._snapshot(), sort_keys=True) == json.dumps(first._snapshot(), sort_keys=True)
+
+
+def test_store_snapshot_group_commit_encodes_once_per_batch(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(state_file), durability="group", group_commit_interval_ms=50)
+    encodes: list[threading.Thread] = []
+    encode_snapshot = store._encode_snapshot
+
+    def counting_encode_snapshot(**kwargs: Any) -> str | Iterable[bytes]:
+        encodes.append(threading.current_thread())
+        return encode_snapshot(**kwargs)
+
+    store._encode_snapshot = counting_encode_snapshot  # type: ignore[method-assign]
+    task_id, run_id = _seed_run(store)
+    for index in range(20):
+        store.create_event(EventCreate(event_type="agent.note", run_id=run_id, task_id=task_id, payload={"n": index}))
+    store.flush_state()
+
+    stats = store.persistence_stats()
+    assert stats["submitted_writes"] > 20
+    assert len(encodes) == stats["disk_batches"] < stats["submitted_writes"]
+    assert threading.current_thread() not in encodes
+    store.close()
+    reopened = InMemoryStore(state_file=str(state_file))
+    assert json.dumps(reopened._snapshot(), sort_keys=True) == json.dumps(store._snapshot(), sort_keys=True)
+
+
+def test_state_persister_keeps_failed_batch_and_reports_error() -> None:
+    written: list[str] = []
+    failures = [OSError("disk full")]
+    disk_gone = False
+
+    def write_batch(batch: list[str], fsync: bool) -> None:
+        if failures:
+            raise failures.pop()
+        if disk_gone:
+            raise OSError("disk gone")
+        written.extend(batch)
+
+    persister = StatePersister(write_batch, durability="async", interval_ms=0, retry_ms=0)
+    persister.submit("first")
+    with pytest.raises(OSError, match="disk full"):
+        persister.flush()
+    persister.submit("second")
+    persister.flush()
+    assert written == ["first", "second"]
+    assert persister.failure_count == 1
+
+    disk_gone = True
+    persister.submit("third")
+    with pytest.raises(OSError, match="disk gone"):
+        persister.close()
+    assert written == ["first", "second"]
+    disk_gone = False
+    persister.submit("fourth")
+    assert written == ["first", "second", "third", "fourth"]
+
+
+def test_binary_snapshot_converter_round_trips_json(tmp_path: Path) -> None:
+    json_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(json_file))
+    _seed_run(store)
+    binary_file = tmp_path / "api-state.bin"
+    restored_file = tmp_path / "restored.json"
+
+    convert_json_to_binary(json_file, binary_file)
+    convert_binary_to_json(binary_file, restored_file)
+
+    assert json.loads(restored_file.read_text(encoding="utf-8")) == json.loads(json_file.read_text(encoding="utf-8"))
+    converted = InMemoryStore(state_file=str(binary_file))
+    assert converted.persistence_stats()["load_mode"] == "trusted"
+    assert json.dumps(converted._snapshot(), sort_keys=True) == json.dumps(store._snapshot(), sort_keys=True)
+
+    binary_file.write_bytes(binary_file.read_bytes()[:-4])
+    with pytest.raises(ValueError, match="truncated"):
+        read_binary_snapshot(binary_file)
+
+
+def test_sqlite_store_lazy_history_hydrates_terminal_runs_on_demand(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    seed = SqliteStore(state_file=str(state_file))
+    seeded = [_seed_run(seed) for _ in range(3)]
+    for task_id, _run_id in seeded[:2]:
+        seed.dispatch_task(task_id)
+        seed.update_task_runner_status(task_id, status=RunnerLifecycleStatus.SUCCESS)
+    (done_task_id, done_run_id), (other_task_id, other_run_id), (live_task_id, live_run_id) = seeded
+    assert seed.get_workflow_run(done_run_id).status == "success"
+    seed.close()
+
+    eager = SqliteStore(state_file=str(state_file))
+    expected_runs = [run.model_dump() for run in eager.list_workflow_runs()]
+    expected_tasks = {run_id: [task.model_dump() for task in eager.list_tasks(run_id=run_id)] for _, run_id in seeded}
+    expected_audit = eager.get_task_audit(done_task_id).model_dump()
+    eager.close()
+
+    lazy = SqliteStore(state_file=str(state_file), lazy_history=True, history_cache_size=1)
+    stats = lazy.persistence_stats()["lazy_history"]
+    assert stats["workflow_runs"]["resident"] == 1
+    assert stats["workflow_runs"]["cold"] == 2
+    assert stats["tasks"]["cold"] == 2
+    assert set(lazy._tasks.cold_keys) == {done_task_id, other_task_id}
+    assert lazy.get_task(live_task_id).status == "created"
+
+    assert [task.model_dump() for task in lazy.list_tasks(run_id=done_run_id)] == expected_tasks[done_run_id]
+    assert lazy.get_task_audit(done_task_id).model_dump() == expected_audit
+    assert [task.model_dump() for task in lazy.list_tasks(run_id=other_run_id)] == expected_tasks[other_run_id]
+    assert lazy.get_workflow_run(live_run_id).model_dump() == expected_runs[2]
+    stats = lazy.persistence_stats()["lazy_history"]
+    assert stats["workflow_runs"]["resident"] == 2
+    assert stats["workflow_runs"]["cached"] == 1
+    assert stats["workflow_runs"]["hydrations"] == 2
+
+    assert [run.model_dump() for run in lazy.list_workflow_runs()] == expected_runs
+    assert lazy.persistence_stats()["lazy_history"]["workflow_runs"]["cached"] == 1
+    lazy.abort_workflow_run(live_run_id)
+    lazy.close()
+
+    reopened = SqliteStore(state_file=str(state_file), lazy_history=True)
+    assert reopened.persistence_stats()["lazy_history"]["workflow_runs"]["cold"] == 3
+    assert reopened.get_workflow_run(live_run_id).status == "aborted"
+    reopened.close()
+
+
+def test_sqlite_store_lazy_history_pages_and_retention_load_only_needed_rows(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    seed = SqliteStore(state_file=str(state_file))
+    for _ in range(4):
+        task_id, _run_id = _seed_run(seed)
+        seed.dispatch_task(task_id)
+        seed.update_task_runner_status(task_id, status=RunnerLifecycleStatus.SUCCESS)
+    seed.close()
+
+    lazy = SqliteStore(state_file=str(state_file), lazy_history=True, retention_hot_runs=1)
+    loaded: list[tuple[str, list[int]]] = []
+
+    def recording(collection: str, loader: Callable[[list[int]], dict[int, Any]]) -> Callable[[list[int]], dict[int, Any]]:
+        def load(keys: list[int]) -> dict[int, Any]:
+            loaded.append((collection, list(keys)))
+            return loader(keys)
+
+        return load
+
+    for collection in ("workflow_runs", "tasks"):
+        tracked = getattr(lazy, f"_{collection}")
+        tracked.loader = recording(collection, tracked.loader)
+
+    assert len(lazy._retention_candidates(datetime.now(timezone.utc))) == 3
+    assert loaded == []
+    second_page = lazy.list_compact_workflow_runs(after_id=1, limit=2)
+    assert [run.id for run in second_page] == [2, 3]
+    assert [task.id for task in lazy.list_compact_tasks(after_id=3, limit=1)] == [4]
+    assert loaded == [("workflow_runs", [2, 3]), ("tasks", [4])]
+    assert [run.id for run in lazy.list_workflow_runs()] == [1, 2, 3, 4]
+    assert lazy.persistence_stats()["lazy_history"]["workflow_runs"]["resident"] == 0
+    lazy.close()
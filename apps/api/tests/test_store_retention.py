@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from multyagents_api.schemas import ArtifactCreate, EventCreate, RoleCreate, TaskCreate, WorkflowRunCreate
+from multyagents_api.store import InMemoryStore, create_store
+
+
+def _seed_runs(store: InMemoryStore, count: int) -> list[tuple[int, int]]:
+    role = store.create_role(RoleCreate(name="retention-role"))
+    seeded: list[tuple[int, int]] = []
+    for index in range(count):
+        task = store.create_task(
+            TaskCreate(role_id=role.id, title=f"retention task {index}", execution_mode="no-workspace")
+        )
+        run = store.create_workflow_run(WorkflowRunCreate(task_ids=[task.id], initiated_by="retention-test"))
+        store.create_event(
+            EventCreate(event_type="agent.note", run_id=run.id, task_id=task.id, payload={"index": index})
+        )
+        store.create_artifact(
+            ArtifactCreate(
+                artifact_type="text",
+                location=f"/tmp/retention/{index}.md",
+                summary=f"retention artifact {index}",
+                producer_task_id=task.id,
+                run_id=run.id,
+            )
+        )
+        seeded.append((task.id, run.id))
+    return seeded
+
+
+@pytest.mark.parametrize("state_backend", ["snapshot", "journal", "directory", "sqlite"])
+def test_retention_archives_terminal_runs_and_reads_them_back(tmp_path: Path, state_backend: str) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = create_store(str(state_file), state_backend=state_backend, retention_hot_runs=0)
+    (old_task_id, old_run_id), (_live_task_id, live_run_id) = _seed_runs(store, 2)
+    store.abort_workflow_run(old_run_id)
+    old_events = store.list_events(run_id=old_run_id)
+    old_artifacts = store.list_artifacts(run_id=old_run_id)
+    old_task_events = store.list_events(task_id=old_task_id)
+
+    result = store.apply_retention()
+
+    assert result == {
+        "archived_runs": 1,
+        "archived_events": len(old_events),
+        "archived_artifacts": len(old_artifacts),
+    }
+    assert all(event.run_id != old_run_id for event in store.list_events(limit=1000))
+    assert all(artifact.run_id != old_run_id for artifact in store.list_artifacts(limit=1000))
+    assert store.list_events(run_id=live_run_id)
+    assert store.list_events(run_id=old_run_id) == old_events
+    assert store.list_artifacts(run_id=old_run_id) == old_artifacts
+    assert store.list_events(task_id=old_task_id) == old_task_events
+    assert store.apply_retention()["archived_runs"] == 0
+    store.close()
+
+    reopened = create_store(str(state_file), state_backend=state_backend)
+    assert all(event.run_id != old_run_id for event in reopened.list_events(limit=1000))
+    assert reopened.list_events(run_id=old_run_id) == old_events
+    assert reopened.list_artifacts(run_id=old_run_id, limit=1) == old_artifacts[-1:]
+    assert reopened.persistence_stats()["archive"]["archived_runs"] == 1
+    reopened.close()
+
+
+def test_retention_by_age_keeps_recent_terminal_runs_hot(tmp_path: Path) -> None:
+    store = InMemoryStore(state_file=str(tmp_path / "api-state.json"), retention_max_age_s=3600)
+    (_task_id, run_id), = _seed_runs(store, 1)
+    store.abort_workflow_run(run_id)
+
+    assert store.apply_retention()["archived_runs"] == 0
+    later = datetime.now(timezone.utc) + timedelta(hours=2)
+    assert store.apply_retention(now=later)["archived_runs"] == 1
+    assert all(event.run_id != run_id for event in store.list_events(limit=1000))
+    assert {event.run_id for event in store.list_events(run_id=run_id)} == {run_id}
+
+
+def test_retention_runs_on_write_and_keeps_new_history_of_archived_run(tmp_path: Path) -> None:
+    store = InMemoryStore(
+        state_file=str(tmp_path / "api-state.json"),
+        state_backend="journal",
+        retention_hot_runs=0,
+        retention_check_interval_s=0,
+    )
+    (task_id, run_id), = _seed_runs(store, 1)
+    store.abort_workflow_run(run_id)
+    assert store.persistence_stats()["archive"]["archived_runs"] == 1
+
+    late_event = store.create_event(EventCreate(event_type="agent.note", run_id=run_id, task_id=task_id))
+    events = store.list_events(run_id=run_id)
+    assert events[-1] == late_event
+    assert len({event.id for event in events}) == len(events)
@@ -0,0 +1,213 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from multyagents_api.schemas import (
+    ApprovalBulkDecisionRequest,
+    ApprovalStatus,
+    AssistantIntentStartRequest,
+    EventCreate,
+    EventRead,
+    RoleCreate,
+    RunnerSubmission,
+    RunnerSubmitPayload,
+    TaskCreate,
+    TaskRead,
+    WorkflowRunCreate,
+    WorkflowStep,
+    WorkflowTemplateCreate,
+)
+from multyagents_api.store import InMemoryStore, NotFoundError, SqliteStore
+
+
+def _journal_lines(state_file: Path) -> list[str]:
+    journal_file = state_file.with_name(f"{state_file.name}.journal")
+    if not journal_file.exists():
+        return []
+    return journal_file.read_text(encoding="utf-8").splitlines()
+
+
+def _create_template(store: InMemoryStore, *, step_count: int) -> int:
+    role = store.create_role(RoleCreate(name="uow-role"))
+    steps = [
+        WorkflowStep(
+            step_id=f"step-{index}",
+            role_id=role.id,
+            title=f"step {index}",
+            depends_on=[f"step-{index - 1}"] if index else [],
+        )
+        for index in range(step_count)
+    ]
+    return store.create_workflow_template(WorkflowTemplateCreate(name="uow-template", steps=steps)).id
+
+
+def _broken_last_step_run(template_id: int, *, step_count: int) -> WorkflowRunCreate:
+    return WorkflowRunCreate(
+        workflow_template_id=template_id,
+        step_task_overrides={
+            f"step-{step_count - 1}": {
+                "project_id": 999,
+                "execution_mode": "shared-workspace",
+                "lock_paths": ["/tmp/multyagents/uow"],
+            }
+        },
+    )
+
+
+def test_create_workflow_run_flushes_once_for_all_steps(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    template_id = _create_template(store, step_count=5)
+    before = len(_journal_lines(state_file))
+
+    run = store.create_workflow_run(WorkflowRunCreate(workflow_template_id=template_id))
+
+    assert len(run.task_ids) == 5
+    assert len(_journal_lines(state_file)) == before + 1
+
+
+def test_create_workflow_run_rolls_back_half_built_run(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    template_id = _create_template(store, step_count=3)
+    journal_before = _journal_lines(state_file)
+    events_before = [event.id for event in store.list_events(limit=100)]
+
+    with pytest.raises(NotFoundError):
+        store.create_workflow_run(_broken_last_step_run(template_id, step_count=3))
+
+    assert store.list_tasks() == []
+    assert [event.id for event in store.list_events(limit=100)] == events_before
+    assert _journal_lines(state_file) == journal_before
+
+    run = store.create_workflow_run(WorkflowRunCreate(workflow_template_id=template_id))
+    assert run.id == 1
+    assert run.task_ids == [1, 2, 3]
+    reopened = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    assert [task.id for task in reopened.list_tasks()] == [1, 2, 3]
+
+
+def test_failed_unit_of_work_keeps_writes_from_other_threads(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    template_id = _create_template(store, step_count=3)
+    task = store.create_task(TaskCreate(role_id=1, title="uow-thread", execution_mode="no-workspace"))
+    inside_run = threading.Event()
+    event_written = threading.Event()
+    create_task = store.create_task
+
+    def slow_create_task(payload: TaskCreate) -> TaskRead:
+        if payload.project_id is not None:
+            inside_run.set()
+            event_written.wait(timeout=0.3)
+        return create_task(payload)
+
+    store.create_task = slow_create_task  # type: ignore[method-assign]
+    written: list[EventRead] = []
+
+    def write_event() -> None:
+        inside_run.wait(timeout=5)
+        written.append(store.create_event(EventCreate(event_type="agent.note", task_id=task.id, payload={"thread": "other"})))
+        event_written.set()
+
+    writer = threading.Thread(target=write_event)
+    writer.start()
+    with pytest.raises(NotFoundError):
+        store.create_workflow_run(_broken_last_step_run(template_id, step_count=3))
+    writer.join(timeout=5)
+
+    later = store.create_event(EventCreate(event_type="agent.note", task_id=task.id, payload={}))
+    event_ids = [event.id for event in store.list_events(limit=100)]
+    assert len(event_ids) == len(set(event_ids))
+    assert written[0] in store.list_events(limit=100)
+    assert later.id > written[0].id
+    assert [item.id for item in store.list_tasks()] == [task.id]
+    reopened = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    assert [event.id for event in reopened.list_events(limit=100)] == event_ids
+
+
+def test_assistant_intent_submits_outside_the_store_lock(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    template_id = _create_template(store, step_count=2)
+    callbacks: list[EventRead] = []
+    persisted_statuses: list[str] = []
+
+    def submitter(payload: RunnerSubmitPayload) -> RunnerSubmission:
+        reopened = InMemoryStore(state_file=str(state_file), state_backend="journal")
+        persisted_statuses.append(reopened.get_task(payload.task_id).status.value)
+        callback = threading.Thread(
+            target=lambda: callbacks.append(
+                store.create_event(EventCreate(event_type="runner.callback", task_id=payload.task_id, payload={}))
+            )
+        )
+        callback.start()
+        callback.join(timeout=2)
+        return RunnerSubmission(submitted=True, runner_task_status="queued")
+
+    response = store.start_assistant_intent(
+        AssistantIntentStartRequest(workflow_template_id=template_id, initiated_by="uow-test"),
+        submitter=submitter,
+    )
+
+    assert [dispatch.task_id for dispatch in response.dispatches] == [response.run.task_ids[0]]
+    assert persisted_statuses == ["dispatched"]
+    assert [event.task_id for event in callbacks] == [response.run.task_ids[0]]
+
+
+def test_nested_transactions_join_outer_unit_of_work(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(state_file), state_backend="journal")
+
+    with store.transaction():
+        store.create_role(RoleCreate(name="outer-role"))
+        with store.transaction():
+            store.create_role(RoleCreate(name="inner-role"))
+        assert _journal_lines(state_file) == []
+    assert len(_journal_lines(state_file)) == 1
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.create_role(RoleCreate(name="discarded-role"))
+            raise RuntimeError("abort unit of work")
+    assert sorted(role.name for role in store.list_roles()) == ["inner-role", "outer-role"]
+    assert len(_journal_lines(state_file)) == 1
+
+
+def test_bulk_approval_decisions_flush_once(tmp_path: Path) -> None:
+    state_file = tmp_path / "api-state.json"
+    store = InMemoryStore(state_file=str(state_file), state_backend="journal")
+    role = store.create_role(RoleCreate(name="bulk-approval-role"))
+    task_ids = [
+        store.create_task(TaskCreate(role_id=role.id, title=f"gated {index}", requires_approval=True)).id
+        for index in range(4)
+    ]
+    approval_ids = [store.get_task_approval(task_id).id for task_id in task_ids]
+    before = len(_journal_lines(state_file))
+
+    decided = store.decide_approvals(
+        ApprovalBulkDecisionRequest(
+            actor="operator",
+            decisions=[{"approval_id": approval_id, "status": "approved"} for approval_id in approval_ids],
+        )
+    )
+
+    assert [approval.status for approval in decided] == ["approved"] * 4
+    assert store.list_approvals(status=ApprovalStatus.PENDING) == []
+    assert len(_journal_lines(state_file)) == before + 1
+
+
+def test_sqlite_store_rolls_back_half_built_run(tmp_path: Path) -> None:
+    store = SqliteStore(state_file=str(tmp_path / "api-state.json"))
+    template_id = _create_template(store, step_count=3)
+
+    with pytest.raises(NotFoundError):
+        store.create_workflow_run(_broken_last_step_run(template_id, step_count=3))
+
+    assert store.list_events(limit=100) == []
+    store.close()
+    reopened = SqliteStore(state_file=str(tmp_path / "api-state.json"))
+    assert reopened.list_tasks() == []
+    assert reopened.list_events(limit=100) == []
+    reopened.close()
@@ -0,0 +1,36 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+API_DIR="$ROOT_DIR/apps/api"
+EVIDENCE_DIR="${TASK_083_EVIDENCE_DIR:-$ROOT_DIR/docs/evidence/task-083}"
+TIMESTAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+
+if [[ -n "${API_PYTHON_BIN:-}" ]]; then
+  PYTHON_BIN="$API_PYTHON_BIN"
+elif [[ -x "$API_DIR/.venv/bin/python" ]]; then
+  PYTHON_BIN="$API_DIR/.venv/bin/python"
+else
+  PYTHON_BIN="python3"
+fi
+
+mkdir -p "$EVIDENCE_DIR"
+
+JSON_EVIDENCE="$EVIDENCE_DIR/task-083-cold-start-$TIMESTAMP.json"
+MD_EVIDENCE="$EVIDENCE_DIR/task-083-cold-start-$TIMESTAMP.md"
+
+echo "[task-083] using python: $PYTHON_BIN"
+
+echo "[task-083] running journal cold-start benchmark"
+PYTHONPATH="$API_DIR/src" "$PYTHON_BIN" "$API_DIR/scripts/task_083_cold_start_benchmark.py" \
+  --output-json "$JSON_EVIDENCE" \
+  --output-md "$MD_EVIDENCE" \
+  --event-counts "${TASK_083_COLD_START_EVENT_COUNTS:-10000,100000,1000000}" \
+  --tail-entries "${TASK_083_COLD_START_TAIL_ENTRIES:-1000}"
+
+cp "$JSON_EVIDENCE" "$EVIDENCE_DIR/latest-cold-start.json"
+cp "$MD_EVIDENCE" "$EVIDENCE_DIR/latest-cold-start.md"
+
+echo "[task-083] evidence artifacts:"
+echo "  - $JSON_EVIDENCE"
+echo "  - $MD_EVIDENCE"
@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+API_DIR="$ROOT_DIR/apps/api"
+EVIDENCE_DIR="${TASK_084_EVIDENCE_DIR:-$ROOT_DIR/docs/evidence/task-084}"
+TIMESTAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+
+if [[ -n "${API_PYTHON_BIN:-}" ]]; then
+  PYTHON_BIN="$API_PYTHON_BIN"
+elif [[ -x "$API_DIR/.venv/bin/python" ]]; then
+  PYTHON_BIN="$API_DIR/.venv/bin/python"
+else
+  PYTHON_BIN="python3"
+fi
+
+mkdir -p "$EVIDENCE_DIR"
+
+JSON_EVIDENCE="$EVIDENCE_DIR/task-084-trusted-load-$TIMESTAMP.json"
+MD_EVIDENCE="$EVIDENCE_DIR/task-084-trusted-load-$TIMESTAMP.md"
+
+echo "[task-084] using python: $PYTHON_BIN"
+
+echo "[task-084] running trusted state load benchmark"
+PYTHONPATH="$API_DIR/src" "$PYTHON_BIN" "$API_DIR/scripts/task_084_trusted_load_benchmark.py" \
+  --output-json "$JSON_EVIDENCE" \
+  --output-md "$MD_EVIDENCE" \
+  --event-counts "${TASK_084_TRUSTED_LOAD_EVENT_COUNTS:-10000,100000,1000000}"
+
+cp "$JSON_EVIDENCE" "$EVIDENCE_DIR/latest-trusted-load.json"
+cp "$MD_EVIDENCE" "$EVIDENCE_DIR/latest-trusted-load.md"
+
+echo "[task-084] evidence artifacts:"
+echo "  - $JSON_EVIDENCE"
+echo "  - $MD_EVIDENCE"
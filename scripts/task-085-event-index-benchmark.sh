@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+API_DIR="$ROOT_DIR/apps/api"
+EVIDENCE_DIR="${TASK_085_EVIDENCE_DIR:-$ROOT_DIR/docs/evidence/task-085}"
+TIMESTAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+
+if [[ -n "${API_PYTHON_BIN:-}" ]]; then
+  PYTHON_BIN="$API_PYTHON_BIN"
+elif [[ -x "$API_DIR/.venv/bin/python" ]]; then
+  PYTHON_BIN="$API_DIR/.venv/bin/python"
+else
+  PYTHON_BIN="python3"
+fi
+
+mkdir -p "$EVIDENCE_DIR"
+
+JSON_EVIDENCE="$EVIDENCE_DIR/task-085-event-index-$TIMESTAMP.json"
+MD_EVIDENCE="$EVIDENCE_DIR/task-085-event-index-$TIMESTAMP.md"
+
+echo "[task-085] using python: $PYTHON_BIN"
+
+echo "[task-085] running event index query benchmark"
+PYTHONPATH="$API_DIR/src" "$PYTHON_BIN" "$API_DIR/scripts/task_085_event_index_benchmark.py" \
+  --output-json "$JSON_EVIDENCE" \
+  --output-md "$MD_EVIDENCE" \
+  --event-counts "${TASK_085_EVENT_INDEX_EVENT_COUNTS:-1000,10000,100000,1000000}"
+
+cp "$JSON_EVIDENCE" "$EVIDENCE_DIR/latest-event-index.json"
+cp "$MD_EVIDENCE" "$EVIDENCE_DIR/latest-event-index.md"
+
+echo "[task-085] evidence artifacts:"
+echo "  - $JSON_EVIDENCE"
+echo "  - $MD_EVIDENCE"
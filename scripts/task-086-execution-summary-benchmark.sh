@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+API_DIR="$ROOT_DIR/apps/api"
+EVIDENCE_DIR="${TASK_086_EVIDENCE_DIR:-$ROOT_DIR/docs/evidence/task-086}"
+TIMESTAMP="$(date -u +%Y%m%dT%H%M%SZ)"
+
+if [[ -n "${API_PYTHON_BIN:-}" ]]; then
+  PYTHON_BIN="$API_PYTHON_BIN"
+elif [[ -x "$API_DIR/.venv/bin/python" ]]; then
+  PYTHON_BIN="$API_DIR/.venv/bin/python"
+else
+  PYTHON_BIN="python3"
+fi
+
+mkdir -p "$EVIDENCE_DIR"
+
+JSON_EVIDENCE="$EVIDENCE_DIR/task-086-execution-summary-$TIMESTAMP.json"
+MD_EVIDENCE="$EVIDENCE_DIR/task-086-execution-summary-$TIMESTAMP.md"
+
+echo "[task-086] using python: $PYTHON_BIN"
+
+echo "[task-086] running run execution summary benchmark"
+PYTHONPATH="$API_DIR/src" "$PYTHON_BIN" "$API_DIR/scripts/task_086_execution_summary_benchmark.py" \
+  --output-json "$JSON_EVIDENCE" \
+  --output-md "$MD_EVIDENCE" \
+  --task-counts "${TASK_086_EXECUTION_SUMMARY_TASK_COUNTS:-500}"
+
+cp "$JSON_EVIDENCE" "$EVIDENCE_DIR/latest-execution-summary.json"
+cp "$MD_EVIDENCE" "$EVIDENCE_DIR/latest-execution-summary.md"
+
+echo "[task-086] evidence artifacts:"
+echo "  - $JSON_EVIDENCE"
+echo "  - $MD_EVIDENCE"